@@ -0,0 +1,55 @@
+"""Base para views assíncronas do DRF (deploy ASGI).
+
+O `APIView` do DRF só despacha handlers síncronos. `AsyncAPIView` replica o
+`dispatch` como corrotina: autenticação, permissões e throttling
+(`initial`, que acessam banco/cache) rodam via `sync_to_async`, e o handler
+``async def`` é aguardado no event loop, sem ocupar uma thread enquanto
+espera I/O.
+"""
+
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.utils.functional import classproperty
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """`APIView` com `dispatch` assíncrono.
+
+    Deve vir antes da view síncrona na herança para reaproveitar atributos
+    (permissões, throttles, helpers) e sobrescrever os handlers com
+    ``async def``.
+    """
+
+    @classproperty
+    def view_is_async(cls):
+        return True
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            # OPTIONS e 405 continuam síncronos no DRF
+            if asyncio.iscoroutine(response):
+                response = await response
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
@@ -0,0 +1,64 @@
+"""Autenticação OAuth2 da API: tokens assinados e cache dos opacos."""
+
+from drf_spectacular.contrib.django_oauth_toolkit import DjangoOAuthToolkitScheme
+from oauth2_provider.contrib.rest_framework import OAuth2Authentication
+
+from core.repositories import signed_tokens
+from core.repositories.token_cache import access_token_cache
+
+
+class CachedOAuth2Authentication(OAuth2Authentication):
+    """`OAuth2Authentication` que consulta `access_token_cache` antes do banco.
+
+    Só tokens no header ``Authorization: Bearer`` passam pelo cache; em miss
+    (ou token em query string/corpo) a validação completa do
+    django-oauth-toolkit roda e o resultado válido é guardado. Tokens
+    assinados (`core.repositories.signed_tokens`) são verificados no
+    processo, sem consultar a tabela de tokens.
+    """
+
+    def authenticate(self, request):
+        token = self._get_bearer_token(request)
+        if token is not None and signed_tokens.is_signed_token(token):
+            return self._authenticate_signed(request, token)
+        if token is not None:
+            cached = access_token_cache.get(token)
+            if cached is not None:
+                return cached
+
+        result = super().authenticate(request)
+        if result is not None:
+            access_token_cache.set(*result)
+        return result
+
+    @staticmethod
+    def _authenticate_signed(request, token):
+        access_token = signed_tokens.verify(token)
+        user = None
+        if access_token is not None:
+            user = access_token_cache.get_or_load_user(access_token.user_id)
+        if user is None:
+            request.oauth2_error = {
+                "error": "invalid_token",
+                "error_description": "The access token is invalid.",
+            }
+            return None
+        access_token.user = user
+        return user, access_token
+
+    @staticmethod
+    def _get_bearer_token(request):
+        """Token do header, com a mesma regra de parsing do oauthlib."""
+        header = request.META.get("HTTP_AUTHORIZATION", "").split()
+        if len(header) == 2 and header[0].lower() == "bearer":
+            return header[1]
+        return None
+
+
+class CachedOAuth2AuthenticationScheme(DjangoOAuthToolkitScheme):
+    """Mesmo esquema OpenAPI do OAuth2 do django-oauth-toolkit.
+
+    O drf-spectacular casa extensões pela classe exata, não por subclasse.
+    """
+
+    target_class = "core.api.authentication.CachedOAuth2Authentication"
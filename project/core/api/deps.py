@@ -5,22 +5,37 @@ Fornece funções simples para construir implementações concretas dos
 repositórios e casos de uso do domínio, centralizando a composição.
 """
 
+from typing import Optional
+
+from django.conf import settings
+
 from core.domain.data_access import UserRepository
 from core.domain.gateways import AuthGateway
 from core.domain.use_cases.user_use_cases import (
+    BulkCreateUsersUseCase,
     ChangeUserPasswordUseCase,
     CreateUserUseCase,
+    ExportUsersUseCase,
     GetUserByIdUseCase,
+    GetUsersByIdsUseCase,
     ListUsersUseCase,
     LoginUserUseCase,
 )
 from core.repositories.auth_gateway_impl import DjangoAuthGateway
+from core.repositories.cached_user_repository import CachedUserRepository
 from core.repositories.user_repository_impl import DjangoUserRepository
 
 
 def get_user_repository() -> UserRepository:
-    """Retorna implementação Django do `UserRepository`."""
-    return DjangoUserRepository()
+    """Retorna implementação Django do `UserRepository`.
+
+    Com ``USER_REPOSITORY_CACHE_ENABLED`` ativo, envolve o repositório no
+    `CachedUserRepository` (cache read-through por ID e email).
+    """
+    repository = DjangoUserRepository()
+    if getattr(settings, "USER_REPOSITORY_CACHE_ENABLED", False):
+        return CachedUserRepository(repository)
+    return repository
 
 
 def get_create_user_use_case() -> CreateUserUseCase:
@@ -55,3 +70,27 @@ def get_list_users_use_case() -> ListUsersUseCase:
 def get_get_user_by_id_use_case() -> GetUserByIdUseCase:
     """Constrói o caso de uso de busca de usuário por ID."""
     return GetUserByIdUseCase(user_repository=get_user_repository())
+
+
+def get_get_users_by_ids_use_case() -> GetUsersByIdsUseCase:
+    """Constrói o caso de uso de busca de usuários em lote por IDs."""
+    return GetUsersByIdsUseCase(user_repository=get_user_repository())
+
+
+def get_export_users_use_case() -> ExportUsersUseCase:
+    """Constrói o caso de uso de exportação de usuários em streaming."""
+    return ExportUsersUseCase(user_repository=get_user_repository())
+
+
+def get_bulk_create_users_use_case(
+    bulk_hashing_processes: Optional[int] = None,
+) -> BulkCreateUsersUseCase:
+    """Constrói o caso de uso de criação de usuários em massa.
+
+    `bulk_hashing_processes` sobrepõe ``PASSWORD_BULK_HASHING_PROCESSES``
+    (``1`` = hashing no próprio processo).
+    """
+    return BulkCreateUsersUseCase(
+        user_repository=get_user_repository(),
+        auth_gateway=DjangoAuthGateway(bulk_hashing_processes=bulk_hashing_processes),
+    )
@@ -0,0 +1,139 @@
+"""Renderers da API baseados em orjson.
+
+`ORJSONRenderer` substitui o `JSONRenderer` do DRF (``json`` da stdlib)
+como renderer padrão. UUID, datetime/date/time e subclasses de
+``dict``/``list``/``str``/``int`` (``ReturnDict``, ``ErrorDetail``,
+``ItemCount``) são serializados nativamente em Rust; os demais tipos caem no
+`JSONEncoder` do DRF, preservando a saída para Decimal, lazy strings etc.
+
+`NDJSONRenderer` e `CSVRenderer` servem exportações em streaming: além de
+`render`, expõem `stream`/`astream`, que codificam uma linha por vez para
+uso com `StreamingHttpResponse`.
+"""
+
+import csv
+
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from core.repositories.request_timing import timed
+
+_fallback_encoder = JSONEncoder()
+
+# "Z" no lugar de "+00:00", como o encoder do DRF; chaves não-str (os erros
+# de `ListField` são indexados por int) viram str, como no ``json``
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    """Fallback para tipos que o orjson não conhece."""
+    return _fallback_encoder.default(obj)
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Renderiza ``application/json`` com orjson (saída compacta, UTF-8)."""
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Serializa `data`; ``indent`` no Accept ativa indentação de 2."""
+        if data is None:
+            return b""
+
+        options = ORJSON_OPTIONS
+        if accepted_media_type and "indent=" in accepted_media_type:
+            options |= orjson.OPT_INDENT_2
+        with timed("serialize"):
+            return orjson.dumps(data, default=_default, option=options)
+
+
+class _Echo:
+    """Pseudo-buffer para `csv.writer`: devolve a linha em vez de guardá-la."""
+
+    def write(self, value):
+        return value
+
+
+class StreamingRenderer(BaseRenderer):
+    """Base de renderers linha a linha (um dict por registro).
+
+    Subclasses implementam `render_header` e `render_row`; `render` junta
+    tudo em memória e fica para respostas pequenas (ex.: testes).
+    """
+
+    def render_header(self, fields) -> bytes:
+        """Bytes emitidos antes da primeira linha."""
+        return b""
+
+    def render_row(self, row: dict) -> bytes:
+        """Codifica um registro."""
+        raise NotImplementedError
+
+    def stream(self, rows, fields):
+        """Gera os bytes de cabeçalho e de cada registro de `rows`."""
+        header = self.render_header(fields)
+        if header:
+            yield header
+        for row in rows:
+            yield self.render_row(row)
+
+    async def astream(self, rows, fields):
+        """Versão assíncrona de `stream` (`rows` é um iterador assíncrono)."""
+        header = self.render_header(fields)
+        if header:
+            yield header
+        async for row in rows:
+            yield self.render_row(row)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        rows = data if isinstance(data, list) else [data]
+        fields = list(rows[0]) if rows else []
+        return b"".join(self.stream(rows, fields))
+
+
+class NDJSONRenderer(StreamingRenderer):
+    """Um objeto JSON por linha (``application/x-ndjson``)."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None
+
+    def render_row(self, row: dict) -> bytes:
+        return orjson.dumps(
+            row, default=_default, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+        )
+
+
+# Prefixos que planilhas interpretam como fórmula (CSV injection)
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class CSVRenderer(StreamingRenderer):
+    """CSV com cabeçalho; células que parecem fórmula ganham prefixo ``'``."""
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def __init__(self):
+        self._writer = csv.writer(_Echo())
+        self._fields = ()
+
+    def render_header(self, fields) -> bytes:
+        self._fields = tuple(fields)
+        return self._writer.writerow(self._fields).encode("utf-8")
+
+    def render_row(self, row: dict) -> bytes:
+        values = [self._escape(row.get(field)) for field in self._fields]
+        return self._writer.writerow(values).encode("utf-8")
+
+    @staticmethod
+    def _escape(value):
+        if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+            return "'" + value
+        return value
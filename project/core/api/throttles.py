@@ -1,11 +1,36 @@
 """Throttle classes para rate limiting da API."""
 
+import math
+import threading
 import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
 
+from django.conf import settings
 from django.core.cache import cache
 from rest_framework.throttling import BaseThrottle
 
 
+@dataclass
+class _LocalBucket:
+    """Estado em processo de uma chave de throttle (um por worker)."""
+
+    window: int
+    previous: int
+    current: int
+    tokens: int = 0
+    pending: int = 0
+    synced_at: float = 0.0
+
+
+# Compartilhado entre instâncias: o DRF cria um throttle por requisição.
+# LRU limitado a LOCAL_BUCKETS_MAX_KEYS chaves: a menos recente sai na inserção
+_local_buckets: "OrderedDict[str, _LocalBucket]" = OrderedDict()
+_local_lock = threading.Lock()
+LOCAL_BUCKETS_MAX_KEYS = 10000
+
+
 class RateLimitThrottle(BaseThrottle):
     """Throttle base para rate limiting usando cache do Django."""
 
@@ -13,6 +38,13 @@ class RateLimitThrottle(BaseThrottle):
     scope = "user"
     num_requests = 100
     duration = 3600  # 1 hora em segundos
+    # None = usa settings.RATE_LIMIT_LOCAL_BATCH / RATE_LIMIT_LOCAL_SYNC_INTERVAL
+    local_batch: Optional[int] = None
+    local_sync_interval: Optional[float] = None
+
+    def timer(self) -> float:
+        """Relógio das janelas (sobrescrito nos testes)."""
+        return time.time()
 
     def get_cache_key(self, request, view):
         """Gera chave de cache baseada no IP ou usuário."""
@@ -23,30 +55,197 @@ class RateLimitThrottle(BaseThrottle):
         return self.cache_format % {"scope": self.scope, "ident": ident}
 
     def allow_request(self, request, view):
-        """Verifica se a requisição deve ser permitida."""
+        """Verifica se a requisição deve ser permitida.
+
+        Usa janela deslizante aproximada com dois contadores de janela fixa
+        (atual e anterior): a contagem da janela anterior é ponderada pela
+        fração que ainda se sobrepõe à janela deslizante. O incremento é
+        atômico (`cache.incr`), então workers concorrentes nunca perdem
+        atualizações, e cada chave guarda apenas um inteiro.
+
+        Com ``local_batch > 0`` há um primeiro nível em processo: após cada
+        sincronização o worker recebe até ``local_batch`` fichas para
+        decidir sem acessar o cache, e o delta acumulado é enviado num único
+        ``incr`` na próxima sincronização. Fichas só são concedidas enquanto
+        a folga conhecida for maior que o lote, então o limite global pode
+        ser excedido em no máximo ``local_batch`` por worker.
+        """
         if request.user and request.user.is_superuser:
             return True
 
         key = self.get_cache_key(request, view)
-        history = cache.get(key, [])
+        now = self.timer()
+        window = int(now // self.duration)
+        elapsed = now - window * self.duration
+        weight = (self.duration - elapsed) / self.duration
 
-        # Remove requisições antigas
-        now = time.time()
-        while history and history[-1] <= now - self.duration:
-            history.pop()
+        batch = self._get_local_batch()
+        pending = 0
+        if batch:
+            with _local_lock:
+                bucket = _local_buckets.get(key)
+                if (
+                    bucket is not None
+                    and bucket.window == window
+                    and now - bucket.synced_at < self._get_local_sync_interval()
+                ):
+                    local = self._allow_locally(bucket, weight)
+                    if local is not None:
+                        _local_buckets.move_to_end(key)
+                        previous = bucket.previous
+                        current = bucket.current + bucket.pending
+                        return self._finish(
+                            request, local, previous, current, weight, elapsed
+                        )
+                # Delta pendente é enviado junto com a requisição atual
+                pending = self._take_pending(key, window)
 
-        # Verifica limite
-        if len(history) >= self.num_requests:
-            return False
+        current_key = "%s:%d" % (key, window)
+        previous_key = "%s:%d" % (key, window - 1)
+        current = self._increment(current_key, pending + 1)
+        previous = cache.get(previous_key, 0)
+
+        allowed = previous * weight + current <= self.num_requests
+        if not allowed:
+            # Requisições rejeitadas não consomem cota
+            current -= 1
+            try:
+                cache.decr(current_key)
+            except ValueError:
+                pass
+
+        if batch:
+            headroom = math.floor(self.num_requests - (previous * weight + current))
+            bucket = _LocalBucket(
+                window=window,
+                previous=previous,
+                current=current,
+                tokens=min(batch, max(0, headroom - batch)),
+                synced_at=now,
+            )
+            with _local_lock:
+                evicted = self._store_bucket(key, bucket)
+            # Fora do lock: deltas de chaves despejadas não podem se perder
+            for evicted_key, delta in evicted:
+                self._increment(evicted_key, delta)
+        return self._finish(request, allowed, previous, current, weight, elapsed)
+
+    @staticmethod
+    def _store_bucket(key, bucket):
+        """Guarda o bucket como o mais recente e despeja os excedentes do LRU.
+
+        Devolve ``(chave da janela, delta)`` dos buckets despejados com
+        pendências ainda relevantes. Chamado com `_local_lock`.
+        """
+        _local_buckets[key] = bucket
+        _local_buckets.move_to_end(key)
+        evicted = []
+        while len(_local_buckets) > LOCAL_BUCKETS_MAX_KEYS:
+            old_key, old = _local_buckets.popitem(last=False)
+            # Janelas anteriores à "anterior" já não entram em nenhuma conta
+            if old.pending and old.window >= bucket.window - 1:
+                evicted.append(("%s:%d" % (old_key, old.window), old.pending))
+        return evicted
 
-        # Adiciona requisição atual
-        history.insert(0, now)
-        cache.set(key, history, self.duration)
+    def _allow_locally(self, bucket, weight):
+        """Decide sem acessar o cache, ou retorna None se precisar sincronizar.
+
+        A estimativa local é um limite inferior da global (os contadores só
+        crescem dentro da janela), então negar localmente é sempre seguro.
+        """
+        estimate = bucket.previous * weight + bucket.current + bucket.pending
+        if estimate + 1 > self.num_requests:
+            return False
+        if bucket.tokens <= 0:
+            return None
+        bucket.tokens -= 1
+        bucket.pending += 1
         return True
 
+    def _take_pending(self, key, window):
+        """Remove o bucket local e devolve o delta a enviar na janela atual.
+
+        Deltas de uma janela que já terminou são enviados à chave dela, pois
+        ainda contam como "janela anterior". Chamado com `_local_lock`.
+        """
+        bucket = _local_buckets.pop(key, None)
+        if bucket is None or not bucket.pending:
+            return 0
+        if bucket.window == window:
+            return bucket.pending
+        if bucket.window == window - 1:
+            self._increment("%s:%d" % (key, bucket.window), bucket.pending)
+        return 0
+
+    def _finish(self, request, allowed, previous, current, weight, elapsed):
+        self._wait = (
+            None if allowed else self._time_to_next_slot(previous, current, elapsed)
+        )
+        self._record_rate_limit(request, previous * weight + current, elapsed)
+        return allowed
+
+    def _get_local_batch(self):
+        if self.local_batch is not None:
+            return self.local_batch
+        return getattr(settings, "RATE_LIMIT_LOCAL_BATCH", 0)
+
+    def _get_local_sync_interval(self):
+        if self.local_sync_interval is not None:
+            return self.local_sync_interval
+        return getattr(settings, "RATE_LIMIT_LOCAL_SYNC_INTERVAL", 1.0)
+
+    def _increment(self, key, delta=1):
+        """Incrementa o contador da janela de forma atômica."""
+        # A chave vive duas janelas para servir de "anterior" na seguinte
+        timeout = self.duration * 2
+        try:
+            return cache.incr(key, delta)
+        except ValueError:
+            if cache.add(key, delta, timeout):
+                return delta
+            # Outro worker criou a chave entre o incr e o add
+            return cache.incr(key, delta)
+
+    def _time_to_next_slot(self, previous, current, elapsed):
+        """Calcula em quantos segundos a próxima requisição será aceita.
+
+        A estimativa ``previous * weight + current`` só cai conforme o peso
+        da janela anterior diminui; se a janela atual sozinha já esgota a
+        cota, é preciso esperar a próxima janela, onde ela passa a ser a
+        "anterior".
+        """
+        budget = self.num_requests - 1
+        if budget < 0:
+            return float(self.duration)
+        if current <= budget:
+            weight_needed = (budget - current) / previous if previous else 1.0
+            return max(0.0, self.duration * (1 - weight_needed) - elapsed)
+        weight_needed = budget / current
+        return (self.duration - elapsed) + self.duration * (1 - weight_needed)
+
+    def _record_rate_limit(self, request, estimate, elapsed):
+        """Anexa o estado da cota à requisição para os headers RateLimit-*.
+
+        Usa apenas valores já lidos do cache. Com vários throttles na mesma
+        view, prevalece o de menor cota restante.
+        """
+        remaining = max(0, math.floor(self.num_requests - estimate))
+        reset = math.ceil(self._wait or (self.duration - elapsed))
+        django_request = getattr(request, "_request", request)
+        current = getattr(django_request, "rate_limit", None)
+        if current is None or remaining < current["remaining"]:
+            django_request.rate_limit = {
+                "limit": self.num_requests,
+                "remaining": remaining,
+                "reset": reset,
+            }
+
     def wait(self):
-        """Retorna tempo de espera em segundos."""
-        return None
+        """Retorna em segundos quanto falta para a próxima vaga.
+
+        O DRF usa o valor para preencher o header ``Retry-After``.
+        """
+        return getattr(self, "_wait", None)
 
 
 class LoginRateThrottle(RateLimitThrottle):
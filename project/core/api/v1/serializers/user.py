@@ -1,19 +1,56 @@
 """Serializers para as operações de usuário na API v1."""
 
+from core.domain.use_cases.user_import import (
+    bulk_failure_to_dict,
+    bulk_row_to_request,
+)
 from core.domain.use_cases.user_use_cases import (
+    BulkCreateUsersRequest,
+    BulkCreateUsersResponse,
     ChangeUserPasswordRequest,
     ChangeUserPasswordResponse,
     CreateUserRequest,
     CreateUserResponse,
+    GetUsersByIdsRequest,
+    GetUsersByIdsResponse,
     ListUsersResponse,
     LoginUserRequest,
     LoginUserResponse,
 )
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
 User = get_user_model()
 
+# Colunas (e ordem) das exportações; as mesmas chaves de `user_to_dict`
+USER_FIELDS = (
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+)
+
+
+def user_to_dict(user) -> dict:
+    """Representação de um usuário como dict simples.
+
+    Usada diretamente nas listagens para não instanciar um serializer por
+    linha: o envelope monta os itens com uma list comprehension.
+    """
+    return {
+        "id": user.id,
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "is_active": user.is_active,
+        "is_staff": user.is_staff,
+        "is_superuser": user.is_superuser,
+    }
+
 
 class UserReadSerializer(serializers.Serializer):
     """Representação somente leitura de um usuário (DTO)."""
@@ -28,15 +65,7 @@ class UserReadSerializer(serializers.Serializer):
 
     def to_representation(self, instance: CreateUserResponse):
         """Converte instância para representação de dicionário."""
-        return {
-            "id": instance.id,
-            "email": instance.email,
-            "first_name": instance.first_name,
-            "last_name": instance.last_name,
-            "is_active": instance.is_active,
-            "is_staff": instance.is_staff,
-            "is_superuser": instance.is_superuser,
-        }
+        return user_to_dict(instance)
 
 
 class UserSerializer(serializers.Serializer):
@@ -52,32 +81,28 @@ class UserSerializer(serializers.Serializer):
 
     def to_representation(self, instance: CreateUserResponse):
         """Converte instância para representação de dicionário."""
-        return {
-            "id": instance.id,
-            "email": instance.email,
-            "first_name": instance.first_name,
-            "last_name": instance.last_name,
-            "is_active": instance.is_active,
-            "is_staff": instance.is_staff,
-            "is_superuser": instance.is_superuser,
-        }
+        return user_to_dict(instance)
 
 
 class UserListResponseSerializer(serializers.Serializer):
     """Envelope para resposta de listagem paginada de usuários."""
 
     users = UserSerializer(many=True)
-    total_items = serializers.IntegerField()
+    total_items = serializers.IntegerField(allow_null=True)
     offset = serializers.IntegerField()
     limit = serializers.IntegerField()
+    next_cursor = serializers.CharField(allow_null=True)
+    total_items_exact = serializers.BooleanField()
 
     def to_representation(self, instance: ListUsersResponse):
         """Converte instância para representação de dicionário."""
         return {
-            "items": [UserSerializer(user).data for user in instance.users],
+            "items": [user_to_dict(user) for user in instance.users],
             "total_items": instance.total_items,
             "offset": instance.offset,
             "limit": instance.limit,
+            "next_cursor": instance.next_cursor,
+            "total_items_exact": instance.total_items_exact,
         }
 
 
@@ -92,6 +117,103 @@ class ListUsersRequestSerializer(serializers.Serializer):
         max_length=100,
         help_text="Query de busca (máximo 100 caracteres)",
     )
+    cursor = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        max_length=512,
+        help_text=(
+            "Cursor opaco para paginação keyset. Envie vazio para a primeira "
+            "página e depois o `next_cursor` recebido; `offset` é ignorado."
+        ),
+    )
+
+
+class UsersExportRequestSerializer(serializers.Serializer):
+    """Filtro da exportação de usuários (o formato vem de ``?format=``)."""
+
+    search_query = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        max_length=100,
+        help_text="Query de busca (máximo 100 caracteres)",
+    )
+
+
+class UsersBulkImportRequestSerializer(serializers.Serializer):
+    """Entrada da importação em massa pela API (lista de linhas)."""
+
+    users = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        help_text=(
+            "Usuários a criar (máximo USER_BULK_IMPORT_API_MAX_ROWS por "
+            "requisição; para volumes maiores use o comando `import_users`)"
+        ),
+    )
+
+    def validate_users(self, value):
+        """Limita as linhas ao que cabe no timeout da requisição."""
+        max_rows = settings.USER_BULK_IMPORT_API_MAX_ROWS
+        if len(value) > max_rows:
+            raise serializers.ValidationError(
+                f"Ensure this field has no more than {max_rows} elements."
+            )
+        return value
+
+    def to_internal_value(self, data):
+        """Converte dados de entrada para DTO."""
+        validated = super().to_internal_value(data)
+        return BulkCreateUsersRequest(
+            users=[bulk_row_to_request(row) for row in validated["users"]]
+        )
+
+
+class UsersBulkImportResponseSerializer(serializers.Serializer):
+    """Resumo da importação: totais e falhas por linha."""
+
+    processed = serializers.IntegerField()
+    created = serializers.IntegerField()
+    failures = serializers.ListField(child=serializers.DictField())
+
+    def to_representation(self, instance: BulkCreateUsersResponse):
+        """Converte instância para representação de dicionário."""
+        return {
+            "processed": instance.processed,
+            "created": instance.created,
+            "failures": [bulk_failure_to_dict(f) for f in instance.failures],
+        }
+
+
+class UsersBatchGetRequestSerializer(serializers.Serializer):
+    """Entrada para busca de usuários em lote por IDs."""
+
+    ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=1000,
+        help_text="IDs dos usuários (máximo 1000 por requisição)",
+    )
+
+    def to_internal_value(self, data):
+        """Converte dados de entrada para DTO."""
+        validated = super().to_internal_value(data)
+        return GetUsersByIdsRequest(
+            user_ids=[str(user_id) for user_id in validated["ids"]]
+        )
+
+
+class UsersBatchGetResponseSerializer(serializers.Serializer):
+    """Resposta da busca em lote: usuários encontrados e IDs ausentes."""
+
+    items = UserSerializer(many=True)
+    not_found = serializers.ListField(child=serializers.CharField())
+
+    def to_representation(self, instance: GetUsersByIdsResponse):
+        """Converte instância para representação de dicionário."""
+        return {
+            "items": [user_to_dict(user) for user in instance.users],
+            "not_found": instance.not_found,
+        }
 
 
 class UserAlterPasswordSerializer(serializers.Serializer):
@@ -1,9 +1,33 @@
-from core.api.v1.views import auth, user
+from core.api.v1.views import auth, metrics, user
+from django.conf import settings
 from django.urls import path
 
+# Deploy ASGI: views assíncronas nos caminhos de leitura e no login
+if getattr(settings, "API_ASYNC_VIEWS", False):
+    LoginView = auth.AsyncLoginAPIView
+    UserListView = user.AsyncUserListAPIView
+    UserExportView = user.AsyncUserExportAPIView
+    UserRetrieveView = user.AsyncUserRetrieveAPIView
+else:
+    LoginView = auth.LoginAPIView
+    UserListView = user.UserListAPIView
+    UserExportView = user.UserExportAPIView
+    UserRetrieveView = user.UserRetrieveAPIView
+
 urlpatterns = [
     path("users/", user.UserCreateAPIView.as_view(), name="create-user"),
-    path("users/list/", user.UserListAPIView.as_view(), name="user-list"),
+    path("users/list/", UserListView.as_view(), name="user-list"),
+    path("users/export/", UserExportView.as_view(), name="user-export"),
+    path(
+        "users/bulk-import/",
+        user.UserBulkImportAPIView.as_view(),
+        name="user-bulk-import",
+    ),
+    path(
+        "users/batch-get/",
+        user.UserBatchGetAPIView.as_view(),
+        name="user-batch-get",
+    ),
     path(
         "users/alter_password/<uuid:pk>/",
         user.UserAlterPasswordAPIView.as_view(),
@@ -11,8 +35,9 @@ urlpatterns = [
     ),
     path(
         "users/<uuid:pk>/",
-        user.UserRetrieveAPIView.as_view(),
+        UserRetrieveView.as_view(),
         name="retrieve-user",
     ),
-    path("login/", auth.LoginAPIView.as_view(), name="login"),
+    path("login/", LoginView.as_view(), name="login"),
+    path("metrics/", metrics.MetricsAPIView.as_view(), name="metrics"),
 ]
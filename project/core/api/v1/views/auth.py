@@ -2,10 +2,11 @@
 
 import logging
 
+from core.api.async_views import AsyncAPIView
 from core.api.deps import get_login_user_use_case
 from core.api.throttles import LoginRateThrottle
 from core.api.v1.serializers.user import LoginRequestSerializer, LoginResponseSerializer
-from core.domain.exceptions import AuthenticationError
+from core.domain.exceptions import AuthenticationError, CapacityExceededError
 from core.domain.use_cases.user_use_cases import (
     LoginUserRequest,  # Corrigido o caminho de importação
 )
@@ -28,43 +29,67 @@ class LoginAPIView(APIView):
 
     def post(self, request, *args, **kwargs):
         """Processa requisição de login."""
+        login_request = self._get_login_request(request)
+        login_user_use_case = get_login_user_use_case()
+        try:
+            logger.info("Tentativa de login para email: %s", login_request.email)
+            login_response = login_user_use_case.execute(login_request)
+        except Exception as exc:
+            return self._error_response(exc, login_request.email)
+        return self._success_response(login_response, login_request.email)
+
+    @staticmethod
+    def _get_login_request(request) -> LoginUserRequest:
         serializer = LoginRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        login_request = LoginUserRequest(
+        return LoginUserRequest(
             email=serializer.validated_data["email"],
             password=serializer.validated_data["password"],
         )
 
-        login_user_use_case = get_login_user_use_case()
-        email = login_request.email
-        try:
-            logger.info("Tentativa de login para email: %s", email)
-            login_response = login_user_use_case.execute(login_request)
-            response_serializer = LoginResponseSerializer(instance=login_response)
-            logger.info("Login bem-sucedido para email: %s", email)
-            return Response(response_serializer.data, status=status.HTTP_200_OK)
-        except (ValueError, AuthenticationError):
+    @staticmethod
+    def _success_response(login_response, email: str) -> Response:
+        response_serializer = LoginResponseSerializer(instance=login_response)
+        logger.info("Login bem-sucedido para email: %s", email)
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+    @staticmethod
+    def _error_response(exc: Exception, email: str) -> Response:
+        """Converte falhas do caso de uso em respostas HTTP."""
+        if isinstance(exc, (ValueError, AuthenticationError)):
             logger.warning("Falha no login para email: %s", email)
             return Response(
                 {"detail": "Invalid credentials"}, status=status.HTTP_400_BAD_REQUEST
             )
-        except Throttled:
-            raise  # Re-raise para DRF tratar
-        except AuthenticationFailed as e:
-            logger.warning("Falha de autenticação para email: %s: %s", email, str(e))
+        if isinstance(exc, (Throttled, CapacityExceededError)):
+            raise exc  # Re-raise para o exception handler tratar
+        if isinstance(exc, AuthenticationFailed):
+            logger.warning("Falha de autenticação para email: %s: %s", email, str(exc))
             return Response(
                 {"detail": "Authentication failed"}, status=status.HTTP_401_UNAUTHORIZED
             )
-        except PermissionDenied as e:
-            logger.warning("Permissão negada para email: %s: %s", email, str(e))
+        if isinstance(exc, PermissionDenied):
+            logger.warning("Permissão negada para email: %s: %s", email, str(exc))
             return Response(
                 {"detail": "Permission denied"}, status=status.HTTP_403_FORBIDDEN
             )
-        except Exception:
-            logger.error(
-                "Erro inesperado no login para email: %s", email, exc_info=True
-            )
-            return Response(
-                {"detail": "Erro interno do servidor"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+        logger.error("Erro inesperado no login para email: %s", email, exc_info=exc)
+        return Response(
+            {"detail": "Erro interno do servidor"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+
+class AsyncLoginAPIView(AsyncAPIView, LoginAPIView):
+    """Versão assíncrona do login, usada no deploy ASGI."""
+
+    async def post(self, request, *args, **kwargs):
+        """Processa requisição de login sem bloquear o event loop."""
+        login_request = self._get_login_request(request)
+        login_user_use_case = get_login_user_use_case()
+        try:
+            logger.info("Tentativa de login para email: %s", login_request.email)
+            login_response = await login_user_use_case.aexecute(login_request)
+        except Exception as exc:
+            return self._error_response(exc, login_request.email)
+        return self._success_response(login_response, login_request.email)
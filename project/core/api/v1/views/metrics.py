@@ -0,0 +1,28 @@
+"""Métricas de runtime do processo para API v1 (apenas admins)."""
+
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.repositories.cached_user_repository import CachedUserRepository
+from core.repositories.hashing_pool import get_hashing_pool
+
+
+class MetricsAPIView(APIView):
+    """Expõe os contadores internos do worker que atendeu a requisição.
+
+    Os valores são por processo: com vários workers, cada chamada mostra os
+    de um deles.
+    """
+
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request, *args, **kwargs):
+        return Response(
+            {
+                "user_repository_cache": CachedUserRepository.get_stats(),
+                "password_hashing_pool": get_hashing_pool().stats(),
+            },
+            status=status.HTTP_200_OK,
+        )
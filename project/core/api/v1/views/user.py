@@ -1,27 +1,45 @@
 import logging
 
+from core.api.async_views import AsyncAPIView
+from core.api.renderers import CSVRenderer, NDJSONRenderer, ORJSONRenderer
 from core.api.deps import (
+    get_bulk_create_users_use_case,
     get_change_user_password_use_case,
     get_create_user_use_case,
+    get_export_users_use_case,
     get_get_user_by_id_use_case,
+    get_get_users_by_ids_use_case,
     get_list_users_use_case,
 )
 from core.api.throttles import UserCreationRateThrottle
 from core.domain.exceptions import AuthenticationError, EntityNotFoundException
 from django.contrib.auth import get_user_model
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.http import StreamingHttpResponse
 from rest_framework import generics, status
 from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
 
-from core.domain.use_cases.user_use_cases import GetUserByIdRequest, ListUsersRequest
+from core.domain.use_cases.user_use_cases import (
+    ExportUsersRequest,
+    GetUserByIdRequest,
+    ListUsersRequest,
+)
 
 from ..serializers.user import (
+    USER_FIELDS,
     ListUsersRequestSerializer,
     UserAlterPasswordSerializer,
     UserCreateRequestSerializer,
     UserListResponseSerializer,
     UserReadSerializer,
+    UsersBatchGetRequestSerializer,
+    UsersBulkImportRequestSerializer,
+    UsersBulkImportResponseSerializer,
+    UsersBatchGetResponseSerializer,
+    UsersExportRequestSerializer,
+    user_to_dict,
 )
 
 logger = logging.getLogger(__name__)
@@ -50,23 +68,109 @@ class UserListAPIView(generics.ListAPIView):
 
     def list(self, request, *args, **kwargs):
         logger.info("Listando usuários (admin)")
+        list_users_request = self._get_list_request(request)
+
+        list_users_use_case = get_list_users_use_case()
+        list_users_response = list_users_use_case.execute(list_users_request)
+        return self._list_response(list_users_response)
+
+    @staticmethod
+    def _get_list_request(request) -> ListUsersRequest:
         request_serializer = ListUsersRequestSerializer(data=request.query_params)
         request_serializer.is_valid(raise_exception=True)
-        list_users_request = ListUsersRequest(
+        return ListUsersRequest(
             offset=request_serializer.validated_data.get("offset", 0),
             limit=request_serializer.validated_data.get("limit", 10),
             search_query=request_serializer.validated_data.get("search_query", None),
+            cursor=request_serializer.validated_data.get("cursor", None),
         )
 
-        list_users_use_case = get_list_users_use_case()
-        list_users_response = list_users_use_case.execute(list_users_request)
-
+    @staticmethod
+    def _list_response(list_users_response) -> Response:
         response_serializer = UserListResponseSerializer(instance=list_users_response)
         user_count = len(list_users_response.users)
         logger.info("Listagem de usuários (admin) retornou %d usuários", user_count)
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
 
+class AsyncUserListAPIView(AsyncAPIView, UserListAPIView):
+    """Versão assíncrona da listagem de usuários, usada no deploy ASGI."""
+
+    async def get(self, request, *args, **kwargs):
+        logger.info("Listando usuários (admin)")
+        list_users_request = self._get_list_request(request)
+
+        list_users_use_case = get_list_users_use_case()
+        list_users_response = await list_users_use_case.aexecute(list_users_request)
+        return self._list_response(list_users_response)
+
+
+class UserExportAPIView(generics.GenericAPIView):
+    """Exporta todos os usuários do filtro em streaming (apenas admins).
+
+    ``?format=ndjson`` (padrão) ou ``?format=csv``, também negociável pelo
+    header Accept. As linhas saem de um cursor do lado do servidor em blocos
+    de ``USER_EXPORT_CHUNK_SIZE``, com memória constante.
+    """
+
+    serializer_class = UsersExportRequestSerializer
+    permission_classes = (IsAdminUser,)
+    renderer_classes = (NDJSONRenderer, CSVRenderer)
+
+    def get(self, request, *args, **kwargs):
+        export_request = self._get_export_request(request)
+        users = get_export_users_use_case().execute(export_request)
+        rows = (user_to_dict(user) for user in users)
+        return self._streaming_response(
+            request.accepted_renderer.stream(rows, USER_FIELDS)
+        )
+
+    def handle_exception(self, exc):
+        # Erros (403, 400, formato inválido) continuam em JSON
+        self.request.accepted_renderer = ORJSONRenderer()
+        self.request.accepted_media_type = ORJSONRenderer.media_type
+        return super().handle_exception(exc)
+
+    def _get_export_request(self, request) -> ExportUsersRequest:
+        request_serializer = self.get_serializer(data=request.query_params)
+        request_serializer.is_valid(raise_exception=True)
+        search_query = request_serializer.validated_data.get("search_query")
+        logger.info(
+            "Exportando usuários em %s (admin)", request.accepted_renderer.format
+        )
+        return ExportUsersRequest(
+            search_query=search_query,
+            chunk_size=settings.USER_EXPORT_CHUNK_SIZE,
+        )
+
+    def _streaming_response(self, content) -> StreamingHttpResponse:
+        renderer = self.request.accepted_renderer
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type = f"{content_type}; charset={renderer.charset}"
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response["Content-Disposition"] = (
+            f'attachment; filename="users.{renderer.format}"'
+        )
+        return response
+
+
+class AsyncUserExportAPIView(AsyncAPIView, UserExportAPIView):
+    """Versão assíncrona da exportação, usada no deploy ASGI.
+
+    Sob ASGI, `StreamingHttpResponse` com iterador síncrono é consumido
+    inteiro antes do envio; aqui o conteúdo é um iterador assíncrono.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        export_request = self._get_export_request(request)
+        users = get_export_users_use_case().aexecute(export_request)
+        rows = (user_to_dict(user) async for user in users)
+        return self._streaming_response(
+            request.accepted_renderer.astream(rows, USER_FIELDS)
+        )
+
+
 class UserAlterPasswordAPIView(generics.UpdateAPIView):
     """Atualiza a senha de um usuário. Requer privilégio de admin."""
 
@@ -133,6 +237,66 @@ class UserRetrieveAPIView(generics.RetrieveAPIView):
             )
 
 
+class AsyncUserRetrieveAPIView(AsyncAPIView, UserRetrieveAPIView):
+    """Versão assíncrona da busca por ID, usada no deploy ASGI."""
+
+    async def get(self, request, *args, **kwargs):
+        user_id = str(kwargs.get("pk", ""))
+        safe_user_id = _sanitize_for_log(user_id)
+        logger.info("Recuperando usuário com ID: %s (admin)", safe_user_id)
+
+        get_user_use_case = get_get_user_by_id_use_case()
+        user_response = await get_user_use_case.aexecute(
+            GetUserByIdRequest(user_id=user_id)
+        )
+        response_serializer = UserReadSerializer(instance=user_response)
+        logger.info("Usuário com ID: %s recuperado com sucesso (admin)", safe_user_id)
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+
+class UserBatchGetAPIView(generics.GenericAPIView):
+    """Recupera vários usuários por ID em uma única consulta (apenas admins)."""
+
+    serializer_class = UsersBatchGetRequestSerializer
+    permission_classes = (IsAdminUser,)
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        batch_request = serializer.validated_data
+        logger.info(
+            "Recuperando %d usuários em lote (admin)", len(batch_request.user_ids)
+        )
+
+        get_users_use_case = get_get_users_by_ids_use_case()
+        batch_response = get_users_use_case.execute(batch_request)
+
+        response_serializer = UsersBatchGetResponseSerializer(instance=batch_response)
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+
+class UserBulkImportAPIView(generics.GenericAPIView):
+    """Cria usuários em massa e reporta falhas por linha (apenas admins)."""
+
+    serializer_class = UsersBulkImportRequestSerializer
+    permission_classes = (IsAdminUser,)
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        bulk_request = serializer.validated_data
+        bulk_request.batch_size = settings.USER_BULK_IMPORT_BATCH_SIZE
+        logger.info("Importando %d usuários (admin)", len(bulk_request.users))
+
+        # Hashing no próprio worker: um pool de processos por worker web
+        # disputaria CPU com as demais requisições (o comando usa o pool)
+        bulk_create_use_case = get_bulk_create_users_use_case(bulk_hashing_processes=1)
+        bulk_response = bulk_create_use_case.execute(bulk_request)
+
+        response_serializer = UsersBulkImportResponseSerializer(instance=bulk_response)
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+
 class UserCreateAPIView(generics.CreateAPIView):
     """Cria um novo usuário (público)."""
 
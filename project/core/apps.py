@@ -14,3 +14,12 @@ class CoreConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
+
+    def ready(self):
+        """Conecta sinais, agenda o aquecimento de caches e mede queries."""
+        from core import signals  # noqa: F401
+        from core.repositories.application_cache import schedule_warm_up
+        from core.repositories.request_timing import install_db_timing
+
+        schedule_warm_up()
+        install_db_timing()
@@ -0,0 +1,58 @@
+"""Roteamento de leituras para a réplica de banco de dados.
+
+Leituras dos apps em ``DATABASE_REPLICA_APPS`` (por padrão apenas ``core``,
+ou seja, os caminhos de leitura do `DjangoUserRepository`) vão para o
+alias ``replica``; escritas sempre vão para ``default``. Tokens OAuth2 e
+demais apps continuam no primário para não sofrer com atraso de
+replicação logo após o login.
+
+Depois de uma escrita, as leituras do mesmo escopo (uma requisição, via
+`DatabaseRoutingMiddleware`) ficam fixadas no primário, garantindo que o
+cliente leia o que acabou de gravar.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from django.conf import settings
+
+REPLICA_ALIAS = "replica"
+
+_pinned_to_primary: ContextVar[bool] = ContextVar("pinned_to_primary", default=False)
+
+
+def is_pinned_to_primary() -> bool:
+    """Indica se o escopo atual já escreveu no primário."""
+    return _pinned_to_primary.get()
+
+
+@contextmanager
+def primary_pin_scope() -> Iterator[None]:
+    """Abre um escopo sem fixação; escritas dentro dele fixam as leituras."""
+    token = _pinned_to_primary.set(False)
+    try:
+        yield
+    finally:
+        _pinned_to_primary.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """Router: leituras na réplica, escritas no primário, sticky após escrita."""
+
+    def db_for_read(self, model, **hints):
+        if REPLICA_ALIAS not in settings.DATABASES or _pinned_to_primary.get():
+            return None
+        if model._meta.app_label not in getattr(
+            settings, "DATABASE_REPLICA_APPS", ("core",)
+        ):
+            return None
+        return REPLICA_ALIAS
+
+    def db_for_write(self, model, **hints):
+        _pinned_to_primary.set(True)
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Réplica e primário guardam os mesmos dados
+        return True
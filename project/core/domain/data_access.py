@@ -5,7 +5,17 @@ implementados na camada de infraestrutura.
 """
 
 from abc import ABC, abstractmethod
-from typing import Generic, List, Optional, TypeVar
+from typing import (
+    AsyncIterator,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
 from dataclasses import dataclass
 
 from core.domain.entities.user import User
@@ -13,6 +23,39 @@ from core.domain.entities.user import User
 T = TypeVar("T")
 
 
+class ItemCount(int):
+    """Total de itens de uma listagem, com indicação de exatidão.
+
+    Subclasse de `int` para continuar compatível com quem trata o total como
+    número. `exact=False` indica um valor limitado (cap), estimado ou vindo
+    de cache.
+    """
+
+    exact: bool
+
+    def __new__(cls, value: int, exact: bool = True) -> "ItemCount":
+        obj = super().__new__(cls, value)
+        obj.exact = exact
+        return obj
+
+
+@dataclass
+class BulkCreateFailure:
+    """Linha rejeitada em uma criação em lote (posição na entrada + erros)."""
+
+    index: int
+    email: str
+    errors: Dict[str, List[str]]
+
+
+@dataclass
+class BulkCreateResult:
+    """Resultado de `UserRepository.bulk_create` para um lote."""
+
+    created: List[User]
+    failures: List[BulkCreateFailure]
+
+
 @dataclass
 class GenericRequest:
     """Base class for all request objects."""
@@ -94,6 +137,14 @@ class UserRepository(GenericRepository[User]):
         """Busca usuário por ID."""
         pass
 
+    @abstractmethod
+    def get_by_ids(self, user_ids: Iterable[str]) -> Dict[str, User]:
+        """Busca vários usuários por ID; IDs inexistentes ficam fora do dict.
+
+        Superusuários também ficam de fora, como nas listagens.
+        """
+        pass
+
     @abstractmethod
     def get_user_by_email(self, email: str) -> Optional[User]:
         """Busca usuário por email."""
@@ -123,5 +174,83 @@ class UserRepository(GenericRepository[User]):
     def get_all_paginated_filtered(
         self, offset: int, limit: int, search_query: Optional[str]
     ) -> tuple[List[User], int]:
-        """Lista usuários com paginação e filtro."""
+        """Lista usuários com paginação e filtro.
+
+        O total pode ser um `ItemCount` com `exact=False` conforme a
+        estratégia de contagem configurada na implementação.
+        """
+        pass
+
+    @abstractmethod
+    def get_page_after_cursor(
+        self, cursor: Optional[str], limit: int, search_query: Optional[str]
+    ) -> tuple[List[User], Optional[str]]:
+        """Lista usuários por cursor (keyset); retorna a página e o próximo cursor."""
+        pass
+
+    @abstractmethod
+    def check_bulk_create(self, users: Sequence[User]) -> List[BulkCreateFailure]:
+        """Aponta, sem gravar, as linhas que `bulk_create` rejeitaria.
+
+        Inválidas, repetidas na entrada ou com email já existente, com
+        `index` relativo a `users`. Permite descartá-las antes do hashing.
+        """
+        pass
+
+    @abstractmethod
+    def bulk_create(
+        self, users: Sequence[User], password_hashes: Sequence[str], batch_size: int
+    ) -> BulkCreateResult:
+        """Cria vários usuários com senhas já hasheadas.
+
+        Linhas inválidas ou com email já existente entram em `failures`
+        (com `index` relativo a `users`) sem abortar as demais.
+        """
+        pass
+
+    @abstractmethod
+    def iter_filtered(
+        self, search_query: Optional[str], chunk_size: int
+    ) -> Iterator[User]:
+        """Itera todos os usuários do filtro em blocos, sem materializar a lista.
+
+        Usado por exportações: a memória fica limitada a `chunk_size` linhas,
+        independente do tamanho da tabela.
+        """
+        pass
+
+    # Variantes assíncronas usadas pelas views async (deploy ASGI). As
+    # implementações Django herdam versões que delegam aos métodos síncronos
+    # (`core.repositories.async_adapters`) e sobrescrevem com acesso
+    # assíncrono nativo onde houver.
+
+    @abstractmethod
+    async def aget_by_id(self, user_id: str) -> Optional[User]:
+        """Versão assíncrona de `get_by_id`."""
+        pass
+
+    @abstractmethod
+    async def aget_user_by_email(self, email: str) -> Optional[User]:
+        """Versão assíncrona de `get_user_by_email`."""
+        pass
+
+    @abstractmethod
+    async def aget_all_paginated_filtered(
+        self, offset: int, limit: int, search_query: Optional[str]
+    ) -> tuple[List[User], int]:
+        """Versão assíncrona de `get_all_paginated_filtered`."""
+        pass
+
+    @abstractmethod
+    async def aget_page_after_cursor(
+        self, cursor: Optional[str], limit: int, search_query: Optional[str]
+    ) -> tuple[List[User], Optional[str]]:
+        """Versão assíncrona de `get_page_after_cursor`."""
+        pass
+
+    @abstractmethod
+    def aiter_filtered(
+        self, search_query: Optional[str], chunk_size: int
+    ) -> AsyncIterator[User]:
+        """Versão assíncrona de `iter_filtered`."""
         pass
@@ -53,6 +53,14 @@ class DuplicateEntityError(Exception):
         super().__init__(f"{entity_type} with {field} '{value}' already exists")
 
 
+class CapacityExceededError(Exception):
+    """Raised when a bounded resource (e.g. a worker pool) is saturated."""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
 class RepositoryError(Exception):
     """Base exception for repository operations."""
 
@@ -1,7 +1,7 @@
 """Gateways do domínio para integrações externas (ex.: autenticação)."""
 
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import List, Optional, Sequence, Tuple
 
 
 class AuthGateway(ABC):
@@ -21,3 +21,18 @@ class AuthGateway(ABC):
     def set_password(self, user_id: str, new_password: str) -> None:
         """Define nova senha para o usuário."""
         pass
+
+    @abstractmethod
+    def hash_passwords(self, raw_passwords: Sequence[Optional[str]]) -> List[str]:
+        """Gera o hash de várias senhas (``None`` vira senha inutilizável)."""
+        pass
+
+    @abstractmethod
+    async def acheck_password(self, user_id: str, password: str) -> bool:
+        """Versão assíncrona de `check_password`."""
+        pass
+
+    @abstractmethod
+    async def acreate_tokens(self, user_id: str) -> Tuple[str, str]:
+        """Versão assíncrona de `create_tokens`."""
+        pass
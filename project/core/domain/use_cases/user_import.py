@@ -0,0 +1,41 @@
+"""Conversões da importação de usuários em massa.
+
+Compartilhadas pela API (`users/bulk-import/`) e pelo comando
+`import_users`: linha de entrada (CSV/NDJSON/JSON) -> DTO de criação e
+falha -> dict do relatório.
+"""
+
+from core.domain.data_access import BulkCreateFailure
+from core.domain.use_cases.user_use_cases import CreateUserRequest
+
+# Valores aceitos como verdadeiro em `is_active` (CSV traz tudo como texto)
+_TRUE_VALUES = {"1", "true", "t", "yes", "y", "sim", "s"}
+
+
+def bulk_row_to_request(row: dict) -> CreateUserRequest:
+    """Converte uma linha de importação (CSV/NDJSON/JSON) no DTO de criação.
+
+    Não valida: campos ausentes viram texto vazio e a validação por linha
+    fica com `BulkCreateUsersUseCase`/repositório. Senha vazia resulta em
+    senha inutilizável. Flags de staff/superusuário são ignoradas.
+    """
+
+    def text(name):
+        value = row.get(name)
+        return "" if value is None else str(value)
+
+    is_active = row.get("is_active", True)
+    if isinstance(is_active, str):
+        is_active = is_active.strip().lower() in _TRUE_VALUES if is_active else True
+    return CreateUserRequest(
+        email=text("email"),
+        first_name=text("first_name"),
+        last_name=text("last_name"),
+        password=text("password") or None,
+        is_active=bool(is_active),
+    )
+
+
+def bulk_failure_to_dict(failure: BulkCreateFailure) -> dict:
+    """Falha de importação com número de linha 1-based (sem cabeçalho)."""
+    return {"row": failure.index + 1, "email": failure.email, "errors": failure.errors}
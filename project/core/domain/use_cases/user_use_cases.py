@@ -1,8 +1,9 @@
 import logging
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field, replace
+from itertools import islice
+from typing import AsyncIterator, Iterable, Iterator, Optional
 
-from core.domain.data_access import UserRepository
+from core.domain.data_access import BulkCreateFailure, UserRepository
 from core.domain.entities.user import User as DomainUser
 from core.domain.gateways import AuthGateway
 from core.domain.exceptions import AuthenticationError, EntityNotFoundException
@@ -23,7 +24,7 @@ class CreateUserRequest:
     email: str
     first_name: str
     last_name: str
-    password: str
+    password: Optional[str]
     is_active: bool = True
     is_staff: bool = False
     is_superuser: bool = False
@@ -40,6 +41,19 @@ class CreateUserResponse:
     is_superuser: bool
 
 
+def _to_user_response(user: DomainUser) -> CreateUserResponse:
+    """Converte a entidade de domínio no DTO de saída de usuário."""
+    return CreateUserResponse(
+        id=user.id,
+        email=user.email,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        is_active=user.is_active,
+        is_staff=user.is_staff,
+        is_superuser=user.is_superuser,
+    )
+
+
 class CreateUserUseCase:
     """Caso de uso para criação de usuários.
 
@@ -81,6 +95,140 @@ class CreateUserUseCase:
         )
 
 
+# Mesmo mínimo do `UserCreateRequestSerializer`
+PASSWORD_MIN_LENGTH = 6
+
+
+@dataclass
+class BulkCreateUsersRequest:
+    # Pode ser um gerador: as linhas são consumidas lote a lote
+    users: Iterable[CreateUserRequest]
+    batch_size: int = 1000
+
+
+@dataclass
+class BulkCreateUsersBatch:
+    """Resultado de um lote; `index` das falhas é a posição na entrada."""
+
+    processed: int
+    created: int
+    failures: list[BulkCreateFailure]
+
+
+@dataclass
+class BulkCreateUsersResponse:
+    processed: int = 0
+    created: int = 0
+    failures: list[BulkCreateFailure] = field(default_factory=list)
+
+
+class BulkCreateUsersUseCase:
+    """Caso de uso para criação de usuários em massa (importações).
+
+    Consome a entrada em lotes de `batch_size`: valida cada linha, descarta
+    as que o repositório rejeitaria (`check_bulk_create`), gera os hashes
+    das restantes de uma vez pelo `AuthGateway` e insere com
+    `UserRepository.bulk_create`. Falhas são reportadas por
+    linha sem abortar o lote. Cria apenas usuários comuns.
+    """
+
+    def __init__(self, user_repository: UserRepository, auth_gateway: AuthGateway):
+        self.user_repository = user_repository
+        self.auth_gateway = auth_gateway
+
+    def execute(self, request: BulkCreateUsersRequest) -> BulkCreateUsersResponse:
+        response = BulkCreateUsersResponse()
+        for batch in self.iter_batches(request):
+            response.processed += batch.processed
+            response.created += batch.created
+            response.failures.extend(batch.failures)
+        logger.info(
+            "Bulk import finished: %s processed, %s created, %s rejected",
+            response.processed,
+            response.created,
+            len(response.failures),
+        )
+        return response
+
+    def iter_batches(
+        self, request: BulkCreateUsersRequest
+    ) -> Iterator[BulkCreateUsersBatch]:
+        """Processa a entrada lote a lote (útil para reportar progresso)."""
+        rows = iter(request.users)
+        offset = 0
+        while batch := list(islice(rows, request.batch_size)):
+            yield self._create_batch(batch, offset, request.batch_size)
+            offset += len(batch)
+
+    def _create_batch(
+        self, rows: list[CreateUserRequest], offset: int, batch_size: int
+    ) -> BulkCreateUsersBatch:
+        failures: list[BulkCreateFailure] = []
+        valid: list[tuple[int, CreateUserRequest]] = []
+        for index, row in enumerate(rows, start=offset):
+            errors = self._validate_row(row)
+            if errors:
+                failures.append(BulkCreateFailure(index, row.email or "", errors))
+            else:
+                valid.append((index, row))
+
+        users = [
+            DomainUser(
+                email=row.email.strip(),
+                first_name=row.first_name.strip(),
+                last_name=row.last_name.strip(),
+                is_active=row.is_active,
+            )
+            for _, row in valid
+        ]
+        # Rejeições do repositório (validação do modelo, emails repetidos ou
+        # existentes) saem antes do hashing, a etapa cara do lote
+        rejected = self.user_repository.check_bulk_create(users)
+        rejected_positions = {failure.index for failure in rejected}
+        accepted = [
+            position
+            for position in range(len(valid))
+            if position not in rejected_positions
+        ]
+        password_hashes = self.auth_gateway.hash_passwords(
+            [valid[position][1].password for position in accepted]
+        )
+        result = self.user_repository.bulk_create(
+            [users[position] for position in accepted], password_hashes, batch_size
+        )
+
+        # Índices do repositório são relativos a `valid` e a `accepted`
+        failures.extend(
+            replace(failure, index=valid[failure.index][0]) for failure in rejected
+        )
+        failures.extend(
+            replace(failure, index=valid[accepted[failure.index]][0])
+            for failure in result.failures
+        )
+        failures.sort(key=lambda failure: failure.index)
+        logger.debug(
+            "Bulk import batch at %s: %s created, %s rejected",
+            offset,
+            len(result.created),
+            len(failures),
+        )
+        return BulkCreateUsersBatch(
+            processed=len(rows), created=len(result.created), failures=failures
+        )
+
+    @staticmethod
+    def _validate_row(row: CreateUserRequest) -> dict[str, list[str]]:
+        errors: dict[str, list[str]] = {}
+        for name in ("email", "first_name", "last_name"):
+            if not (getattr(row, name) or "").strip():
+                errors[name] = ["This field is required."]
+        if row.password is not None and len(row.password) < PASSWORD_MIN_LENGTH:
+            errors["password"] = [
+                f"Ensure this field has at least {PASSWORD_MIN_LENGTH} characters."
+            ]
+        return errors
+
+
 @dataclass
 class LoginUserRequest:
     email: str
@@ -104,20 +252,53 @@ class LoginUserUseCase:
 
     def execute(self, request: LoginUserRequest) -> LoginUserResponse:
         logger.info("Attempting to log in user with email: %s", request.email)
-        user = self.user_repository.get_user_by_email(request.email)
-        if not user:
-            logger.warning("Login failed: User not found for email %s", request.email)
-            raise AuthenticationError("Invalid credentials")
+        user = self._ensure_user_found(
+            self.user_repository.get_user_by_email(request.email), request
+        )
 
         if not self.auth_gateway.check_password(user.id, request.password):
-            logger.warning("Login failed: Invalid password for user ID %s", user.id)
-            raise AuthenticationError("Invalid credentials")
+            self._reject_password(user)
 
         access_token, refresh_token = self.auth_gateway.create_tokens(user.id)
+        return self._build_response(user, request, access_token, refresh_token)
+
+    async def aexecute(self, request: LoginUserRequest) -> LoginUserResponse:
+        """Versão assíncrona de `execute` (views async/ASGI)."""
+        logger.info("Attempting to log in user with email: %s", request.email)
+        user = self._ensure_user_found(
+            await self.user_repository.aget_user_by_email(request.email), request
+        )
+
+        if not await self.auth_gateway.acheck_password(user.id, request.password):
+            self._reject_password(user)
+
+        access_token, refresh_token = await self.auth_gateway.acreate_tokens(user.id)
+        return self._build_response(user, request, access_token, refresh_token)
+
+    @staticmethod
+    def _ensure_user_found(
+        user: Optional[DomainUser], request: LoginUserRequest
+    ) -> DomainUser:
+        if not user:
+            logger.warning("Login failed: User not found for email %s", request.email)
+            raise AuthenticationError("Invalid credentials")
+        return user
+
+    @staticmethod
+    def _reject_password(user: DomainUser):
+        logger.warning("Login failed: Invalid password for user ID %s", user.id)
+        raise AuthenticationError("Invalid credentials")
+
+    @staticmethod
+    def _build_response(
+        user: DomainUser,
+        request: LoginUserRequest,
+        access_token: str,
+        refresh_token: str,
+    ) -> LoginUserResponse:
         logger.info(
             "User %s logged in successfully. User ID: %s", request.email, user.id
         )
-
         return LoginUserResponse(
             id=user.id,
             email=user.email,
@@ -163,14 +344,20 @@ class ListUsersRequest:
     offset: int = 0
     limit: int = 10
     search_query: Optional[str] = None
+    # Quando informado (mesmo vazio, para a primeira página), ativa o modo
+    # cursor/keyset e `offset` é ignorado.
+    cursor: Optional[str] = None
 
 
 @dataclass
 class ListUsersResponse:
     users: list[CreateUserResponse]
-    total_items: int
+    total_items: Optional[int]
     offset: int
     limit: int
+    next_cursor: Optional[str] = None
+    # False quando o total é limitado, estimado, vem de cache ou não é calculado
+    total_items_exact: bool = True
 
 
 class ListUsersUseCase:
@@ -182,40 +369,97 @@ class ListUsersUseCase:
         # pois precisamos de uma lógica de paginação/filtragem mais específica.
 
     def execute(self, request: ListUsersRequest) -> ListUsersResponse:
+        if request.cursor is not None:
+            return self._execute_by_cursor(request)
+
+        self._log_offset_listing(request)
+        users_domain, total_items = self.user_repository.get_all_paginated_filtered(
+            offset=request.offset,
+            limit=request.limit,
+            search_query=request.search_query,
+        )
+        return self._offset_response(request, users_domain, total_items)
+
+    async def aexecute(self, request: ListUsersRequest) -> ListUsersResponse:
+        """Versão assíncrona de `execute` (views async/ASGI)."""
+        if request.cursor is not None:
+            self._log_cursor_listing(request)
+            users_domain, next_cursor = (
+                await self.user_repository.aget_page_after_cursor(
+                    cursor=request.cursor,
+                    limit=request.limit,
+                    search_query=request.search_query,
+                )
+            )
+            return self._cursor_response(request, users_domain, next_cursor)
+
+        self._log_offset_listing(request)
+        users_domain, total_items = (
+            await self.user_repository.aget_all_paginated_filtered(
+                offset=request.offset,
+                limit=request.limit,
+                search_query=request.search_query,
+            )
+        )
+        return self._offset_response(request, users_domain, total_items)
+
+    def _execute_by_cursor(self, request: ListUsersRequest) -> ListUsersResponse:
+        """Paginação por cursor: custo constante por página e sem COUNT."""
+        self._log_cursor_listing(request)
+        users_domain, next_cursor = self.user_repository.get_page_after_cursor(
+            cursor=request.cursor,
+            limit=request.limit,
+            search_query=request.search_query,
+        )
+        return self._cursor_response(request, users_domain, next_cursor)
+
+    @staticmethod
+    def _log_offset_listing(request: ListUsersRequest) -> None:
         logger.info(
             "Listing users with offset: %s, limit: %s, search_query: %s",
             request.offset,
             request.limit,
             request.search_query,
         )
-        users_domain, total_items = self.user_repository.get_all_paginated_filtered(
-            offset=request.offset,
-            limit=request.limit,
-            search_query=request.search_query,
+
+    @staticmethod
+    def _log_cursor_listing(request: ListUsersRequest) -> None:
+        logger.info(
+            "Listing users by cursor with limit: %s, search_query: %s",
+            request.limit,
+            request.search_query,
         )
+
+    @staticmethod
+    def _offset_response(
+        request: ListUsersRequest, users_domain: list[DomainUser], total_items: int
+    ) -> ListUsersResponse:
         logger.debug(
             "Found %s users in total, returning %s users.",
             total_items,
             len(users_domain),
         )
-
-        users_response = [
-            CreateUserResponse(
-                id=user.id,
-                email=user.email,
-                first_name=user.first_name,
-                last_name=user.last_name,
-                is_active=user.is_active,
-                is_staff=user.is_staff,
-                is_superuser=user.is_superuser,
-            )
-            for user in users_domain
-        ]
         return ListUsersResponse(
-            users=users_response,
-            total_items=total_items,
+            users=[_to_user_response(user) for user in users_domain],
+            total_items=int(total_items),
             offset=request.offset,
             limit=request.limit,
+            total_items_exact=getattr(total_items, "exact", True),
+        )
+
+    @staticmethod
+    def _cursor_response(
+        request: ListUsersRequest,
+        users_domain: list[DomainUser],
+        next_cursor: Optional[str],
+    ) -> ListUsersResponse:
+        return ListUsersResponse(
+            users=[_to_user_response(user) for user in users_domain],
+            total_items=None,
+            offset=0,
+            limit=request.limit,
+            next_cursor=next_cursor,
+            total_items_exact=False,
         )
 
 
@@ -236,14 +480,89 @@ class GetUserByIdUseCase:
     def execute(self, request: GetUserByIdRequest) -> CreateUserResponse:
         generic_request = GenericGetByIdRequest(entity_id=request.user_id)
         get_entity_response = self.generic_get_by_id_use_case.execute(generic_request)
-        user = get_entity_response.data
+        return _to_user_response(get_entity_response.data)
 
-        return CreateUserResponse(
-            id=user.id,
-            email=user.email,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            is_active=user.is_active,
-            is_staff=user.is_staff,
-            is_superuser=user.is_superuser,
+    async def aexecute(self, request: GetUserByIdRequest) -> CreateUserResponse:
+        """Versão assíncrona de `execute` (views async/ASGI)."""
+        user = await self.user_repository.aget_by_id(request.user_id)
+        if not user:
+            # Mesmo erro do `GetEntityByIdUseCase` usado no caminho síncrono
+            raise EntityNotFoundException("Entity", request.user_id)
+        return _to_user_response(user)
+
+
+@dataclass
+class GetUsersByIdsRequest:
+    user_ids: list[str]
+
+
+@dataclass
+class GetUsersByIdsResponse:
+    users: list[CreateUserResponse]
+    not_found: list[str]
+
+
+class GetUsersByIdsUseCase:
+    """Caso de uso para obter vários usuários por ID em uma única consulta."""
+
+    def __init__(self, user_repository: UserRepository):
+        self.user_repository = user_repository
+
+    def execute(self, request: GetUsersByIdsRequest) -> GetUsersByIdsResponse:
+        user_ids = [str(user_id) for user_id in request.user_ids]
+        users_by_id = self.user_repository.get_by_ids(user_ids)
+
+        # Mantém a ordem (e deduplica) conforme os IDs solicitados
+        users: list[CreateUserResponse] = []
+        not_found: list[str] = []
+        for user_id in dict.fromkeys(user_ids):
+            user = users_by_id.get(user_id)
+            if user is None:
+                not_found.append(user_id)
+            else:
+                users.append(_to_user_response(user))
+
+        return GetUsersByIdsResponse(users=users, not_found=not_found)
+
+
+@dataclass
+class ExportUsersRequest:
+    search_query: Optional[str] = None
+    # Linhas por ida ao banco; limita a memória da exportação
+    chunk_size: int = 2000
+
+
+class ExportUsersUseCase:
+    """Caso de uso para exportar todos os usuários do filtro em streaming.
+
+    Retorna um iterador: as linhas são lidas do banco à medida que a
+    resposta é consumida, sem COUNT nem paginação.
+    """
+
+    def __init__(self, user_repository: UserRepository):
+        self.user_repository = user_repository
+
+    def execute(self, request: ExportUsersRequest) -> Iterator[CreateUserResponse]:
+        self._log_export(request)
+        for user in self.user_repository.iter_filtered(
+            request.search_query, request.chunk_size
+        ):
+            yield _to_user_response(user)
+
+    async def aexecute(
+        self, request: ExportUsersRequest
+    ) -> AsyncIterator[CreateUserResponse]:
+        """Versão assíncrona de `execute` (views async/ASGI)."""
+        self._log_export(request)
+        async for user in self.user_repository.aiter_filtered(
+            request.search_query, request.chunk_size
+        ):
+            yield _to_user_response(user)
+
+    @staticmethod
+    def _log_export(request: ExportUsersRequest) -> None:
+        logger.info(
+            "Exporting users with search_query: %s, chunk_size: %s",
+            request.search_query,
+            request.chunk_size,
         )
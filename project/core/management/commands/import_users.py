@@ -0,0 +1,147 @@
+"""Importa usuários em massa a partir de um arquivo CSV ou NDJSON.
+
+O arquivo é lido como stream e processado em lotes por
+`BulkCreateUsersUseCase` (validação por linha, hashing em pool de processos
+e ``bulk_create``); a memória fica limitada ao tamanho do lote.
+
+Colunas/chaves: ``email``, ``first_name``, ``last_name`` e, opcionais,
+``password`` (vazia = senha inutilizável) e ``is_active``.
+
+Uso:
+    python manage.py import_users usuarios.csv
+    python manage.py import_users - --format ndjson < usuarios.ndjson
+    python manage.py import_users usuarios.csv --errors falhas.ndjson
+"""
+
+import csv
+import sys
+from pathlib import Path
+from typing import Iterable, Set
+
+import orjson
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.api.deps import get_bulk_create_users_use_case
+from core.domain.use_cases.user_import import (
+    bulk_failure_to_dict,
+    bulk_row_to_request,
+)
+from core.domain.use_cases.user_use_cases import BulkCreateUsersRequest
+
+FORMATS_BY_SUFFIX = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+INVALID_JSON_ERRORS = {"non_field_errors": ["Invalid JSON line."]}
+
+
+class _NDJSONRows:
+    """Itera as linhas NDJSON; linhas inválidas viram ``{}`` e são anotadas.
+
+    Manter um item por linha preserva a numeração usada no relatório.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.invalid_indexes: Set[int] = set()
+
+    def __iter__(self):
+        index = 0
+        for line in self.stream:
+            if not line.strip():
+                continue
+            try:
+                row = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                row = None
+            if not isinstance(row, dict):
+                self.invalid_indexes.add(index)
+                row = {}
+            yield row
+            index += 1
+
+
+class Command(BaseCommand):
+    help = "Importa usuários em massa de um arquivo CSV ou NDJSON (stream)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Arquivo de entrada ou '-' para stdin.")
+        parser.add_argument(
+            "--format",
+            choices=("csv", "ndjson"),
+            help="Formato da entrada (padrão: pela extensão do arquivo).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.USER_BULK_IMPORT_BATCH_SIZE,
+            help="Linhas por lote (padrão: USER_BULK_IMPORT_BATCH_SIZE).",
+        )
+        parser.add_argument(
+            "--errors",
+            help="Grava as falhas em NDJSON neste arquivo (padrão: stderr).",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        input_format = options["format"] or FORMATS_BY_SUFFIX.get(
+            Path(path).suffix.lower()
+        )
+        if input_format is None:
+            raise CommandError("Informe --format (csv ou ndjson).")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size deve ser positivo.")
+
+        stream = (
+            sys.stdin if path == "-" else open(path, encoding="utf-8-sig", newline="")
+        )
+        try:
+            self._import(stream, input_format, options)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+    def _import(self, stream, input_format, options):
+        rows: Iterable[dict]
+        invalid_indexes: Set[int] = set()
+        if input_format == "csv":
+            rows = csv.DictReader(stream)
+        else:
+            ndjson_rows = _NDJSONRows(stream)
+            rows, invalid_indexes = ndjson_rows, ndjson_rows.invalid_indexes
+
+        request = BulkCreateUsersRequest(
+            users=(bulk_row_to_request(row) for row in rows),
+            batch_size=options["batch_size"],
+        )
+        errors_file = open(options["errors"], "wb") if options["errors"] else None
+        processed = created = rejected = 0
+        try:
+            use_case = get_bulk_create_users_use_case()
+            for batch in use_case.iter_batches(request):
+                processed += batch.processed
+                created += batch.created
+                rejected += len(batch.failures)
+                for failure in batch.failures:
+                    if failure.index in invalid_indexes:
+                        failure.errors = INVALID_JSON_ERRORS
+                    self._write_failure(failure, errors_file)
+                self.stdout.write(
+                    f"{processed} linhas processadas: {created} criadas, "
+                    f"{rejected} rejeitadas"
+                )
+        finally:
+            if errors_file is not None:
+                errors_file.close()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Importação concluída: {created} usuários criados, "
+                f"{rejected} linhas rejeitadas."
+            )
+        )
+
+    def _write_failure(self, failure, errors_file):
+        line = orjson.dumps(bulk_failure_to_dict(failure))
+        if errors_file is not None:
+            errors_file.write(line + b"\n")
+        else:
+            self.stderr.write(line.decode("utf-8"))
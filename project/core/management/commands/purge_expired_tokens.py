@@ -0,0 +1,83 @@
+"""Remove tokens OAuth2 expirados em lotes (ver `core.repositories.token_purge`).
+
+Feito para rodar agendado (cron, CronJob); ``--time-limit`` limita a
+janela e a execução seguinte continua do checkpoint.
+
+Uso:
+    python manage.py purge_expired_tokens
+    python manage.py purge_expired_tokens --batch-size 5000 --sleep 0.5
+    python manage.py purge_expired_tokens --time-limit 600
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.repositories.token_purge import purge_expired_tokens
+
+
+class Command(BaseCommand):
+    help = "Remove tokens OAuth2 expirados em lotes, com pausa entre eles."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.TOKEN_PURGE_BATCH_SIZE,
+            help="Linhas por lote (padrão: TOKEN_PURGE_BATCH_SIZE).",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=settings.TOKEN_PURGE_BATCH_SLEEP,
+            help="Pausa em segundos entre lotes (padrão: TOKEN_PURGE_BATCH_SLEEP).",
+        )
+        parser.add_argument(
+            "--time-limit",
+            type=float,
+            help="Para de iniciar lotes após N segundos (retoma na próxima execução).",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignora o checkpoint e percorre as tabelas desde o início.",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size deve ser positivo.")
+        if options["sleep"] < 0:
+            raise CommandError("--sleep não pode ser negativo.")
+
+        report = purge_expired_tokens(
+            batch_size=options["batch_size"],
+            sleep=options["sleep"],
+            time_limit=options["time_limit"],
+            resume=not options["restart"],
+            on_batch=self._on_batch if options["verbosity"] > 1 else None,
+        )
+        for stats in report.rules:
+            self.stdout.write(
+                f"{stats.rule}: {stats.deleted} removidos em {stats.batches} lotes "
+                f"({stats.rows_per_second:.0f} linhas/s)"
+                + ("" if stats.completed else f", parou após o ID {stats.last_id}")
+            )
+
+        summary = (
+            f"{report.deleted} tokens removidos em {report.elapsed:.1f}s "
+            f"({report.rows_per_second:.0f} linhas/s)"
+        )
+        if report.completed:
+            self.stdout.write(self.style.SUCCESS(f"Limpeza concluída: {summary}."))
+        else:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Limite de tempo atingido: {summary}; "
+                    "a próxima execução continua do checkpoint."
+                )
+            )
+
+    def _on_batch(self, stats):
+        self.stdout.write(
+            f"{stats.rule}: lote {stats.batches}, {stats.deleted} removidos "
+            f"(último ID {stats.last_id})"
+        )
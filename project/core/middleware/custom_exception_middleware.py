@@ -15,7 +15,7 @@ from rest_framework.exceptions import APIException, ValidationError
 from rest_framework.response import Response
 from rest_framework.views import exception_handler
 
-from core.domain.exceptions import EntityNotFoundException
+from core.domain.exceptions import CapacityExceededError, EntityNotFoundException
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +40,17 @@ def custom_exception_handler(exc, context):
         if settings.DEBUG:
             response_data["traceback"] = traceback.format_exc()
         response = Response(response_data, status=status.HTTP_404_NOT_FOUND)
+    elif isinstance(exc, CapacityExceededError):
+        # Recurso saturado: falha rápida com 503 e dica de nova tentativa
+        response_data = {
+            "detail": str(exc),
+            "status_code": status.HTTP_503_SERVICE_UNAVAILABLE,
+        }
+        response = Response(
+            response_data,
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(exc.retry_after)},
+        )
     elif isinstance(exc, ValueError):
         # Handle ValueErrors from domain/use cases as 400 Bad Request
         response_data = {"detail": str(exc), "status_code": status.HTTP_400_BAD_REQUEST}
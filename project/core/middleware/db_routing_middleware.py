@@ -0,0 +1,31 @@
+"""Middleware que delimita a fixação de leituras no primário por requisição.
+
+Ver `core.db_router`: após uma escrita, as leituras da mesma requisição
+deixam de ir para a réplica. O estado é descartado ao fim da resposta.
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from core.db_router import primary_pin_scope
+
+
+class DatabaseRoutingMiddleware:
+    """Abre um escopo de roteamento primário/réplica para a requisição."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with primary_pin_scope():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with primary_pin_scope():
+            return await self.get_response(request)
@@ -0,0 +1,31 @@
+"""Middleware que delimita o identity map de repositórios por requisição.
+
+Cada requisição ganha um `IdentityMap` novo (ver
+`core.repositories.identity_map`), descartado ao final da resposta.
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from core.repositories.identity_map import identity_map_scope
+
+
+class IdentityMapMiddleware:
+    """Abre um escopo de identity map para toda a requisição."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with identity_map_scope():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with identity_map_scope():
+            return await self.get_response(request)
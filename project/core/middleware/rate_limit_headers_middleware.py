@@ -0,0 +1,39 @@
+"""Middleware que expõe o estado do rate limiting nos headers da resposta.
+
+Os throttles de `core.api.throttles` anexam ``request.rate_limit`` ao
+avaliar a requisição; aqui esse estado vira os headers ``RateLimit-Limit``,
+``RateLimit-Remaining`` e ``RateLimit-Reset``, sem novas idas ao cache.
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+
+class RateLimitHeadersMiddleware:
+    """Adiciona headers RateLimit-* às respostas de views com throttle."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self._add_headers(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self._add_headers(request, await self.get_response(request))
+
+    @staticmethod
+    def _add_headers(request, response):
+        rate_limit = getattr(request, "rate_limit", None)
+        if rate_limit is not None:
+            response.headers.setdefault("RateLimit-Limit", str(rate_limit["limit"]))
+            response.headers.setdefault(
+                "RateLimit-Remaining", str(rate_limit["remaining"])
+            )
+            response.headers.setdefault("RateLimit-Reset", str(rate_limit["reset"]))
+        return response
@@ -0,0 +1,50 @@
+"""Índices trigram (pg_trgm) para a busca `icontains` da listagem de usuários.
+
+No PostgreSQL o Django traduz `campo__icontains` para
+``UPPER("campo"::text) LIKE UPPER('%termo%')``; os índices GIN abaixo usam
+exatamente essa expressão, então o planner os aproveita (BitmapOr entre as
+três colunas) sem mudar a consulta. Em outros bancos (ex.: SQLite em
+desenvolvimento/testes) a migração não faz nada e a busca continua por
+varredura simples.
+"""
+
+from django.db import migrations
+
+TRIGRAM_INDEXES = {
+    "core_user_email_trgm": "email",
+    "core_user_first_name_trgm": "first_name",
+    "core_user_last_name_trgm": "last_name",
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, column in TRIGRAM_INDEXES.items():
+        # CONCURRENTLY evita bloquear escritas em core_user durante a criação
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+            f"ON core_user USING gin (UPPER({column}::text) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index_name in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+
+class Migration(migrations.Migration):
+
+    # Necessário para CREATE INDEX CONCURRENTLY
+    atomic = False
+
+    dependencies = [
+        ("core", "0003_alter_user_id"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
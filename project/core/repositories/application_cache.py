@@ -0,0 +1,99 @@
+"""Cache em processo da `Application` OAuth2 usada na emissão de tokens.
+
+A linha de `oauth2_provider.Application` para ``settings.OAUTH2_CLIENT_ID``
+quase nunca muda, então cada worker a mantém em memória:
+
+- o TTL (``OAUTH2_APPLICATION_CACHE_TTL``) limita quanto tempo outros
+  workers podem servir uma cópia antiga após uma alteração;
+- no worker onde a alteração ocorre, os sinais `post_save`/`post_delete`
+  (ver `core.signals`) invalidam a entrada imediatamente;
+- `CoreConfig.ready` agenda o aquecimento na primeira requisição de cada
+  worker, antes da view, para que o login não pague a consulta.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import DatabaseError
+from oauth2_provider.models import Application
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class ApplicationCache:
+    """Mapa `client_id -> Application` com expiração por TTL."""
+
+    def __init__(self, ttl: Optional[int] = None):
+        self._ttl = ttl
+        self._entries: Dict[str, Tuple[Application, float]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> int:
+        if self._ttl is not None:
+            return self._ttl
+        return getattr(settings, "OAUTH2_APPLICATION_CACHE_TTL", 300)
+
+    def get(self, client_id: str) -> Application:
+        """Retorna a aplicação do cache ou a carrega do banco.
+
+        Raises
+        ------
+        Application.DoesNotExist
+            Se não houver aplicação com o `client_id`.
+        """
+        entry = self._entries.get(client_id)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+        application = Application.objects.get(client_id=client_id)
+        with self._lock:
+            self._entries[client_id] = (application, time.monotonic() + self.ttl)
+        return application
+
+    def invalidate(self, client_id: Optional[str] = None) -> None:
+        """Remove uma entrada (ou todas, sem `client_id`)."""
+        with self._lock:
+            if client_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(client_id, None)
+
+    def warm(self, client_id: Optional[str] = None) -> bool:
+        """Pré-carrega a aplicação configurada; retorna se conseguiu."""
+        client_id = client_id or settings.OAUTH2_CLIENT_ID
+        if not client_id:
+            return False
+        try:
+            self.get(client_id)
+        except (Application.DoesNotExist, DatabaseError):
+            logger.warning(
+                "OAuth2 application cache warm-up failed", client_id=client_id
+            )
+            return False
+        return True
+
+
+application_cache = ApplicationCache()
+
+
+def _warm_on_first_request(sender, **kwargs):
+    request_started.disconnect(
+        _warm_on_first_request, dispatch_uid="core_warm_application_cache"
+    )
+    application_cache.warm()
+
+
+def schedule_warm_up() -> None:
+    """Aquece o cache no início da primeira requisição deste processo.
+
+    Consultas durante `AppConfig.ready` são desaconselhadas pelo Django (e
+    rodariam também em `migrate`, testes etc.), por isso o aquecimento
+    acontece no sinal `request_started`.
+    """
+    request_started.connect(
+        _warm_on_first_request, dispatch_uid="core_warm_application_cache"
+    )
@@ -0,0 +1,61 @@
+"""Variantes assíncronas padrão dos contratos do domínio.
+
+`UserRepository` e `AuthGateway` declaram os métodos ``a*`` como abstratos,
+sem depender do asgiref. As bases daqui os implementam executando o método
+síncrono correspondente via `sync_to_async` (``thread_sensitive``: a mesma
+thread e conexão de banco das views síncronas). Implementações com acesso
+assíncrono nativo sobrescrevem só o que precisarem.
+"""
+
+from itertools import islice
+from typing import AsyncIterator, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+
+from core.domain.data_access import UserRepository
+from core.domain.entities.user import User
+from core.domain.gateways import AuthGateway
+
+
+class SyncToAsyncUserRepository(UserRepository):
+    """`UserRepository` com as variantes assíncronas delegadas às síncronas."""
+
+    async def aget_by_id(self, user_id: str) -> Optional[User]:
+        return await sync_to_async(self.get_by_id)(user_id)
+
+    async def aget_user_by_email(self, email: str) -> Optional[User]:
+        return await sync_to_async(self.get_user_by_email)(email)
+
+    async def aget_all_paginated_filtered(
+        self, offset: int, limit: int, search_query: Optional[str]
+    ) -> tuple[List[User], int]:
+        return await sync_to_async(self.get_all_paginated_filtered)(
+            offset, limit, search_query
+        )
+
+    async def aget_page_after_cursor(
+        self, cursor: Optional[str], limit: int, search_query: Optional[str]
+    ) -> tuple[List[User], Optional[str]]:
+        return await sync_to_async(self.get_page_after_cursor)(
+            cursor, limit, search_query
+        )
+
+    async def aiter_filtered(
+        self, search_query: Optional[str], chunk_size: int
+    ) -> AsyncIterator[User]:
+        """Itera `iter_filtered` em blocos, um por ida à thread."""
+        iterator = iter(self.iter_filtered(search_query, chunk_size))
+        next_chunk = sync_to_async(lambda: list(islice(iterator, chunk_size)))
+        while chunk := await next_chunk():
+            for user in chunk:
+                yield user
+
+
+class SyncToAsyncAuthGateway(AuthGateway):
+    """`AuthGateway` com as variantes assíncronas delegadas às síncronas."""
+
+    async def acheck_password(self, user_id: str, password: str) -> bool:
+        return await sync_to_async(self.check_password)(user_id, password)
+
+    async def acreate_tokens(self, user_id: str) -> Tuple[str, str]:
+        return await sync_to_async(self.create_tokens)(user_id)
@@ -1,85 +1,231 @@
 import os
 import secrets
 from datetime import timedelta
-from typing import Tuple
+from functools import partial
+from typing import List, Optional, Sequence, Tuple
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.hashers import (
+    check_password,
+    get_hasher,
+    identify_hasher,
+    make_password,
+)
+from django.db import IntegrityError, connections, router, transaction
 from django.utils import timezone
 from oauth2_provider.models import AccessToken, Application, RefreshToken
 import structlog
 
 from core.domain.exceptions import AuthenticationError, ClientApplicationNotFound
-from core.domain.gateways import AuthGateway
+from core.repositories import signed_tokens
+from core.repositories.application_cache import application_cache
+from core.repositories.async_adapters import SyncToAsyncAuthGateway
+from core.repositories.hashing_pool import get_hashing_pool, hash_passwords
+from core.repositories.identity_map import get_identity_map
+from core.repositories.token_cache import access_token_cache
 
 User = get_user_model()
 logger = structlog.get_logger(__name__)
 
 
-class DjangoAuthGateway(AuthGateway):
+class DjangoAuthGateway(SyncToAsyncAuthGateway):
+    """Gateway de autenticação sobre o ORM e o django-oauth-toolkit.
+
+    Parameters
+    ----------
+    bulk_hashing_processes: int, opcional
+        Processos usados por `hash_passwords`; padrão vem de
+        ``PASSWORD_BULK_HASHING_PROCESSES``. ``1`` faz o hashing no
+        próprio processo.
+    """
+
+    def __init__(self, bulk_hashing_processes: Optional[int] = None):
+        self.bulk_hashing_processes = bulk_hashing_processes
+
+    def _get_user(self, user_id: str):
+        """Carrega o usuário, reutilizando o identity map da requisição se houver."""
+        identity_map = get_identity_map()
+        if identity_map is not None:
+            return identity_map.get_or_load(User, "pk", user_id, aliases=("email",))
+        return User.objects.get(id=user_id)
+
     def check_password(self, user_id: str, password: str) -> bool:
+        """Verifica a senha com o hashing executado no pool limitado.
+
+        Levanta `CapacityExceededError` se o pool estiver saturado.
+        """
         try:
-            user = User.objects.get(id=user_id)
-            result = user.check_password(password)
-            return result
+            user = self._get_user(user_id)
         except User.DoesNotExist:
             return False
+        pool = get_hashing_pool()
+        result = pool.run(check_password, password, user.password)
+        if result and self._must_rehash(user.password):
+            self._store_password(user, pool.run(make_password, password), password)
+        return result
 
-    def create_tokens(self, user_id: str) -> Tuple[str, str]:
+    async def acheck_password(self, user_id: str, password: str) -> bool:
+        """Variante assíncrona: aguarda o pool sem bloquear o event loop."""
         try:
-            user = User.objects.get(id=user_id)
+            user = await sync_to_async(self._get_user)(user_id)
         except User.DoesNotExist:
-            raise AuthenticationError("User not found")
-
-        # Look up the client application based on the client_id from the request
-        client_id = settings.OAUTH2_CLIENT_ID
-        if not client_id:
-            logger.error("OAUTH2_CLIENT_ID environment variable not defined")
-            raise ValueError("OAUTH2_CLIENT_ID environment variable not defined")
+            return False
+        pool = get_hashing_pool()
+        result = await pool.run_async(check_password, password, user.password)
+        if result and self._must_rehash(user.password):
+            encoded = await pool.run_async(make_password, password)
+            await sync_to_async(self._store_password)(user, encoded, password)
+        return result
 
+    @staticmethod
+    def _must_rehash(encoded: str) -> bool:
+        # Mesma regra de `django.contrib.auth.hashers.check_password`
         try:
-            application = Application.objects.get(client_id=client_id)
-        except Application.DoesNotExist:
-            logger.error("Client application not found", client_id=client_id)
-            raise ClientApplicationNotFound("Client application not found")
+            hasher = identify_hasher(encoded)
+        except ValueError:
+            return False
+        preferred = get_hasher("default")
+        return hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
 
-        # Remove any existing tokens for the user and application
-        AccessToken.objects.filter(user=user, application=application).delete()
-        RefreshToken.objects.filter(user=user, application=application).delete()
+    @staticmethod
+    def _store_password(user, encoded: str, raw_password: str) -> None:
+        # Mesmo efeito de `set_password` + save, mas com o hash já calculado
+        user.password = encoded
+        user._password = raw_password
+        user.save(update_fields=["password"])
+
+    def create_tokens(self, user_id: str) -> Tuple[str, str]:
+        """Revoga os tokens do usuário na aplicação e emite um novo par.
 
-        # Create a new access token
+        Caminho rápido: não recarrega o usuário (usa apenas `user_id`),
+        reutiliza a `Application` em cache e faz revogação + emissão em uma
+        única transação, com deletes filtrados diretos (sem o collector do
+        Django) e `bulk_create`. Aplicações em
+        ``OAUTH2_SIGNED_TOKEN_APPLICATIONS`` recebem um access token assinado
+        (`core.repositories.signed_tokens`), que não é gravado.
+        """
+        application = self._get_application()
         scope = os.getenv("OAUTH2_SCOPES", "read write")
-        access_token = AccessToken.objects.create(
-            user=user,
+        now = timezone.now()
+        expires = now + timedelta(
+            seconds=settings.OAUTH2_PROVIDER["ACCESS_TOKEN_EXPIRE_SECONDS"]
+        )
+        signed = signed_tokens.uses_signed_tokens(application)
+        if signed:
+            # Autocontido: não vai ao banco; só o refresh token é persistido
+            access_token = None
+            token = signed_tokens.issue(user_id, application, scope, expires, now)
+        else:
+            access_token = AccessToken(
+                user_id=user_id,
+                application=application,
+                token=secrets.token_urlsafe(32),  # Generate a real token
+                scope=scope,
+                expires=expires,
+            )
+            token = access_token.token
+        refresh_token = RefreshToken(
+            user_id=user_id,
             application=application,
             token=secrets.token_urlsafe(32),  # Generate a real token
-            scope=scope,
-            expires=timezone.now()
-            + timedelta(
-                seconds=settings.OAUTH2_PROVIDER["ACCESS_TOKEN_EXPIRE_SECONDS"]
-            ),
         )
 
+        db = router.db_for_write(AccessToken)
+        try:
+            with transaction.atomic(using=db):
+                self._revoke_tokens(db, user_id, application)
+                if access_token is not None:
+                    AccessToken.objects.using(db).bulk_create([access_token])
+                    refresh_token.access_token = access_token
+                RefreshToken.objects.using(db).bulk_create([refresh_token])
+                if signed:
+                    # Revoga os tokens assinados anteriores ao novo
+                    transaction.on_commit(
+                        partial(
+                            signed_tokens.revoke_user, user_id, application.pk, now
+                        ),
+                        using=db,
+                    )
+        except IntegrityError:
+            # FK de usuário inexistente (não há SELECT prévio do usuário)
+            logger.warning("Token creation failed: user not found", user_id=user_id)
+            raise AuthenticationError("User not found")
+
         logger.info(
             "Access token created successfully",
-            user_id=str(user.id),
+            user_id=str(user_id),
             application_id=str(application.id),
+            token_format="signed" if signed else "opaque",
         )
+        return token, refresh_token.token
 
-        # Create a new refresh token
-        refresh_token = RefreshToken.objects.create(
-            user=user,
-            application=application,
-            token=secrets.token_urlsafe(32),  # Generate a real token
-            access_token=access_token,
-        )
+    def _get_application(self):
+        """Resolve a `Application` de `settings.OAUTH2_CLIENT_ID` via cache em processo."""
+        client_id = settings.OAUTH2_CLIENT_ID
+        if not client_id:
+            logger.error("OAUTH2_CLIENT_ID environment variable not defined")
+            raise ValueError("OAUTH2_CLIENT_ID environment variable not defined")
+
+        try:
+            return application_cache.get(client_id)
+        except Application.DoesNotExist:
+            logger.error("Client application not found", client_id=client_id)
+            raise ClientApplicationNotFound("Client application not found")
+
+    @staticmethod
+    def _revoke_tokens(db: str, user_id: str, application) -> None:
+        """Remove refresh e access tokens do usuário na aplicação.
+
+        No PostgreSQL usa um único statement (CTE com DELETE); nos demais
+        bancos, dois deletes filtrados. As FKs entre os dois modelos são
+        verificadas no commit (DEFERRABLE), então a ordem não importa. Os
+        access tokens removidos saem do cache de autenticação após o commit.
+        """
+        connection = connections[db]
+        if connection.vendor == "postgresql":
+            qn = connection.ops.quote_name
+            user_field = AccessToken._meta.get_field("user")
+            params = [
+                user_field.get_db_prep_value(user_id, connection),
+                application.pk,
+            ]
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"WITH revoked AS (DELETE FROM {qn(RefreshToken._meta.db_table)} "
+                    f"WHERE user_id = %s AND application_id = %s) "
+                    f"DELETE FROM {qn(AccessToken._meta.db_table)} "
+                    f"WHERE user_id = %s AND application_id = %s "
+                    f"RETURNING token_checksum",
+                    params * 2,
+                )
+                checksums = [row[0] for row in cursor.fetchall()]
+            access_token_cache.invalidate(checksums, using=db)
+            return
+
+        if access_token_cache.enabled:
+            access_token_cache.invalidate(
+                AccessToken.objects.using(db)
+                .filter(user_id=user_id, application=application)
+                .values_list("token_checksum", flat=True),
+                using=db,
+            )
+        for model in (RefreshToken, AccessToken):
+            queryset = model.objects.using(db).filter(
+                user_id=user_id, application=application
+            )
+            queryset._raw_delete(db)
 
-        return access_token.token, refresh_token.token
+    def hash_passwords(self, raw_passwords: Sequence[Optional[str]]) -> List[str]:
+        """Hashing em lote no pool de processos (importações)."""
+        return hash_passwords(raw_passwords, self.bulk_hashing_processes)
 
     def set_password(self, user_id: str, new_password: str) -> None:
         try:
-            user = User.objects.get(id=user_id)
-            user.set_password(new_password)
-            user.save()
+            user = self._get_user(user_id)
         except User.DoesNotExist:
             raise AuthenticationError("User not found")
+        user.password = get_hashing_pool().run(make_password, new_password)
+        user._password = new_password
+        user.save()
@@ -0,0 +1,55 @@
+"""Backends de cache com medição de tempo por requisição.
+
+Subclasses dos backends do Django que registram cada operação na categoria
+``cache`` de `core.repositories.request_timing`. Fora de uma requisição
+amostrada o custo é a leitura de um `ContextVar` por operação.
+"""
+
+from functools import wraps
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+
+from core.repositories.request_timing import timed
+
+TIMED_METHODS = (
+    "add",
+    "get",
+    "set",
+    "touch",
+    "delete",
+    "get_many",
+    "set_many",
+    "delete_many",
+    "has_key",
+    "incr",
+    "decr",
+    "clear",
+)
+
+
+def _timed_method(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with timed("cache"):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def with_request_timing(backend_class):
+    """Subclasse de `backend_class` com as operações síncronas medidas.
+
+    As variantes assíncronas do `BaseCache` (``aget`` etc.) delegam às
+    síncronas via `sync_to_async`, então também são medidas.
+    """
+    namespace = {
+        name: _timed_method(getattr(backend_class, name)) for name in TIMED_METHODS
+    }
+    namespace["__module__"] = __name__
+    namespace["__doc__"] = f"`{backend_class.__name__}` com medição de tempo."
+    return type(f"Timed{backend_class.__name__}", (backend_class,), namespace)
+
+
+TimedRedisCache = with_request_timing(RedisCache)
+TimedLocMemCache = with_request_timing(LocMemCache)
@@ -0,0 +1,75 @@
+"""Serializadores para o backend Redis do cache do Django.
+
+Usados via ``CACHES["default"]["OPTIONS"]["serializer"]``. Mantêm a regra
+do `RedisSerializer` padrão (inteiros vão crus, para `incr`/`decr`
+atômicos) e comprimem com zlib valores a partir de
+``CACHE_COMPRESS_MIN_BYTES`` (0 desativa). Payloads zlib começam com
+``0x78``, byte que não inicia pickle (``0x80``) nem JSON, então valores
+comprimidos e não comprimidos convivem na mesma instância.
+"""
+
+import json
+import pickle
+import zlib
+
+from django.conf import settings
+
+ZLIB_HEADER = b"\x78"
+
+
+class CompressedSerializer:
+    """Base: aplica compressão sobre `_encode`/`_decode` das subclasses."""
+
+    def __init__(self, min_compress_bytes=None, level=1):
+        if min_compress_bytes is None:
+            min_compress_bytes = getattr(settings, "CACHE_COMPRESS_MIN_BYTES", 0)
+        self.min_compress_bytes = min_compress_bytes
+        self.level = level
+
+    def dumps(self, obj):
+        # Inteiros sem serialização para incr()/decr() atômicos no Redis
+        if type(obj) is int:
+            return obj
+        data = self._encode(obj)
+        if self.min_compress_bytes and len(data) >= self.min_compress_bytes:
+            return zlib.compress(data, self.level)
+        return data
+
+    def loads(self, data):
+        try:
+            return int(data)
+        except ValueError:
+            pass
+        if data[:1] == ZLIB_HEADER:
+            data = zlib.decompress(data)
+        return self._decode(data)
+
+    def _encode(self, obj) -> bytes:
+        raise NotImplementedError
+
+    def _decode(self, data: bytes):
+        raise NotImplementedError
+
+
+class PickleSerializer(CompressedSerializer):
+    """Pickle (aceita qualquer objeto, como as entidades do domínio)."""
+
+    def _encode(self, obj) -> bytes:
+        return pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+    def _decode(self, data: bytes):
+        return pickle.loads(data)
+
+
+class JSONSerializer(CompressedSerializer):
+    """JSON (interoperável; só tipos nativos de JSON).
+
+    Incompatível com ``USER_REPOSITORY_CACHE_ENABLED``, que guarda
+    entidades do domínio.
+    """
+
+    def _encode(self, obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def _decode(self, data: bytes):
+        return json.loads(data)
@@ -0,0 +1,229 @@
+"""Repositório de usuários com cache read-through (decorator).
+
+Envolve outro `UserRepository` (normalmente `DjangoUserRepository`) e guarda
+entidades `DomainUser` no cache do Django por ID e por email. Escritas via
+repositório e os sinais `post_save`/`post_delete` do modelo (ver
+`core.signals`) invalidam as entradas.
+"""
+
+import logging
+import threading
+from collections import Counter
+from typing import (
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
+
+from django.conf import settings
+from django.core.cache import caches
+
+from core.domain.data_access import (
+    BulkCreateFailure,
+    BulkCreateResult,
+    UserRepository,
+)
+from core.domain.entities.user import User as DomainUser
+from core.repositories.async_adapters import SyncToAsyncUserRepository
+
+logger = logging.getLogger(__name__)
+
+
+class CachedUserRepository(SyncToAsyncUserRepository):
+    """Decorator de `UserRepository` com cache por ID e por email.
+
+    Parameters
+    ----------
+    repository: UserRepository
+        Repositório real consultado em caso de miss.
+    ttl_by_id, ttl_by_email: int, opcional
+        TTL (segundos) de cada tipo de chave. Padrão vem de
+        ``settings.USER_REPOSITORY_CACHE_TTL_BY_ID`` / ``..._BY_EMAIL``.
+    """
+
+    key_format = "user_repo:%(kind)s:%(value)s"
+
+    # Contadores por processo (hit/miss por tipo de chave)
+    _stats: Counter = Counter()
+    _stats_lock = threading.Lock()
+
+    def __init__(
+        self,
+        repository: UserRepository,
+        ttl_by_id: Optional[int] = None,
+        ttl_by_email: Optional[int] = None,
+    ):
+        self.repository = repository
+        self.ttl_by_id = (
+            ttl_by_id
+            if ttl_by_id is not None
+            else getattr(settings, "USER_REPOSITORY_CACHE_TTL_BY_ID", 300)
+        )
+        self.ttl_by_email = (
+            ttl_by_email
+            if ttl_by_email is not None
+            else getattr(settings, "USER_REPOSITORY_CACHE_TTL_BY_EMAIL", 300)
+        )
+
+    # Leituras com cache
+
+    def get_by_id(self, user_id: str) -> Optional[DomainUser]:
+        key = self.make_key("id", user_id)
+        user = self.get_cache().get(key)
+        if user is not None:
+            self._record("id", hit=True)
+            return user
+        self._record("id", hit=False)
+        user = self.repository.get_by_id(user_id)
+        if user is not None:
+            self._store(user)
+        return user
+
+    def get_user_by_email(self, email: str) -> Optional[DomainUser]:
+        key = self.make_key("email", email)
+        user = self.get_cache().get(key)
+        if user is not None:
+            self._record("email", hit=True)
+            return user
+        self._record("email", hit=False)
+        user = self.repository.get_user_by_email(email)
+        if user is not None:
+            self._store(user)
+        return user
+
+    def get_by_ids(self, user_ids: Iterable[str]) -> Dict[str, DomainUser]:
+        unique_ids = list(dict.fromkeys(str(user_id) for user_id in user_ids))
+        keys = {self.make_key("id", user_id): user_id for user_id in unique_ids}
+        cached = {
+            keys[key]: user
+            for key, user in self.get_cache().get_many(list(keys)).items()
+        }
+        # A chave "id" é compartilhada com `get_by_id`, que devolve
+        # superusuários; aqui eles ficam de fora, como no repositório
+        users = {
+            user_id: user for user_id, user in cached.items() if not user.is_superuser
+        }
+
+        missing = [user_id for user_id in unique_ids if user_id not in cached]
+        self._record("id", hit=True, amount=len(cached))
+        self._record("id", hit=False, amount=len(missing))
+        if missing:
+            fetched = self.repository.get_by_ids(missing)
+            for user in fetched.values():
+                self._store(user)
+            users.update(fetched)
+        return users
+
+    # Escritas com invalidação
+
+    def create(self, user: DomainUser) -> DomainUser:
+        created = self.repository.create(user)
+        self.invalidate(created.id, created.email)
+        return created
+
+    def check_bulk_create(self, users: Sequence[DomainUser]) -> List[BulkCreateFailure]:
+        return self.repository.check_bulk_create(users)
+
+    def bulk_create(
+        self,
+        users: Sequence[DomainUser],
+        password_hashes: Sequence[str],
+        batch_size: int,
+    ) -> BulkCreateResult:
+        # Usuários novos não têm entradas no cache (misses não são guardados)
+        return self.repository.bulk_create(users, password_hashes, batch_size)
+
+    def update(self, user: DomainUser) -> DomainUser:
+        updated = self.repository.update(user)
+        self.invalidate(updated.id, user.email)
+        return updated
+
+    def delete(self, user_id: str) -> None:
+        self.repository.delete(user_id)
+        self.invalidate(user_id)
+
+    # Listagens não são cacheadas
+
+    def get_all(self) -> List[DomainUser]:
+        return self.repository.get_all()
+
+    def get_all_paginated_filtered(
+        self, offset: int, limit: int, search_query: Optional[str]
+    ) -> tuple[List[DomainUser], int]:
+        return self.repository.get_all_paginated_filtered(
+            offset=offset, limit=limit, search_query=search_query
+        )
+
+    def get_page_after_cursor(
+        self, cursor: Optional[str], limit: int, search_query: Optional[str]
+    ) -> tuple[List[DomainUser], Optional[str]]:
+        return self.repository.get_page_after_cursor(
+            cursor=cursor, limit=limit, search_query=search_query
+        )
+
+    def iter_filtered(
+        self, search_query: Optional[str], chunk_size: int
+    ) -> Iterator[DomainUser]:
+        return self.repository.iter_filtered(search_query, chunk_size)
+
+    def aiter_filtered(
+        self, search_query: Optional[str], chunk_size: int
+    ) -> AsyncIterator[DomainUser]:
+        return self.repository.aiter_filtered(search_query, chunk_size)
+
+    # Infraestrutura do cache
+
+    @staticmethod
+    def get_cache():
+        """Retorna o cache configurado em ``USER_REPOSITORY_CACHE_ALIAS``."""
+        return caches[getattr(settings, "USER_REPOSITORY_CACHE_ALIAS", "default")]
+
+    @classmethod
+    def make_key(cls, kind: str, value: str) -> str:
+        """Monta a chave de cache (`kind` é ``id`` ou ``email``)."""
+        return cls.key_format % {"kind": kind, "value": value}
+
+    @classmethod
+    def invalidate(cls, user_id: str, email: Optional[str] = None) -> None:
+        """Remove as entradas do usuário, incluindo o email antigo em cache."""
+        cache = cls.get_cache()
+        id_key = cls.make_key("id", user_id)
+        keys = [id_key]
+        cached = cache.get(id_key)
+        if cached is not None:
+            keys.append(cls.make_key("email", cached.email))
+        if email:
+            keys.append(cls.make_key("email", email))
+        cache.delete_many(keys)
+
+    def _store(self, user: DomainUser) -> None:
+        cache = self.get_cache()
+        cache.set(self.make_key("id", user.id), user, self.ttl_by_id)
+        cache.set(self.make_key("email", user.email), user, self.ttl_by_email)
+
+    @classmethod
+    def _record(cls, kind: str, hit: bool, amount: int = 1) -> None:
+        if not amount:
+            return
+        with cls._stats_lock:
+            cls._stats[f"{kind}_{'hits' if hit else 'misses'}"] += amount
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, int]:
+        """Retorna contadores de hit/miss deste processo por tipo de chave."""
+        with cls._stats_lock:
+            stats = dict(cls._stats)
+        for kind in ("id", "email"):
+            stats.setdefault(f"{kind}_hits", 0)
+            stats.setdefault(f"{kind}_misses", 0)
+        return stats
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        """Zera os contadores de hit/miss."""
+        with cls._stats_lock:
+            cls._stats.clear()
@@ -0,0 +1,136 @@
+"""Estratégias de contagem do total de itens em listagens paginadas.
+
+`COUNT(*)` em tabelas grandes com filtro `icontains` domina o tempo da
+listagem. Cada estratégia troca exatidão por custo de forma diferente e
+sinaliza o resultado via `ItemCount.exact`.
+"""
+
+import hashlib
+import logging
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import QuerySet
+
+from core.domain.data_access import ItemCount
+
+logger = logging.getLogger(__name__)
+
+
+class CountStrategy(ABC):
+    """Contrato para calcular o total de itens de um queryset filtrado."""
+
+    @abstractmethod
+    def count(self, queryset: QuerySet, search_query: Optional[str]) -> ItemCount:
+        """Retorna o total de itens do queryset."""
+        pass
+
+
+class ExactCountStrategy(CountStrategy):
+    """Executa `COUNT(*)` completo (comportamento padrão)."""
+
+    def count(self, queryset: QuerySet, search_query: Optional[str]) -> ItemCount:
+        return ItemCount(queryset.count(), exact=True)
+
+
+class CappedCountStrategy(CountStrategy):
+    """Conta no máximo `cap` linhas; acima disso retorna `cap` inexato ("10000+")."""
+
+    def __init__(self, cap: int = 10000):
+        self.cap = cap
+
+    def count(self, queryset: QuerySet, search_query: Optional[str]) -> ItemCount:
+        # COUNT sobre subquery com LIMIT: o banco para após cap + 1 linhas
+        total = queryset.values("pk")[: self.cap + 1].count()
+        if total > self.cap:
+            return ItemCount(self.cap, exact=False)
+        return ItemCount(total, exact=True)
+
+
+class EstimatedCountStrategy(CountStrategy):
+    """Usa a estimativa do planner (`pg_class.reltuples`) em consultas sem filtro.
+
+    Consultas filtradas, bancos que não são PostgreSQL e tabelas pequenas
+    (estimativa abaixo de `threshold`) caem para a contagem exata.
+    """
+
+    def __init__(self, threshold: int = 10000):
+        self.threshold = threshold
+
+    def count(self, queryset: QuerySet, search_query: Optional[str]) -> ItemCount:
+        if not search_query:
+            estimate = self._estimate(queryset)
+            if estimate is not None and estimate >= self.threshold:
+                return ItemCount(estimate, exact=False)
+        return ItemCount(queryset.count(), exact=True)
+
+    def _estimate(self, queryset: QuerySet) -> Optional[int]:
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples = -1 quando a tabela nunca foi analisada (ANALYZE)
+        if not row or row[0] is None or row[0] < 0:
+            return None
+        return int(row[0])
+
+
+class CachedCountStrategy(CountStrategy):
+    """Guarda o total por `search_query` no cache do Django por `ttl` segundos.
+
+    Um valor vindo do cache pode estar desatualizado em até `ttl` segundos,
+    por isso é sinalizado como inexato.
+    """
+
+    cache_format = "user_list_count_%(digest)s"
+
+    def __init__(self, ttl: int = 30, fallback: Optional[CountStrategy] = None):
+        self.ttl = ttl
+        self.fallback = fallback or ExactCountStrategy()
+
+    def count(self, queryset: QuerySet, search_query: Optional[str]) -> ItemCount:
+        key = self.get_cache_key(search_query)
+        cached = cache.get(key)
+        if cached is not None:
+            return ItemCount(cached, exact=False)
+
+        total = self.fallback.count(queryset, search_query)
+        cache.set(key, int(total), self.ttl)
+        return total
+
+    def get_cache_key(self, search_query: Optional[str]) -> str:
+        """Gera chave de cache estável (hash) para a query de busca."""
+        digest = hashlib.sha256((search_query or "").encode("utf-8")).hexdigest()
+        return self.cache_format % {"digest": digest}
+
+
+def get_count_strategy(name: Optional[str] = None) -> CountStrategy:
+    """Constrói a estratégia de contagem configurada em settings.
+
+    Parameters
+    ----------
+    name: str, opcional
+        Um de ``exact``, ``capped``, ``estimate`` ou ``cached``. Se omitido,
+        usa ``settings.USER_LIST_COUNT_STRATEGY``.
+    """
+    name = name or getattr(settings, "USER_LIST_COUNT_STRATEGY", "exact")
+    cap = getattr(settings, "USER_LIST_COUNT_CAP", 10000)
+    if name == "exact":
+        return ExactCountStrategy()
+    if name == "capped":
+        return CappedCountStrategy(cap=cap)
+    if name == "estimate":
+        return EstimatedCountStrategy(threshold=cap)
+    if name == "cached":
+        return CachedCountStrategy(
+            ttl=getattr(settings, "USER_LIST_COUNT_CACHE_TTL", 30)
+        )
+    raise ValueError(f"Unknown count strategy: {name}")
@@ -0,0 +1,249 @@
+"""Pool limitado de threads para hashing de senhas.
+
+PBKDF2 consome centenas de milissegundos de CPU por verificação. Executá-lo
+em um pool com capacidade fixa (workers + fila) evita que uma rajada de
+logins ocupe todos os workers do servidor: quando o pool está saturado a
+chamada falha imediatamente com `CapacityExceededError`, que a API traduz
+em ``503`` com ``Retry-After``.
+
+`hashlib.pbkdf2_hmac` libera o GIL, então threads dão paralelismo real.
+
+O limite só tem efeito com concorrência dentro do processo (views
+assíncronas sob ASGI ou workers com threads): num worker WSGI síncrono há
+uma requisição por vez e o pool nunca satura. O caminho síncrono (`run`)
+executa o hash na própria thread chamadora, que esperaria de qualquer
+forma, sem a troca de thread do executor; ele ainda ocupa uma vaga e um dos
+``max_workers``, então os limites valem para os dois caminhos. As métricas
+(`stats`) ficam em ``GET /v1/metrics/``.
+
+Importações em lote usam um pool de processos à parte (`hash_passwords`):
+não há requisição esperando, então não faz sentido falhar rápido, e
+processos cobrem também hashers que não liberam o GIL.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+import structlog
+
+from core.domain.exceptions import CapacityExceededError
+from core.repositories.request_timing import timed
+
+logger = structlog.get_logger(__name__)
+
+
+class HashingPool:
+    """Executor com limite de tarefas em andamento (executando + na fila).
+
+    Parameters
+    ----------
+    max_workers: int
+        Threads de hashing simultâneas.
+    queue_limit: int
+        Tarefas aguardando além das que estão executando.
+    retry_after: int
+        Segundos sugeridos ao cliente quando o pool está saturado.
+    """
+
+    def __init__(self, max_workers: int, queue_limit: int, retry_after: int = 1):
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.retry_after = retry_after
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(max_workers + queue_limit)
+        # Hashes simultâneos, somando threads do executor e chamadores de `run`
+        self._workers = threading.BoundedSemaphore(max_workers)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> Future:
+        """Agenda `func(*args)`; falha rápido se não houver vaga."""
+        self._acquire_slot()
+        try:
+            future = self._get_executor().submit(
+                self._track, time.monotonic(), func, *args
+            )
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Executa na thread chamadora, dentro dos limites do pool.
+
+        Caminho síncrono: falha rápido sem vaga e, com todos os
+        ``max_workers`` ocupados, espera a vez como uma tarefa na fila.
+        """
+        with timed("hash"):
+            self._acquire_slot()
+            try:
+                return self._track(time.monotonic(), func, *args)
+            finally:
+                self._release()
+
+    async def run_async(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Executa no pool sem bloquear o event loop (caminho assíncrono)."""
+        with timed("hash"):
+            return await asyncio.wrap_future(self.submit(func, *args))
+
+    def stats(self) -> Dict[str, Any]:
+        """Métricas de utilização deste processo.
+
+        ``wait_*_ms`` é o tempo entre a entrada no pool e o início do hash.
+        """
+        with self._lock:
+            started = self._completed + self._running
+            return {
+                "max_workers": self.max_workers,
+                "queue_limit": self.queue_limit,
+                "in_flight": self._in_flight,
+                "running": self._running,
+                "queued": self._in_flight - self._running,
+                "utilization": self._running / self.max_workers,
+                "completed_total": self._completed,
+                "rejected_total": self._rejected,
+                "wait_avg_ms": (self._wait_total / started * 1000 if started else 0.0),
+                "wait_max_ms": self._wait_max * 1000,
+            }
+
+    def shutdown(self) -> None:
+        """Encerra as threads do pool (usado em testes)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Criado sob demanda: evita threads no processo master antes do fork
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="password-hashing",
+                    )
+        return self._executor
+
+    def _acquire_slot(self) -> None:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            logger.warning("Password hashing pool saturated", **self.stats())
+            raise CapacityExceededError(
+                "Password hashing capacity exceeded", retry_after=self.retry_after
+            )
+        with self._lock:
+            self._in_flight += 1
+
+    def _track(self, enqueued_at: float, func: Callable[..., Any], *args: Any) -> Any:
+        with self._workers:
+            wait = time.monotonic() - enqueued_at
+            with self._lock:
+                self._running += 1
+                self._wait_total += wait
+                self._wait_max = max(self._wait_max, wait)
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+
+_hashing_pool: Optional[HashingPool] = None
+_hashing_pool_lock = threading.Lock()
+
+
+def get_hashing_pool() -> HashingPool:
+    """Retorna o pool do processo, configurado por settings."""
+    global _hashing_pool
+    if _hashing_pool is None:
+        with _hashing_pool_lock:
+            if _hashing_pool is None:
+                _hashing_pool = HashingPool(
+                    max_workers=getattr(settings, "PASSWORD_HASHING_POOL_SIZE", None)
+                    or os.cpu_count()
+                    or 1,
+                    queue_limit=getattr(settings, "PASSWORD_HASHING_QUEUE_LIMIT", 8),
+                    retry_after=getattr(settings, "PASSWORD_HASHING_RETRY_AFTER", 1),
+                )
+    return _hashing_pool
+
+
+_bulk_executor: Optional[ProcessPoolExecutor] = None
+_bulk_executor_lock = threading.Lock()
+
+
+def _init_bulk_worker() -> None:
+    # Com "spawn"/"forkserver" o processo filho começa sem o Django configurado
+    import django
+
+    django.setup()
+
+
+def get_bulk_hashing_workers() -> int:
+    """Processos do pool de hashing em lote (0 em settings = CPUs)."""
+    return (
+        getattr(settings, "PASSWORD_BULK_HASHING_PROCESSES", 0) or os.cpu_count() or 1
+    )
+
+
+def get_bulk_hashing_executor() -> ProcessPoolExecutor:
+    """Retorna o pool de processos do processo atual, criado sob demanda."""
+    global _bulk_executor
+    if _bulk_executor is None:
+        with _bulk_executor_lock:
+            if _bulk_executor is None:
+                _bulk_executor = ProcessPoolExecutor(
+                    max_workers=get_bulk_hashing_workers(),
+                    initializer=_init_bulk_worker,
+                )
+    return _bulk_executor
+
+
+def hash_passwords(
+    raw_passwords: Sequence[Optional[str]], processes: Optional[int] = None
+) -> List[str]:
+    """Gera hashes em lote, distribuindo as senhas entre processos.
+
+    ``None`` gera uma senha inutilizável no próprio processo (não há hash a
+    calcular). Com um único worker (`processes`, padrão
+    `get_bulk_hashing_workers`), tudo roda no processo atual.
+    """
+    hashes: List[Optional[str]] = [
+        make_password(None) if raw is None else None for raw in raw_passwords
+    ]
+    pending = [index for index, raw in enumerate(raw_passwords) if raw is not None]
+    if not pending:
+        return hashes
+
+    workers = processes or get_bulk_hashing_workers()
+    with timed("hash"):
+        if workers <= 1:
+            computed = [make_password(raw_passwords[index]) for index in pending]
+        else:
+            chunksize = max(1, len(pending) // (workers * 4))
+            computed = get_bulk_hashing_executor().map(
+                make_password,
+                [raw_passwords[index] for index in pending],
+                chunksize=chunksize,
+            )
+        for index, encoded in zip(pending, computed):
+            hashes[index] = encoded
+    return hashes
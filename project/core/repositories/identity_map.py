@@ -0,0 +1,121 @@
+"""Identity map por requisição para instâncias de modelos Django.
+
+Dentro de um escopo ativo (aberto pelo `IdentityMapMiddleware`), cada
+entidade é carregada do banco no máximo uma vez por formato: instâncias
+completas (usadas pelo `DjangoAuthGateway`, que precisa do hash de senha) e
+linhas projetadas (tuplas de `values_list` dos repositórios). Quem lê a
+projeção reaproveita também uma instância completa já carregada. Fora de um
+escopo, `get_identity_map()` retorna ``None`` e o código segue o caminho sem
+cache.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple, Type, TypeVar, cast
+
+from django.db.models import Model
+
+M = TypeVar("M", bound=Model)
+
+_current_identity_map: ContextVar[Optional["IdentityMap"]] = ContextVar(
+    "identity_map", default=None
+)
+
+
+class IdentityMap:
+    """Registro de instâncias e linhas projetadas por `(modelo, campo, valor)`.
+
+    Toda entrada é indexada pela chave primária (campo ``pk``) e,
+    opcionalmente, por campos únicos adicionais (ex.: ``email``).
+    """
+
+    def __init__(self):
+        self._instances: Dict[Tuple[str, str, str], Model] = {}
+        self._rows: Dict[Tuple[str, str, str], tuple] = {}
+
+    def get(self, model: Type[M], field: str, value: Any) -> Optional[M]:
+        """Retorna a instância registrada ou ``None``."""
+        return cast(Optional[M], self._instances.get(self._key(model, field, value)))
+
+    def add(self, instance: M, *fields: str) -> M:
+        """Registra a instância pela PK e pelos campos informados."""
+        model = type(instance)
+        self._instances[self._key(model, "pk", instance.pk)] = instance
+        for field in fields:
+            self._instances[self._key(model, field, getattr(instance, field))] = (
+                instance
+            )
+        return instance
+
+    def get_or_load(
+        self, model: Type[M], field: str, value: Any, aliases: Tuple[str, ...] = ()
+    ) -> M:
+        """Retorna a instância registrada ou a carrega do banco e registra.
+
+        Raises
+        ------
+        model.DoesNotExist
+            Se a entidade não existir.
+        """
+        instance = self.get(model, field, value)
+        if instance is None:
+            instance = model._default_manager.get(**{field: value})
+            self.add(instance, *aliases)
+        return instance
+
+    def get_row(self, model: Type[Model], field: str, value: Any) -> Optional[tuple]:
+        """Retorna a linha projetada registrada ou ``None``."""
+        return self._rows.get(self._key(model, field, value))
+
+    def add_row(self, model: Type[Model], pk: Any, row: tuple, **aliases: Any) -> tuple:
+        """Registra uma linha projetada pela PK e pelos campos informados."""
+        self._rows[self._key(model, "pk", pk)] = row
+        for field, value in aliases.items():
+            self._rows[self._key(model, field, value)] = row
+        return row
+
+    def discard(self, model: Type[Model], pk: Any) -> None:
+        """Remove todas as entradas (instância e linha) com a PK informada."""
+        instance = self.get(model, "pk", pk)
+        if instance is not None:
+            self._instances = {
+                key: value
+                for key, value in self._instances.items()
+                if value is not instance
+            }
+        row = self.get_row(model, "pk", pk)
+        if row is not None:
+            self._rows = {
+                key: value for key, value in self._rows.items() if value is not row
+            }
+
+    def clear(self) -> None:
+        """Esvazia o mapa."""
+        self._instances.clear()
+        self._rows.clear()
+
+    def __len__(self) -> int:
+        return len({id(instance) for instance in self._instances.values()}) + len(
+            {id(row) for row in self._rows.values()}
+        )
+
+    @staticmethod
+    def _key(model: Type[Model], field: str, value: Any) -> Tuple[str, str, str]:
+        return (model._meta.label, field, str(value))
+
+
+def get_identity_map() -> Optional[IdentityMap]:
+    """Retorna o identity map do escopo atual, se houver."""
+    return _current_identity_map.get()
+
+
+@contextmanager
+def identity_map_scope() -> Iterator[IdentityMap]:
+    """Abre um escopo com um identity map novo, limpo ao final."""
+    identity_map = IdentityMap()
+    token = _current_identity_map.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        identity_map.clear()
+        _current_identity_map.reset(token)
@@ -0,0 +1,105 @@
+"""Medição de tempo por requisição, agregada por categoria.
+
+Dentro de um escopo ativo (aberto pelo `ServerTimingMiddleware` nas
+requisições amostradas), `timed(nome)` soma a duração do bloco ao
+`RequestTimings` corrente. Fora de um escopo, é um no-op barato. Como o
+escopo fica em um `ContextVar`, ele acompanha a requisição nas threads do
+`sync_to_async` e nas tasks das views assíncronas.
+
+Categorias registradas:
+
+- ``db``: cada query, via `execute_wrapper` instalado em toda conexão
+  aberta (`install_db_timing`, chamado em `CoreConfig.ready`);
+- ``cache``: operações dos backends de `core.repositories.cache_backends`;
+- ``hash``: hashing de senhas no pool (`core.repositories.hashing_pool`);
+- ``serialize``: renderização das respostas (`core.api.renderers`).
+"""
+
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, FrozenSet, Iterator, Optional
+
+from django.db.backends.signals import connection_created
+
+_current_timings: ContextVar[Optional["RequestTimings"]] = ContextVar(
+    "request_timings", default=None
+)
+# Categorias com bloco `timed` aberto: blocos aninhados da mesma categoria
+# (ex.: `get_many` chamando `get`) contam uma vez só
+_open_categories: ContextVar[FrozenSet[str]] = ContextVar(
+    "request_timing_open", default=frozenset()
+)
+
+
+class RequestTimings:
+    """Duração (segundos) e número de operações por categoria."""
+
+    def __init__(self):
+        self.durations: Dict[str, float] = defaultdict(float)
+        self.counts: Dict[str, int] = defaultdict(int)
+
+    def add(self, category: str, seconds: float) -> None:
+        self.durations[category] += seconds
+        self.counts[category] += 1
+
+
+def get_request_timings() -> Optional[RequestTimings]:
+    """Medições da requisição corrente ou ``None`` fora de um escopo."""
+    return _current_timings.get()
+
+
+@contextmanager
+def request_timing_scope() -> Iterator[RequestTimings]:
+    """Abre um escopo de medição para uma requisição."""
+    timings = RequestTimings()
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+@contextmanager
+def timed(category: str) -> Iterator[None]:
+    """Soma a duração do bloco em `category`, se houver escopo ativo."""
+    timings = _current_timings.get()
+    open_categories = _open_categories.get()
+    if timings is None or category in open_categories:
+        yield
+        return
+
+    token = _open_categories.set(open_categories | {category})
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(category, time.perf_counter() - start)
+        _open_categories.reset(token)
+
+
+def _time_query(execute, sql, params, many, context):
+    if _current_timings.get() is None:
+        return execute(sql, params, many, context)
+    with timed("db"):
+        return execute(sql, params, many, context)
+
+
+def _install_on_connection(sender, connection, **kwargs):
+    # `connection_created` dispara a cada reconexão do mesmo wrapper
+    if _time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_time_query)
+
+
+def install_db_timing() -> None:
+    """Instala a medição de queries em toda conexão aberta daqui em diante.
+
+    Fica instalado permanentemente (e não por requisição com
+    ``connection.execute_wrapper``) porque nas views assíncronas as queries
+    rodam em outra thread, com outra conexão; fora de um escopo o wrapper
+    só lê o `ContextVar`.
+    """
+    connection_created.connect(
+        _install_on_connection, dispatch_uid="core_install_db_timing"
+    )
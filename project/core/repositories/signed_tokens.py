@@ -0,0 +1,189 @@
+"""Access tokens autocontidos, assinados com HMAC.
+
+Alternativa aos tokens opacos (aleatórios) do django-oauth-toolkit, que
+exigem consulta ao banco a cada requisição. O token carrega as claims
+(usuário, aplicação, escopo, expiração, emissão e um ``jti``) assinadas com
+HMAC-SHA256 via `django.core.signing` e é verificado no próprio processo:
+
+    sat1.<kid>.<claims em base64>:<assinatura>
+
+- **Rotação de chaves:** ``OAUTH2_SIGNED_TOKEN_KEYS`` mapeia ``kid ->
+  segredo`` e ``OAUTH2_SIGNED_TOKEN_ACTIVE_KEY`` escolhe a chave que
+  assina; as demais só verificam. O ``kid`` entra no salt, então não pode
+  ser trocado sem invalidar a assinatura.
+- **Revogação:** lista no cache padrão, compacta porque cada entrada expira
+  junto com o que revoga: ``jti`` revogados (`revoke`) e, por usuário e
+  aplicação, o instante de corte (`revoke_user`, usado por
+  `DjangoAuthGateway.create_tokens` ao emitir um novo par).
+- **Formato por aplicação:** só as aplicações cujo ``client_id`` está em
+  ``OAUTH2_SIGNED_TOKEN_APPLICATIONS`` recebem tokens assinados.
+
+A revogação depende de cache compartilhado (Redis): com o cache em
+processo, um token revogado segue válido nos demais workers até expirar.
+"""
+
+import secrets
+from dataclasses import dataclass, field
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+
+TOKEN_PREFIX = "sat1."
+SIGNING_SALT = "core.signed_tokens:%s"
+REVOKED_TOKEN_KEY = "oauth2_signed:revoked:%s"
+REVOKED_USER_KEY = "oauth2_signed:revoked_before:%s:%s"
+
+
+@dataclass
+class SignedAccessToken:
+    """Claims verificadas de um token assinado.
+
+    Expõe a mesma interface de validação do `AccessToken` do
+    django-oauth-toolkit (`is_valid`, `allow_scopes`, `is_expired`), usada
+    pelas permissões do DRF via ``request.auth``.
+    """
+
+    token: str
+    kid: str
+    user_id: str
+    application_id: int
+    scope: str
+    expires: datetime
+    issued_at: int  # milissegundos desde a época
+    jti: str
+    user: Any = field(default=None, repr=False)
+
+    @classmethod
+    def from_claims(cls, token: str, kid: str, claims: Dict) -> "SignedAccessToken":
+        return cls(
+            token=token,
+            kid=kid,
+            user_id=claims["sub"],
+            application_id=claims["app"],
+            scope=claims["scope"],
+            expires=datetime.fromtimestamp(claims["exp"], tz=dt_timezone.utc),
+            issued_at=claims["iat"],
+            jti=claims["jti"],
+        )
+
+    @property
+    def scopes(self) -> Dict[str, str]:
+        return {scope: scope for scope in self.scope.split()}
+
+    def is_expired(self) -> bool:
+        return timezone.now() >= self.expires
+
+    def allow_scopes(self, scopes) -> bool:
+        if not scopes:
+            return True
+        return set(scopes).issubset(self.scope.split())
+
+    def is_valid(self, scopes=None) -> bool:
+        return not self.is_expired() and self.allow_scopes(scopes)
+
+
+def uses_signed_tokens(application) -> bool:
+    """Se a aplicação emite tokens assinados em vez de opacos."""
+    return application.client_id in settings.OAUTH2_SIGNED_TOKEN_APPLICATIONS
+
+
+def is_signed_token(token: str) -> bool:
+    return token.startswith(TOKEN_PREFIX)
+
+
+def _keys() -> Tuple[str, Dict[str, str]]:
+    """``(kid ativo, kid -> segredo)`` a partir das settings."""
+    keys = settings.OAUTH2_SIGNED_TOKEN_KEYS
+    if not keys:
+        raise ImproperlyConfigured(
+            "OAUTH2_SIGNED_TOKEN_KEYS must define at least one signing key"
+        )
+    active = settings.OAUTH2_SIGNED_TOKEN_ACTIVE_KEY or next(iter(keys))
+    if active not in keys:
+        raise ImproperlyConfigured(
+            f"OAUTH2_SIGNED_TOKEN_ACTIVE_KEY {active!r} is not in OAUTH2_SIGNED_TOKEN_KEYS"
+        )
+    return active, keys
+
+
+def _signer(kid: str, secret: str) -> signing.Signer:
+    return signing.Signer(key=secret, salt=SIGNING_SALT % kid, algorithm="sha256")
+
+
+def issue(
+    user_id, application, scope: str, expires: datetime, issued_at: datetime
+) -> str:
+    """Assina um novo access token com a chave ativa."""
+    kid, keys = _keys()
+    claims = {
+        "sub": str(user_id),
+        "app": application.pk,
+        "scope": scope,
+        "exp": int(expires.timestamp()),
+        "iat": _millis(issued_at),
+        "jti": secrets.token_urlsafe(12),
+    }
+    return f"{TOKEN_PREFIX}{kid}.{_signer(kid, keys[kid]).sign_object(claims)}"
+
+
+def verify(token: str) -> Optional[SignedAccessToken]:
+    """Verifica assinatura, expiração e revogação; None se inválido.
+
+    Não consulta o banco; a revogação custa uma ida ao cache.
+    """
+    if not is_signed_token(token):
+        return None
+    kid, _, signed = token[len(TOKEN_PREFIX) :].partition(".")
+    secret = settings.OAUTH2_SIGNED_TOKEN_KEYS.get(kid)
+    if secret is None:
+        return None
+    try:
+        claims = _signer(kid, secret).unsign_object(signed)
+        access_token = SignedAccessToken.from_claims(token, kid, claims)
+    except (signing.BadSignature, KeyError, TypeError, ValueError):
+        return None
+    if access_token.is_expired() or _is_revoked(access_token):
+        return None
+    return access_token
+
+
+def _is_revoked(access_token: SignedAccessToken) -> bool:
+    token_key = REVOKED_TOKEN_KEY % access_token.jti
+    user_key = REVOKED_USER_KEY % (access_token.user_id, access_token.application_id)
+    revoked = cache.get_many([token_key, user_key])
+    if token_key in revoked:
+        return True
+    revoked_before = revoked.get(user_key)
+    return revoked_before is not None and access_token.issued_at < revoked_before
+
+
+def revoke(token: str) -> bool:
+    """Revoga um token até a sua expiração; False se já era inválido."""
+    access_token = verify(token)
+    if access_token is None:
+        return False
+    remaining = (access_token.expires - timezone.now()).total_seconds()
+    cache.set(REVOKED_TOKEN_KEY % access_token.jti, 1, int(remaining) + 1)
+    return True
+
+
+def revoke_user(user_id, application_id, before: datetime) -> None:
+    """Revoga os tokens do usuário na aplicação emitidos antes de `before`.
+
+    A entrada vive pela validade de um access token: depois disso, tudo o
+    que ela revoga já expirou.
+    """
+    cache.set(
+        REVOKED_USER_KEY % (str(user_id), application_id),
+        _millis(before),
+        settings.OAUTH2_PROVIDER["ACCESS_TOKEN_EXPIRE_SECONDS"],
+    )
+
+
+def _millis(value: datetime) -> int:
+    return int(value.timestamp() * 1000)
@@ -0,0 +1,203 @@
+"""Cache de access tokens OAuth2 já validados.
+
+Cada requisição autenticada faria um SELECT em `AccessToken` com JOIN em
+usuário e aplicação. `AccessTokenCache` guarda, pelo ``token_checksum``
+(SHA-256 do token, a mesma chave de busca do django-oauth-toolkit), os
+campos do usuário, o escopo e a expiração, e remonta o par
+``(user, access_token)`` sem consultar o banco.
+
+A entrada vale por no máximo ``OAUTH2_TOKEN_CACHE_TTL`` segundos, sem
+passar da expiração do token, e é invalidada (após o commit):
+
+- quando `DjangoAuthGateway.create_tokens` revoga os tokens anteriores;
+- quando um `AccessToken` é salvo ou removido pelo ORM (revogação pelo
+  endpoint ``/o/revoke_token/``, admin, `purge_expired_tokens`);
+- quando o usuário é alterado (ver `core.signals`).
+
+Tokens assinados (`core.repositories.signed_tokens`) não precisam da
+entrada de token, mas usam a do usuário (`get_or_load_user`), com o mesmo
+TTL e invalidada junto com os tokens do usuário.
+
+Os valores são só tipos nativos de JSON, compatíveis com os dois
+serializadores de `core.repositories.cache_serializers`. Com o cache em
+processo (sem Redis), a invalidação só alcança o worker onde ocorreu: os
+demais podem aceitar um token revogado até o TTL, por isso o cache vem
+desativado (TTL 0) quando não há ``REDIS_URL``.
+"""
+
+import hashlib
+import uuid
+from datetime import datetime, timezone as dt_timezone
+from functools import partial
+from typing import Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import router, transaction
+from django.utils import timezone
+from oauth2_provider.models import AccessToken
+
+from core.repositories.user_repository_impl import DOMAIN_USER_FIELDS
+
+User = get_user_model()
+
+# Colunas de `AccessToken` remontadas a partir da entrada; as demais ficam
+# adiadas
+ACCESS_TOKEN_FIELDS = (
+    "id",
+    "user_id",
+    "application_id",
+    "token",
+    "token_checksum",
+    "expires",
+    "scope",
+)
+
+
+def token_checksum(token: str) -> str:
+    """Checksum usado pelo django-oauth-toolkit para buscar o token."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def dump_user(user: User) -> list:
+    """Valores de DOMAIN_USER_FIELDS em tipos nativos de JSON."""
+    return [
+        str(value) if isinstance(value, uuid.UUID) else value
+        for value in (getattr(user, field) for field in DOMAIN_USER_FIELDS)
+    ]
+
+
+def load_user(values: list) -> User:
+    """Remonta o usuário de `dump_user` sem consultar o banco.
+
+    Campos fora de DOMAIN_USER_FIELDS ficam adiados (carregados sob
+    demanda), então um `save()` não sobrescreve senha etc.
+    """
+    return User.from_db(
+        router.db_for_read(User),
+        DOMAIN_USER_FIELDS,
+        [
+            User._meta.get_field(field).to_python(value)
+            for field, value in zip(DOMAIN_USER_FIELDS, values)
+        ],
+    )
+
+
+class AccessTokenCache:
+    """Mapa `token_checksum -> (usuário, escopo, expiração)` no cache do Django."""
+
+    key_format = "oauth2_token:%s"
+    user_key_format = "oauth2_token:user:%s"
+
+    def __init__(self, ttl: Optional[int] = None):
+        self._ttl = ttl
+
+    @property
+    def ttl(self) -> int:
+        if self._ttl is not None:
+            return self._ttl
+        return getattr(settings, "OAUTH2_TOKEN_CACHE_TTL", 0)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def make_key(self, checksum: str) -> str:
+        return self.key_format % checksum
+
+    def get(self, token: str) -> Optional[Tuple[User, AccessToken]]:
+        """Remonta `(user, access_token)` do cache; None em miss ou expirado."""
+        if not self.enabled:
+            return None
+        checksum = token_checksum(token)
+        entry = cache.get(self.make_key(checksum))
+        if entry is None:
+            return None
+        expires = datetime.fromtimestamp(entry["expires"], tz=dt_timezone.utc)
+        if expires <= timezone.now():
+            return None
+
+        user = load_user(entry["user"])
+        access_token = AccessToken.from_db(
+            router.db_for_read(AccessToken),
+            ACCESS_TOKEN_FIELDS,
+            (
+                entry["id"],
+                user.pk,
+                entry["application_id"],
+                token,
+                checksum,
+                expires,
+                entry["scope"],
+            ),
+        )
+        access_token.user = user
+        return user, access_token
+
+    def set(self, user: User, access_token: AccessToken) -> None:
+        """Guarda um token validado até o TTL ou a expiração, o que vier antes."""
+        if not self.enabled:
+            return
+        remaining = (access_token.expires - timezone.now()).total_seconds()
+        timeout = int(min(self.ttl, remaining))
+        if timeout <= 0:
+            return
+        entry = {
+            "id": access_token.pk,
+            "application_id": access_token.application_id,
+            "scope": access_token.scope,
+            "expires": access_token.expires.timestamp(),
+            "user": dump_user(user),
+        }
+        cache.set(self.make_key(access_token.token_checksum), entry, timeout)
+
+    def get_or_load_user(self, user_id) -> Optional[User]:
+        """Usuário de um token autocontido (assinado), sem token no banco.
+
+        Guarda os mesmos campos das entradas de token, pelo mesmo TTL;
+        None se o usuário não existe.
+        """
+        key = self.user_key_format % user_id
+        if self.enabled:
+            values = cache.get(key)
+            if values is not None:
+                return load_user(values)
+        try:
+            user = User.objects.only(*DOMAIN_USER_FIELDS).get(pk=user_id)
+        except (User.DoesNotExist, ValidationError):
+            return None
+        if self.enabled:
+            cache.set(key, dump_user(user), self.ttl)
+        return user
+
+    def invalidate(self, checksums: Iterable[str], using: Optional[str] = None) -> None:
+        """Remove as entradas após o commit da transação em `using`.
+
+        Antes do commit, outra requisição ainda veria o token no banco e
+        voltaria a guardá-lo.
+        """
+        if not self.enabled:
+            return
+        keys = [self.make_key(checksum) for checksum in checksums if checksum]
+        if keys:
+            transaction.on_commit(partial(cache.delete_many, keys), using=using)
+
+    def invalidate_user(self, user_id, using: Optional[str] = None) -> None:
+        """Remove as entradas de todos os tokens do usuário e a do usuário."""
+        if not self.enabled:
+            return
+        using = using or router.db_for_write(AccessToken)
+        transaction.on_commit(
+            partial(cache.delete, self.user_key_format % user_id), using=using
+        )
+        self.invalidate(
+            AccessToken.objects.using(using)
+            .filter(user_id=user_id)
+            .values_list("token_checksum", flat=True),
+            using=using,
+        )
+
+
+access_token_cache = AccessTokenCache()
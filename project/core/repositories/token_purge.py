@@ -0,0 +1,197 @@
+"""Remoção em lotes de tokens OAuth2 expirados.
+
+`DjangoAuthGateway.create_tokens` só apaga os tokens do usuário que faz
+login; os de usuários que não voltam ficam na tabela para sempre.
+`purge_expired_tokens` os remove em lotes de tamanho fixo, cada um na sua
+transação curta e com uma pausa entre lotes, para não segurar locks nem
+competir com o tráfego de login.
+
+As regras seguem as do ``cleartokens`` do django-oauth-toolkit e são
+aplicadas nesta ordem:
+
+- refresh tokens revogados há mais de ``REFRESH_TOKEN_EXPIRE_SECONDS``;
+- refresh tokens cujo access token expirou há mais de
+  ``REFRESH_TOKEN_EXPIRE_SECONDS``;
+- refresh tokens sem access token (emitidos com tokens assinados, ver
+  `core.repositories.signed_tokens`) criados há mais de
+  ``REFRESH_TOKEN_EXPIRE_SECONDS``;
+- access tokens expirados sem refresh token (inclusive os liberados pelas
+  regras anteriores).
+
+Diferente do ``cleartokens``, nenhum lote faz ``COUNT``: cada regra é
+percorrida por PK crescente (keyset) e o último ID processado fica no cache
+padrão. Uma execução interrompida ou limitada por ``time_limit`` continua
+dali na próxima; ao terminar a regra, o checkpoint é descartado. Com o
+cache em processo (sem Redis) o checkpoint não sobrevive ao processo, mas
+a limpeza é idempotente: recomeçar só repassa o trecho já limpo.
+
+Não há agendador no projeto; a função pode ser chamada de qualquer um
+(cron, CronJob do Kubernetes, Celery beat) ou via
+``python manage.py purge_expired_tokens``.
+"""
+
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import router, transaction
+from django.db.models import Q
+from django.utils import timezone
+from oauth2_provider.models import AccessToken, RefreshToken
+from oauth2_provider.settings import oauth2_settings
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+CHECKPOINT_KEY = "token_purge:last_id:{rule}"
+
+
+@dataclass
+class PurgeStats:
+    """Resultado de uma regra: linhas removidas, lotes e tempo gasto."""
+
+    rule: str
+    deleted: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+    last_id: int = 0
+    completed: bool = False
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.deleted / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class PurgeReport:
+    """Resultado de uma execução de `purge_expired_tokens`."""
+
+    rules: List[PurgeStats] = field(default_factory=list)
+
+    @property
+    def deleted(self) -> int:
+        return sum(stats.deleted for stats in self.rules)
+
+    @property
+    def elapsed(self) -> float:
+        return sum(stats.elapsed for stats in self.rules)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.deleted / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def completed(self) -> bool:
+        return all(stats.completed for stats in self.rules)
+
+
+def _purge_rules(now: datetime):
+    """Regras `(nome, modelo, condição)` na ordem em que são aplicadas."""
+    rules = []
+    refresh_expire_seconds = oauth2_settings.REFRESH_TOKEN_EXPIRE_SECONDS
+    if refresh_expire_seconds:
+        refresh_cutoff = now - timedelta(seconds=refresh_expire_seconds)
+        rules += [
+            ("refresh_revoked", RefreshToken, Q(revoked__lt=refresh_cutoff)),
+            (
+                "refresh_expired",
+                RefreshToken,
+                Q(access_token__expires__lt=refresh_cutoff),
+            ),
+            # Emitidos junto com access tokens assinados, que não são gravados
+            (
+                "refresh_orphaned",
+                RefreshToken,
+                Q(
+                    access_token__isnull=True,
+                    revoked__isnull=True,
+                    created__lt=refresh_cutoff,
+                ),
+            ),
+        ]
+    rules.append(
+        ("access_expired", AccessToken, Q(refresh_token__isnull=True, expires__lt=now))
+    )
+    return rules
+
+
+def purge_expired_tokens(
+    batch_size: Optional[int] = None,
+    sleep: Optional[float] = None,
+    time_limit: Optional[float] = None,
+    resume: bool = True,
+    on_batch: Optional[Callable[[PurgeStats], None]] = None,
+    now: Optional[datetime] = None,
+) -> PurgeReport:
+    """Remove os tokens expirados em lotes de `batch_size` linhas.
+
+    Args:
+        batch_size: Linhas por lote (padrão: ``TOKEN_PURGE_BATCH_SIZE``).
+        sleep: Pausa em segundos entre lotes (padrão:
+            ``TOKEN_PURGE_BATCH_SLEEP``).
+        time_limit: Tempo máximo em segundos; ao estourar, nenhum lote novo
+            é iniciado (o primeiro sempre roda) e o checkpoint fica para a
+            próxima execução.
+        resume: Continua do checkpoint gravado por uma execução anterior.
+        on_batch: Chamado após cada lote com as estatísticas da regra.
+        now: Instante de referência (padrão: agora).
+    """
+    if batch_size is None:
+        batch_size = settings.TOKEN_PURGE_BATCH_SIZE
+    if sleep is None:
+        sleep = settings.TOKEN_PURGE_BATCH_SLEEP
+    now = now or timezone.now()
+    deadline = time.monotonic() + time_limit if time_limit is not None else None
+
+    def time_is_up():
+        return deadline is not None and time.monotonic() >= deadline
+
+    rules = _purge_rules(now)
+    report = PurgeReport(rules=[PurgeStats(rule=rule) for rule, _, _ in rules])
+    ran_batch = False
+    for stats, (rule, model, condition) in zip(report.rules, rules):
+        key = CHECKPOINT_KEY.format(rule=rule)
+        stats.last_id = (cache.get(key) or 0) if resume else 0
+        db = router.db_for_write(model)
+        queryset = model.objects.using(db).filter(condition)
+        while not (ran_batch and time_is_up()):
+            started = time.monotonic()
+            ids = list(
+                queryset.filter(pk__gt=stats.last_id)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not ids:
+                stats.elapsed += time.monotonic() - started
+                stats.completed = True
+                cache.delete(key)
+                break
+
+            # Reaplica a condição: a linha pode ter mudado desde o SELECT
+            with transaction.atomic(using=db):
+                _, deleted = queryset.filter(pk__in=ids).delete()
+            stats.deleted += deleted.get(model._meta.label, 0)
+            stats.batches += 1
+            stats.last_id = ids[-1]
+            stats.elapsed += time.monotonic() - started
+            cache.set(key, stats.last_id, None)
+            ran_batch = True
+            if on_batch is not None:
+                on_batch(stats)
+
+            # Lote incompleto: a regra acabou, a próxima consulta só confirma
+            if sleep and len(ids) == batch_size and not time_is_up():
+                time.sleep(sleep)
+        if not stats.completed:
+            break
+
+    logger.info(
+        "Expired OAuth2 tokens purged",
+        deleted=report.deleted,
+        rows_per_second=round(report.rows_per_second, 1),
+        completed=report.completed,
+    )
+    return report
@@ -1,41 +1,148 @@
+import base64
+import binascii
+import json
 import logging
-from typing import List, Optional
+from itertools import repeat
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
 
-from core.domain.data_access import UserRepository
+from core.domain.data_access import (
+    BulkCreateFailure,
+    BulkCreateResult,
+)
 from core.domain.entities.user import User as DomainUser
 from core.domain.exceptions import EntityNotFoundException
 from core.models.user import User as DjangoUser
+from core.repositories.async_adapters import SyncToAsyncUserRepository
+from core.repositories.count_strategies import CountStrategy, get_count_strategy
+from core.repositories.identity_map import IdentityMap, get_identity_map
+from asgiref.sync import sync_to_async
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, connections, router, transaction
 from django.db.models import Q
 
 logger = logging.getLogger(__name__)
 
+# Ordenação estável usada pela paginação por cursor (keyset).
+# `email` é único, `id` garante desempate determinístico.
+KEYSET_ORDERING = ("email", "id")
 
-class DjangoUserRepository(UserRepository):
+# Tamanho máximo de cada `IN (...)` em buscas em lote, abaixo do limite de
+# parâmetros por consulta do SQLite (999 em versões antigas) e do PostgreSQL.
+IN_QUERY_CHUNK_SIZE = 500
+
+# Colunas lidas nos caminhos de leitura, na ordem dos campos de `DomainUser`
+# usados em `_row_to_domain_user`. Evita carregar `password`/`last_login` e
+# instanciar modelos completos.
+DOMAIN_USER_FIELDS = (
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+)
+
+
+def _encode_cursor(email: str, user_id: str) -> str:
+    """Serializa a posição `(email, id)` em um cursor opaco (base64 url-safe)."""
+    raw = json.dumps([email, user_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    """Recupera a posição `(email, id)` de um cursor opaco.
+
+    Raises
+    ------
+    ValueError
+        Se o cursor estiver malformado.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        email, user_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(email, str) or not isinstance(user_id, str):
+        raise ValueError("Invalid cursor")
+    return email, user_id
+
+
+class DjangoUserRepository(SyncToAsyncUserRepository):
     """Implementação Django do `UserRepository`.
 
     Responsável por mapear `core.models.user.User` para a entidade de
     domínio `core.domain.entities.user.User` e oferecer operações de
     persistência e consulta.
+
+    O total das listagens paginadas é calculado por uma `CountStrategy`
+    (padrão: ``settings.USER_LIST_COUNT_STRATEGY``).
     """
 
+    def __init__(self, count_strategy: Optional[CountStrategy] = None):
+        self.count_strategy = count_strategy or get_count_strategy()
+
     def get_by_id(self, user_id: str) -> Optional[DomainUser]:
+        identity_map = get_identity_map()
+        if identity_map is not None:
+            return self._get_through_identity_map(identity_map, "pk", user_id)
         try:
-            user = DjangoUser.objects.get(id=user_id)
+            row = self._rows().get(id=user_id)
             logger.debug("User found by ID: %s", user_id)
-            return self._to_domain_user(user)
+            return self._row_to_domain_user(row)
         except DjangoUser.DoesNotExist:
             logger.warning("User not found by ID: %s", user_id)
             return None
 
+    def get_by_ids(self, user_ids: Iterable[str]) -> Dict[str, DomainUser]:
+        """Busca usuários em lote com uma consulta `IN` por bloco de IDs.
+
+        Superusuários ficam de fora, como na listagem e na exportação.
+        """
+        unique_ids = list(dict.fromkeys(str(user_id) for user_id in user_ids))
+        users: Dict[str, DomainUser] = {}
+        queryset = self._rows(DjangoUser.objects.exclude(is_superuser=True))
+        for start in range(0, len(unique_ids), IN_QUERY_CHUNK_SIZE):
+            chunk = unique_ids[start : start + IN_QUERY_CHUNK_SIZE]
+            for row in queryset.filter(id__in=chunk):
+                domain_user = self._row_to_domain_user(row)
+                users[domain_user.id] = domain_user
+        logger.debug("Found %s of %s users by IDs", len(users), len(unique_ids))
+        return users
+
     def get_user_by_email(self, email: str) -> Optional[DomainUser]:
+        identity_map = get_identity_map()
+        if identity_map is not None:
+            return self._get_through_identity_map(identity_map, "email", email)
         try:
-            user = DjangoUser.objects.get(email=email)
+            row = self._rows().get(email=email)
             logger.debug("User found by email: %s", email)
-            return self._to_domain_user(user)
+            return self._row_to_domain_user(row)
         except DjangoUser.DoesNotExist:
             logger.warning("User not found by email: %s", email)
             return None
 
+    async def aget_by_id(self, user_id: str) -> Optional[DomainUser]:
+        return await self._aget_one("pk", user_id)
+
+    async def aget_user_by_email(self, email: str) -> Optional[DomainUser]:
+        return await self._aget_one("email", email)
+
+    async def _aget_one(self, field: str, value: str) -> Optional[DomainUser]:
+        """Leitura assíncrona por campo único (ORM async do Django)."""
+        identity_map = get_identity_map()
+        if identity_map is not None:
+            return await sync_to_async(self._get_through_identity_map)(
+                identity_map, field, value
+            )
+        try:
+            row = await self._rows().aget(**{field: value})
+        except DjangoUser.DoesNotExist:
+            logger.warning("User not found by %s: %s", field, value)
+            return None
+        return self._row_to_domain_user(row)
+
     def create(self, user: DomainUser) -> DomainUser:
         """Cria um usuário Django a partir da entidade de domínio.
 
@@ -51,32 +158,229 @@ class DjangoUserRepository(UserRepository):
         logger.info("User created successfully with ID: %s", django_user.id)
         return self._to_domain_user(django_user)
 
+    def bulk_create(
+        self,
+        users: Sequence[DomainUser],
+        password_hashes: Sequence[str],
+        batch_size: int,
+    ) -> BulkCreateResult:
+        """Cria usuários em lote com `bulk_create(batch_size=...)`.
+
+        Repete as checagens de `check_bulk_create`, que protegem também
+        chamadas diretas. Se uma inserção concorrente gerar `IntegrityError`,
+        o lote é refeito linha a linha com savepoints.
+        """
+        rows, failures = self._bulk_candidates(users, password_hashes)
+        try:
+            with transaction.atomic():
+                DjangoUser.objects.bulk_create(
+                    [instance for _, instance in rows], batch_size=batch_size
+                )
+            created = [instance for _, instance in rows]
+        except IntegrityError:
+            logger.warning(
+                "Bulk insert conflicted; retrying %s users row by row", len(rows)
+            )
+            created = []
+            for index, instance in rows:
+                try:
+                    with transaction.atomic():
+                        instance.save(force_insert=True)
+                    created.append(instance)
+                except IntegrityError:
+                    failures.append(
+                        self._duplicate_failure(
+                            index, instance.email, "User with this email exists."
+                        )
+                    )
+
+        logger.info("Bulk created %s users (%s rejected)", len(created), len(failures))
+        failures.sort(key=lambda failure: failure.index)
+        return BulkCreateResult(
+            created=[self._to_domain_user(instance) for instance in created],
+            failures=failures,
+        )
+
+    def check_bulk_create(self, users: Sequence[DomainUser]) -> List[BulkCreateFailure]:
+        """Valida as linhas com `full_clean` e checa emails repetidos/existentes.
+
+        Custa uma consulta `IN` por bloco de emails, sem gravar nada.
+        """
+        # A senha fica fora do `full_clean`: qualquer valor serve aqui
+        _, failures = self._bulk_candidates(users, repeat(UNUSABLE_PASSWORD_PREFIX))
+        failures.sort(key=lambda failure: failure.index)
+        return failures
+
+    def _bulk_candidates(
+        self, users: Sequence[DomainUser], password_hashes: Iterable[str]
+    ) -> tuple[List[tuple[int, DjangoUser]], List[BulkCreateFailure]]:
+        """Instâncias inseríveis (com a posição na entrada) e linhas rejeitadas."""
+        failures: List[BulkCreateFailure] = []
+        candidates: Dict[str, tuple[int, DjangoUser]] = {}
+        for index, (user, encoded) in enumerate(zip(users, password_hashes)):
+            instance = DjangoUser(
+                id=user.id,
+                email=DjangoUser.objects.normalize_email(user.email),
+                first_name=user.first_name,
+                last_name=user.last_name,
+                is_active=user.is_active,
+                password=encoded,
+            )
+            try:
+                instance.full_clean(
+                    exclude=("password", "last_login"), validate_unique=False
+                )
+            except DjangoValidationError as exc:
+                failures.append(BulkCreateFailure(index, user.email, exc.message_dict))
+                continue
+            if instance.email in candidates:
+                failures.append(
+                    self._duplicate_failure(index, user.email, "Duplicated in input.")
+                )
+                continue
+            candidates[instance.email] = (index, instance)
+
+        for email in self._existing_emails(list(candidates)):
+            index, _ = candidates.pop(email)
+            failures.append(
+                self._duplicate_failure(index, email, "User with this email exists.")
+            )
+        return list(candidates.values()), failures
+
+    @staticmethod
+    def _existing_emails(emails: List[str]) -> set[str]:
+        existing: set[str] = set()
+        for start in range(0, len(emails), IN_QUERY_CHUNK_SIZE):
+            chunk = emails[start : start + IN_QUERY_CHUNK_SIZE]
+            existing.update(
+                DjangoUser.objects.filter(email__in=chunk).values_list(
+                    "email", flat=True
+                )
+            )
+        return existing
+
+    @staticmethod
+    def _duplicate_failure(index: int, email: str, message: str) -> BulkCreateFailure:
+        return BulkCreateFailure(index, email, {"email": [message]})
+
     def update(self, user: DomainUser) -> DomainUser:
-        """Atualiza campos básicos de perfil do usuário."""
+        """Atualiza campos básicos de perfil do usuário.
+
+        Executa um único ``UPDATE ... WHERE id = ... RETURNING`` apenas com
+        os campos de perfil; a ausência de linha afetada indica usuário
+        inexistente.
+        """
         logger.info("Attempting to update user with ID: %s", user.id)
-        try:
-            django_user = DjangoUser.objects.get(id=user.id)
-            django_user.email = user.email
-            django_user.first_name = user.first_name
-            django_user.last_name = user.last_name
-            # is_active, is_staff, is_superuser não são mais atributos diretos aqui
-            # As permissões são gerenciadas pelo PermissionsMixin
-            django_user.save()
-            logger.info("User updated successfully with ID: %s", django_user.id)
-            return self._to_domain_user(django_user)
-        except DjangoUser.DoesNotExist:
+        changes = {
+            "email": user.email,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+        }
+        # is_active, is_staff, is_superuser não são alterados aqui
+        # As permissões são gerenciadas pelo PermissionsMixin
+        connection = connections[router.db_for_write(DjangoUser)]
+        if connection.features.can_return_columns_from_insert:
+            row = self._update_returning(connection, user.id, changes)
+        else:
+            # Bancos sem RETURNING: UPDATE filtrado + leitura projetada
+            updated = DjangoUser.objects.filter(id=user.id).update(**changes)
+            row = self._rows().get(id=user.id) if updated else None
+
+        self._discard_from_identity_map(user.id)
+        if row is None:
             logger.warning("Update failed: User not found with ID: %s", user.id)
             raise EntityNotFoundException("User", user.id)
+        self._invalidate_cached_tokens(user.id, connection.alias)
+        logger.info("User updated successfully with ID: %s", user.id)
+        return self._row_to_domain_user(row)
 
     def delete(self, user_id: str) -> None:
+        """Remove o usuário com um DELETE filtrado, sem leitura prévia.
+
+        Relações (tokens OAuth2, grupos, permissões) continuam sendo
+        removidas pelo collector do Django, que usa deletes em massa
+        quando não há sinais envolvidos.
+        """
         logger.info("Attempting to delete user with ID: %s", user_id)
-        try:
-            user = DjangoUser.objects.get(id=user_id)
-            user.delete()
-            logger.info("User deleted successfully with ID: %s", user_id)
-        except DjangoUser.DoesNotExist:
+        _, deleted_per_model = DjangoUser.objects.filter(id=user_id).delete()
+        self._discard_from_identity_map(user_id)
+        if not deleted_per_model.get(DjangoUser._meta.label):
             logger.warning("Delete failed: User not found with ID: %s", user_id)
             raise EntityNotFoundException("User", user_id)
+        logger.info("User deleted successfully with ID: %s", user_id)
+
+    def _get_through_identity_map(
+        self, identity_map: IdentityMap, field: str, value: str
+    ) -> Optional[DomainUser]:
+        """Leitura compartilhada com o identity map da requisição.
+
+        Reaproveita a instância completa se o `DjangoAuthGateway` já a
+        carregou; senão lê e registra só a projeção (`DOMAIN_USER_FIELDS`),
+        sem o hash de senha.
+        """
+        django_user = identity_map.get(DjangoUser, field, value)
+        if django_user is not None:
+            return self._to_domain_user(django_user)
+        row = identity_map.get_row(DjangoUser, field, value)
+        if row is None:
+            try:
+                row = self._rows().get(**{field: value})
+            except DjangoUser.DoesNotExist:
+                logger.warning("User not found by %s: %s", field, value)
+                return None
+            identity_map.add_row(DjangoUser, row[0], row, email=row[1])
+        return self._row_to_domain_user(row)
+
+    @staticmethod
+    def _discard_from_identity_map(user_id: str) -> None:
+        identity_map = get_identity_map()
+        if identity_map is not None:
+            identity_map.discard(DjangoUser, user_id)
+
+    @staticmethod
+    def _invalidate_cached_tokens(user_id: str, using: str) -> None:
+        """Descarta as cópias do usuário no cache de tokens após o commit.
+
+        O UPDATE direto não dispara ``post_save``, que faz isso nos demais
+        caminhos de escrita.
+        """
+        # Importação local: token_cache importa DOMAIN_USER_FIELDS deste módulo
+        from core.repositories.token_cache import access_token_cache
+
+        access_token_cache.invalidate_user(user_id, using=using)
+
+    @staticmethod
+    def _update_returning(connection, user_id: str, changes: dict) -> Optional[tuple]:
+        """Executa UPDATE ... RETURNING e devolve a linha em `DOMAIN_USER_FIELDS`."""
+        meta = DjangoUser._meta
+        qn = connection.ops.quote_name
+        assignments = ", ".join(
+            f"{qn(meta.get_field(name).column)} = %s" for name in changes
+        )
+        returning = ", ".join(
+            qn(meta.get_field(name).column) for name in DOMAIN_USER_FIELDS
+        )
+        sql = (
+            f"UPDATE {qn(meta.db_table)} SET {assignments} "
+            f"WHERE {qn(meta.pk.column)} = %s RETURNING {returning}"
+        )
+        pk_value = meta.pk.get_db_prep_value(user_id, connection)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [*changes.values(), pk_value])
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        # Valores crus do driver: UUID pode vir como hex (SQLite), bool como int
+        pk, email, first_name, last_name, is_active, is_staff, is_superuser = row
+        return (
+            meta.pk.to_python(pk),
+            email,
+            first_name,
+            last_name,
+            bool(is_active),
+            bool(is_staff),
+            bool(is_superuser),
+        )
 
     def _to_domain_user(self, django_user: DjangoUser) -> DomainUser:
         return DomainUser(
@@ -89,16 +393,119 @@ class DjangoUserRepository(UserRepository):
             is_superuser=django_user.is_superuser,  # PermissionsMixin tem is_superuser
         )
 
+    @staticmethod
+    def _rows(queryset=None):
+        """Projeta o queryset apenas nas colunas de `DOMAIN_USER_FIELDS`."""
+        if queryset is None:
+            queryset = DjangoUser.objects.all()
+        return queryset.values_list(*DOMAIN_USER_FIELDS)
+
+    @staticmethod
+    def _row_to_domain_user(row: tuple) -> DomainUser:
+        """Constrói `DomainUser` direto da tupla de `DOMAIN_USER_FIELDS`."""
+        user_id, email, first_name, last_name, is_active, is_staff, is_superuser = row
+        return DomainUser(
+            id=str(user_id),
+            email=email,
+            first_name=first_name,
+            last_name=last_name,
+            is_active=is_active,
+            is_staff=is_staff,
+            is_superuser=is_superuser,
+        )
+
     def get_all(self) -> List[DomainUser]:
         # A propriedade is_superuser é acessada diretamente via PermissionsMixin
-        django_users = DjangoUser.objects.exclude(
-            is_superuser=True
+        rows = self._rows(
+            DjangoUser.objects.exclude(is_superuser=True)
         )  # Excluir superusuários por padrão
-        return [self._to_domain_user(user) for user in django_users]
+        return [self._row_to_domain_user(row) for row in rows]
 
     def get_all_paginated_filtered(
         self, offset: int, limit: int, search_query: Optional[str]
     ) -> tuple[List[DomainUser], int]:
+        queryset = self._filtered_queryset(search_query)
+        total_items = self.count_strategy.count(queryset, search_query)
+        rows = self._rows(queryset)[offset : offset + limit]
+        return [self._row_to_domain_user(row) for row in rows], total_items
+
+    async def aget_all_paginated_filtered(
+        self, offset: int, limit: int, search_query: Optional[str]
+    ) -> tuple[List[DomainUser], int]:
+        queryset = self._filtered_queryset(search_query)
+        # Estratégias de contagem são síncronas (algumas consultam o cache)
+        total_items = await sync_to_async(self.count_strategy.count)(
+            queryset, search_query
+        )
+        rows = self._rows(queryset)[offset : offset + limit]
+        return [self._row_to_domain_user(row) async for row in rows], total_items
+
+    def get_page_after_cursor(
+        self, cursor: Optional[str], limit: int, search_query: Optional[str]
+    ) -> tuple[List[DomainUser], Optional[str]]:
+        """Lista usuários por keyset `(email, id)` a partir de um cursor opaco.
+
+        Diferente do offset, o custo de cada página independe da sua posição:
+        o banco parte direto do índice em `email` em vez de descartar linhas.
+        """
+        # Busca um registro extra para saber se há próxima página sem COUNT
+        rows = self._rows(self._keyset_queryset(cursor, search_query))[: limit + 1]
+        return self._keyset_page([self._row_to_domain_user(row) for row in rows], limit)
+
+    async def aget_page_after_cursor(
+        self, cursor: Optional[str], limit: int, search_query: Optional[str]
+    ) -> tuple[List[DomainUser], Optional[str]]:
+        rows = self._rows(self._keyset_queryset(cursor, search_query))[: limit + 1]
+        return self._keyset_page(
+            [self._row_to_domain_user(row) async for row in rows], limit
+        )
+
+    def iter_filtered(
+        self, search_query: Optional[str], chunk_size: int
+    ) -> Iterator[DomainUser]:
+        """Itera o filtro com cursor do lado do servidor (`QuerySet.iterator`).
+
+        No PostgreSQL as linhas vêm em blocos de `chunk_size` de um cursor
+        nomeado; a ordenação por `KEYSET_ORDERING` usa o índice de `email`.
+        """
+        # Sem `aiter_filtered` próprio: `aiterator()` sobre `values_list`
+        # executa a consulta no event loop; o padrão herdado de
+        # `SyncToAsyncUserRepository` itera este gerador em blocos via
+        # `sync_to_async`.
+        rows = self._rows(self._ordered_queryset(search_query))
+        for row in rows.iterator(chunk_size=chunk_size):
+            yield self._row_to_domain_user(row)
+
+    def _ordered_queryset(self, search_query: Optional[str]):
+        """Queryset filtrado em ordem estável (`KEYSET_ORDERING`)."""
+        return self._filtered_queryset(search_query).order_by(*KEYSET_ORDERING)
+
+    def _keyset_queryset(self, cursor: Optional[str], search_query: Optional[str]):
+        """Queryset ordenado por `KEYSET_ORDERING` a partir da posição do cursor."""
+        queryset = self._ordered_queryset(search_query)
+        if cursor:
+            last_email, last_id = _decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(email__gt=last_email) | Q(email=last_email, id__gt=last_id)
+            )
+        return queryset
+
+    @staticmethod
+    def _keyset_page(
+        users: List[DomainUser], limit: int
+    ) -> tuple[List[DomainUser], Optional[str]]:
+        """Corta a página (lida com `limit + 1`) e gera o próximo cursor."""
+        has_next = len(users) > limit
+        users = users[:limit]
+
+        next_cursor = None
+        if has_next:
+            last = users[-1]
+            next_cursor = _encode_cursor(last.email, last.id)
+        return users, next_cursor
+
+    def _filtered_queryset(self, search_query: Optional[str]):
+        """Monta o queryset base de listagem (sem superusuários) com busca."""
         queryset = DjangoUser.objects.exclude(is_superuser=True)
 
         if search_query:
@@ -108,12 +515,11 @@ class DjangoUserRepository(UserRepository):
                 search_query = None
 
         if search_query:
+            # No PostgreSQL, os índices GIN trigram da migração 0004 cobrem
+            # UPPER(coluna) LIKE, que é o SQL gerado por icontains.
             queryset = queryset.filter(
                 Q(email__icontains=search_query)
                 | Q(first_name__icontains=search_query)
                 | Q(last_name__icontains=search_query)
             )
-
-        total_items = queryset.count()
-        django_users = queryset[offset : offset + limit]
-        return [self._to_domain_user(user) for user in django_users], total_items
+        return queryset
@@ -0,0 +1,69 @@
+"""Receivers de sinais do app core.
+
+Conectados em `CoreConfig.ready`.
+"""
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from oauth2_provider.models import AccessToken, Application
+
+from core.models.user import User
+from core.repositories.application_cache import application_cache
+from core.repositories.cached_user_repository import CachedUserRepository
+from core.repositories.identity_map import get_identity_map
+from core.repositories.token_cache import access_token_cache
+
+
+@receiver(post_save, sender=User, dispatch_uid="core_invalidate_cached_user_save")
+@receiver(post_delete, sender=User, dispatch_uid="core_invalidate_cached_user_delete")
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Invalida o cache do repositório quando o usuário muda fora dele."""
+    # Sem o cache ativo não há entradas a remover: evita idas ao cache
+    if getattr(settings, "USER_REPOSITORY_CACHE_ENABLED", False):
+        CachedUserRepository.invalidate(str(instance.pk), instance.email)
+
+    # Outra instância do mesmo usuário foi salva/removida: a do identity map
+    # da requisição ficou desatualizada.
+    identity_map = get_identity_map()
+    if identity_map is not None and (
+        identity_map.get(sender, "pk", instance.pk) is not instance
+    ):
+        identity_map.discard(sender, instance.pk)
+
+
+@receiver(
+    post_save, sender=Application, dispatch_uid="core_invalidate_application_save"
+)
+@receiver(
+    post_delete, sender=Application, dispatch_uid="core_invalidate_application_delete"
+)
+def invalidate_cached_application(sender, instance, **kwargs):
+    """Descarta a `Application` em cache usada na emissão de tokens."""
+    application_cache.invalidate(instance.client_id)
+
+
+@receiver(post_save, sender=User, dispatch_uid="core_invalidate_user_tokens_save")
+@receiver(post_delete, sender=User, dispatch_uid="core_invalidate_user_tokens_delete")
+def invalidate_cached_user_tokens(sender, instance, using, **kwargs):
+    """Descarta os tokens em cache do usuário, que guardam cópia dos seus campos.
+
+    Também remove a entrada usada pelos tokens assinados, que sem ela
+    continuariam a autenticar um usuário removido até o TTL.
+    """
+    if not kwargs.get("created"):
+        access_token_cache.invalidate_user(instance.pk, using=using)
+
+
+@receiver(
+    post_save, sender=AccessToken, dispatch_uid="core_invalidate_access_token_save"
+)
+@receiver(
+    post_delete,
+    sender=AccessToken,
+    dispatch_uid="core_invalidate_access_token_delete",
+)
+def invalidate_cached_access_token(sender, instance, using, **kwargs):
+    """Descarta o token em cache quando é alterado ou revogado pelo ORM."""
+    access_token_cache.invalidate([instance.token_checksum], using=using)
@@ -0,0 +1,161 @@
+"""Testes de integração das views assíncronas (deploy ASGI)."""
+
+import json
+import uuid
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.api.v1.views.auth import AsyncLoginAPIView, LoginAPIView
+from core.api.v1.views.user import (
+    AsyncUserExportAPIView,
+    AsyncUserListAPIView,
+    AsyncUserRetrieveAPIView,
+    UserListAPIView,
+    UserRetrieveAPIView,
+)
+
+User = get_user_model()
+
+
+@pytest.fixture
+def factory():
+    return APIRequestFactory()
+
+
+@pytest.fixture
+def admin_user(db):
+    return User.objects.get(email="admin@example.com")
+
+
+@pytest.fixture
+def regular_user(db):
+    return User.objects.create_user(
+        email="async@example.com",
+        password="asyncpassword123",
+        first_name="Async",
+        last_name="User",
+    )
+
+
+def _call(view_class, request, **kwargs):
+    """Executa a view (síncrona ou assíncrona) e renderiza a resposta."""
+    view = view_class.as_view()
+    if view_class.view_is_async:
+        response = async_to_sync(view)(request, **kwargs)
+    else:
+        response = view(request, **kwargs)
+    response.render()
+    return response
+
+
+def test_async_views_are_marked_async():
+    """Testa que o Django despacha as novas views como corrotinas."""
+    for view_class in (
+        AsyncLoginAPIView,
+        AsyncUserExportAPIView,
+        AsyncUserListAPIView,
+        AsyncUserRetrieveAPIView,
+    ):
+        assert view_class.view_is_async
+    assert not UserRetrieveAPIView.view_is_async
+
+
+def test_async_retrieve_matches_sync(factory, admin_user, regular_user):
+    """Testa que a busca assíncrona devolve o mesmo payload da síncrona."""
+    responses = []
+    for view_class in (UserRetrieveAPIView, AsyncUserRetrieveAPIView):
+        request = factory.get(f"/v1/users/{regular_user.id}/")
+        force_authenticate(request, user=admin_user)
+        responses.append(_call(view_class, request, pk=regular_user.id))
+
+    sync_response, async_response = responses
+    assert async_response.status_code == status.HTTP_200_OK
+    assert async_response.data == sync_response.data
+    assert async_response.data["email"] == "async@example.com"
+
+
+def test_async_retrieve_not_found(factory, admin_user):
+    """Testa 404 pelo exception handler no caminho assíncrono."""
+    missing = uuid.uuid4()
+    request = factory.get(f"/v1/users/{missing}/")
+    force_authenticate(request, user=admin_user)
+
+    response = _call(AsyncUserRetrieveAPIView, request, pk=missing)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_async_retrieve_requires_admin(factory, regular_user):
+    """Testa que permissões continuam aplicadas no dispatch assíncrono."""
+    request = factory.get(f"/v1/users/{regular_user.id}/")
+    force_authenticate(request, user=regular_user)
+
+    response = _call(AsyncUserRetrieveAPIView, request, pk=regular_user.id)
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.parametrize(
+    "query", ["?limit=5", "?limit=5&cursor=", "?search_query=async"]
+)
+def test_async_list_matches_sync(factory, admin_user, regular_user, query):
+    """Testa listagem por offset, cursor e busca no caminho assíncrono."""
+    responses = []
+    for view_class in (UserListAPIView, AsyncUserListAPIView):
+        request = factory.get(f"/v1/users/list/{query}")
+        force_authenticate(request, user=admin_user)
+        responses.append(_call(view_class, request))
+
+    sync_response, async_response = responses
+    assert async_response.status_code == status.HTTP_200_OK
+    assert async_response.data == sync_response.data
+    emails = [item["email"] for item in async_response.data["items"]]
+    assert "async@example.com" in emails
+
+
+def test_async_login(factory, regular_user):
+    """Testa login assíncrono com credenciais válidas e inválidas."""
+    AsyncLoginAPIView.throttle_classes = []
+    try:
+        ok = _call(
+            AsyncLoginAPIView,
+            factory.post(
+                "/v1/login/",
+                {"email": "async@example.com", "password": "asyncpassword123"},
+                format="json",
+            ),
+        )
+        wrong = _call(
+            AsyncLoginAPIView,
+            factory.post(
+                "/v1/login/",
+                {"email": "async@example.com", "password": "wrong"},
+                format="json",
+            ),
+        )
+    finally:
+        AsyncLoginAPIView.throttle_classes = LoginAPIView.throttle_classes
+
+    assert ok.status_code == status.HTTP_200_OK
+    assert ok.data["access_token"]
+    assert wrong.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_async_export_streams_async_iterator(factory, admin_user, regular_user):
+    """Testa exportação com iterador assíncrono (sem buffer sob ASGI)."""
+    request = factory.get("/v1/users/export/?format=ndjson&search_query=async")
+    force_authenticate(request, user=admin_user)
+
+    response = async_to_sync(AsyncUserExportAPIView.as_view())(request)
+
+    async def collect():
+        return b"".join([chunk async for chunk in response])
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.is_async
+    rows = [json.loads(line) for line in async_to_sync(collect)().splitlines()]
+    assert [row["email"] for row in rows] == ["async@example.com"]
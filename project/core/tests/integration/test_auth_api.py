@@ -152,6 +152,28 @@ class AuthAPITest(APITestCase):
         self.assertIn("detail", response.data)
         self.assertEqual(response.data["detail"], "Erro interno do servidor")
 
+    @patch("core.api.v1.views.auth.get_login_user_use_case")
+    def test_login_hashing_pool_saturated(self, mock_get_use_case):
+        """Testa 503 com Retry-After quando o pool de hashing está saturado."""
+        from core.domain.exceptions import CapacityExceededError
+
+        mock_use_case = mock_get_use_case.return_value
+        mock_use_case.execute.side_effect = CapacityExceededError(
+            "Password hashing capacity exceeded", retry_after=2
+        )
+
+        response = self.client.post(
+            self.login_url,
+            {
+                "email": self.user_data["email"],
+                "password": self.user_data["password"],
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response["Retry-After"], "2")
+
     def test_login_throttled_exception(self):
         """Testa que exceção Throttled é re-lançada para DRF tratar."""
         from core.api.v1.views.auth import LoginAPIView
@@ -177,6 +199,9 @@ class AuthAPITest(APITestCase):
 
         # A última requisição deve retornar 429
         assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert int(response["Retry-After"]) > 0
+        assert response["RateLimit-Limit"] == "5"
+        assert response["RateLimit-Remaining"] == "0"
 
         # Desabilitar novamente para outros testes
         LoginAPIView.throttle_classes = []
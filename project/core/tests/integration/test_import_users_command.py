@@ -0,0 +1,79 @@
+"""Testes de integração do comando `import_users`."""
+
+import io
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def fast_hasher(settings):
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+def _run(*args):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    call_command("import_users", *args, stdout=stdout, stderr=stderr)
+    return stdout.getvalue(), stderr.getvalue()
+
+
+@pytest.mark.django_db
+def test_import_csv_in_batches(tmp_path):
+    """Testa CSV em lotes, com senha, senha vazia e linha inválida."""
+    path = tmp_path / "users.csv"
+    path.write_text(
+        "email,first_name,last_name,password,is_active\n"
+        "csv1@example.com,Ana,Silva,secret123,true\n"
+        "csv2@example.com,Bruno,Souza,,false\n"
+        "csv3@example.com,,Lima,secret123,true\n",
+        encoding="utf-8",
+    )
+
+    stdout, stderr = _run(str(path), "--batch-size", "2")
+
+    assert "3 linhas processadas: 2 criadas, 1 rejeitadas" in stdout
+    assert json.loads(stderr) == {
+        "row": 3,
+        "email": "csv3@example.com",
+        "errors": {"first_name": ["This field is required."]},
+    }
+    first = User.objects.get(email="csv1@example.com")
+    assert first.check_password("secret123")
+    second = User.objects.get(email="csv2@example.com")
+    assert not second.is_active
+    assert not second.has_usable_password()
+
+
+@pytest.mark.django_db
+def test_import_ndjson_reports_invalid_lines(tmp_path):
+    """Testa NDJSON com linha malformada e relatório em arquivo."""
+    path = tmp_path / "users.ndjson"
+    errors_path = tmp_path / "errors.ndjson"
+    path.write_text(
+        '{"email": "nd1@example.com", "first_name": "Nd", "last_name": "Um"}\n'
+        "{not json\n"
+        '{"email": "nd1@example.com", "first_name": "Nd", "last_name": "Dois"}\n',
+        encoding="utf-8",
+    )
+
+    _run(str(path), "--errors", str(errors_path))
+
+    failures = [json.loads(line) for line in errors_path.read_text().splitlines()]
+    assert [(f["row"], list(f["errors"])) for f in failures] == [
+        (2, ["non_field_errors"]),
+        (3, ["email"]),
+    ]
+    assert User.objects.filter(email="nd1@example.com").count() == 1
+
+
+def test_import_requires_known_format(tmp_path):
+    """Testa erro quando o formato não pode ser deduzido da extensão."""
+    path = tmp_path / "users.txt"
+    path.write_text("")
+
+    with pytest.raises(CommandError):
+        _run(str(path))
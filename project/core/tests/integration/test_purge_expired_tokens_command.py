@@ -0,0 +1,73 @@
+"""Testes de integração do comando `purge_expired_tokens`."""
+
+import io
+import uuid
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+from oauth2_provider.models import AccessToken, Application
+
+from core.models.user import User
+
+
+def _run(*args):
+    stdout = io.StringIO()
+    call_command("purge_expired_tokens", *args, stdout=stdout)
+    return stdout.getvalue()
+
+
+@pytest.fixture
+def expired_tokens():
+    cache.clear()
+    user = User.objects.create(
+        email="purge-cmd@example.com", first_name="Purge", last_name="Cmd"
+    )
+    application = Application.objects.create(
+        name="purge-cmd",
+        client_type=Application.CLIENT_CONFIDENTIAL,
+        authorization_grant_type=Application.GRANT_PASSWORD,
+    )
+    for _ in range(3):
+        AccessToken.objects.create(
+            user=user,
+            application=application,
+            token=uuid.uuid4().hex,
+            expires=timezone.now() - timedelta(hours=1),
+        )
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_command_reports_rate_and_batches(expired_tokens):
+    """Testa a remoção com progresso por lote e resumo em linhas/s."""
+    stdout = _run("--batch-size", "2", "--sleep", "0", "--verbosity", "2")
+
+    assert "access_expired: lote 1, 2 removidos" in stdout
+    assert "access_expired: 3 removidos em 2 lotes" in stdout
+    assert "Limpeza concluída: 3 tokens removidos" in stdout
+    assert "linhas/s" in stdout
+    assert not AccessToken.objects.exists()
+
+
+@pytest.mark.django_db
+def test_command_time_limit_leaves_checkpoint(expired_tokens):
+    """Testa que o limite de tempo para cedo e avisa da retomada."""
+    stdout = _run("--batch-size", "2", "--sleep", "0", "--time-limit", "0")
+
+    assert "Limite de tempo atingido: 2 tokens removidos" in stdout
+    assert "parou após o ID" in stdout
+    assert AccessToken.objects.count() == 1
+
+    assert "Limpeza concluída: 1 tokens removidos" in _run("--sleep", "0")
+
+
+@pytest.mark.django_db
+def test_command_rejects_invalid_options():
+    with pytest.raises(CommandError, match="--batch-size"):
+        _run("--batch-size", "0")
+    with pytest.raises(CommandError, match="--sleep"):
+        _run("--sleep", "-1")
@@ -0,0 +1,90 @@
+"""Testes de integração do endpoint de revogação com tokens assinados."""
+
+from datetime import timedelta
+
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from oauth2_provider.models import Application
+from rest_framework.test import APIClient
+
+from core.models.user import User
+from core.repositories import signed_tokens
+from core.repositories.application_cache import application_cache
+
+REVOKE_URL = reverse("oauth2_provider:revoke-token")
+
+
+@pytest.fixture(autouse=True)
+def signed_settings(settings):
+    settings.OAUTH2_SIGNED_TOKEN_KEYS = {"k1": "first-secret"}
+    settings.OAUTH2_SIGNED_TOKEN_ACTIVE_KEY = "k1"
+    settings.OAUTH2_SIGNED_TOKEN_APPLICATIONS = [settings.OAUTH2_CLIENT_ID]
+    cache.clear()
+    application_cache.invalidate()
+    yield settings
+    cache.clear()
+    application_cache.invalidate()
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(
+        email="revoke@example.com",
+        first_name="Revoke",
+        last_name="Token",
+        is_staff=True,
+    )
+
+
+def _issue(user, application):
+    now = timezone.now()
+    return signed_tokens.issue(
+        user.pk, application, "read write", now + timedelta(hours=1), now
+    )
+
+
+def _revoke(token, client_id, client_secret):
+    # O backend do projeto (JSONOAuthLibCore) só lê corpo JSON
+    return APIClient().post(
+        REVOKE_URL,
+        {"token": token, "client_id": client_id, "client_secret": client_secret},
+        format="json",
+    )
+
+
+@pytest.mark.django_db
+def test_revoke_endpoint_revokes_signed_token(user):
+    """Testa que /o/revoke_token/ invalida um token assinado."""
+    application = Application.objects.get(client_id=settings.OAUTH2_CLIENT_ID)
+    token = _issue(user, application)
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    assert client.get(reverse("core:user-list")).status_code == 200
+
+    response = _revoke(token, settings.OAUTH2_CLIENT_ID, "test-client-secret")
+
+    assert response.status_code == 200
+    assert signed_tokens.verify(token) is None
+    assert client.get(reverse("core:user-list")).status_code == 401
+
+
+@pytest.mark.django_db
+def test_revoke_endpoint_ignores_token_of_other_application(user):
+    """Testa que outra aplicação não revoga o token (e recebe 200)."""
+    application = Application.objects.get(client_id=settings.OAUTH2_CLIENT_ID)
+    Application.objects.create(
+        name="Other App",
+        client_id="other-client-id",
+        client_secret="other-client-secret",
+        client_type=Application.CLIENT_CONFIDENTIAL,
+        authorization_grant_type=Application.GRANT_PASSWORD,
+    )
+    token = _issue(user, application)
+
+    response = _revoke(token, "other-client-id", "other-client-secret")
+
+    assert response.status_code == 200
+    assert signed_tokens.verify(token) is not None
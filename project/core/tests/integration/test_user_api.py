@@ -1,7 +1,11 @@
+import csv
+import io
+import json
 import uuid
 from datetime import timedelta
 
 import pytest
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.utils import timezone
@@ -94,6 +98,7 @@ class UserAPITest(APITestCase):
         assert response.status_code == status.HTTP_200_OK
         assert "items" in response.data
         assert "total_items" in response.data
+        assert response.data["total_items_exact"] is True
 
     def test_retrieve_user_not_found(self):
         """Testa recuperação de usuário inexistente."""
@@ -124,6 +129,215 @@ class UserAPITest(APITestCase):
         assert response.status_code == status.HTTP_200_OK
         assert "items" in response.data
 
+    def test_list_users_as_admin_by_cursor(self):
+        for i in range(3):
+            User.objects.create_user(
+                email=f"page{i}@example.com",
+                password="pass",
+                first_name=f"Page{i}",
+                last_name="User",
+            )
+        self.client.force_authenticate(user=self.admin_user)
+        first = self.client.get(
+            f"{self.list_users_url}?limit=2&cursor=&search_query=page", format="json"
+        )
+        assert first.status_code == status.HTTP_200_OK
+        assert [u["email"] for u in first.data["items"]] == [
+            "page0@example.com",
+            "page1@example.com",
+        ]
+        assert first.data["total_items"] is None
+        assert first.data["next_cursor"]
+
+        second = self.client.get(
+            self.list_users_url,
+            {"limit": 2, "cursor": first.data["next_cursor"], "search_query": "page"},
+            format="json",
+        )
+        assert second.status_code == status.HTTP_200_OK
+        assert [u["email"] for u in second.data["items"]] == ["page2@example.com"]
+        assert second.data["next_cursor"] is None
+
+    def test_list_users_as_admin_invalid_cursor(self):
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.get(
+            f"{self.list_users_url}?cursor=invalid", format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_batch_get_users_as_admin(self):
+        self.client.force_authenticate(user=self.admin_user)
+        missing_id = str(uuid.uuid4())
+        response = self.client.post(
+            reverse("core:user-batch-get"),
+            {"ids": [str(self.regular_user.id), missing_id]},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [u["id"] for u in response.data["items"]] == [str(self.regular_user.id)]
+        assert response.data["not_found"] == [missing_id]
+
+    def test_batch_get_users_hides_superusers(self):
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.post(
+            reverse("core:user-batch-get"),
+            {"ids": [str(self.admin_user.id)]},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["items"] == []
+        assert response.data["not_found"] == [str(self.admin_user.id)]
+
+    def test_batch_get_users_invalid_ids(self):
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.post(
+            reverse("core:user-batch-get"), {"ids": ["not-a-uuid"]}, format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        # Erros de ListField são indexados por int: o corpo precisa renderizar
+        assert list(json.loads(response.content)["ids"]) == ["0"]
+
+    def test_batch_get_users_as_regular_user_forbidden(self):
+        self.client.force_authenticate(user=self.regular_user)
+        response = self.client.post(
+            reverse("core:user-batch-get"),
+            {"ids": [str(self.regular_user.id)]},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def _export(self, query):
+        response = self.client.get(f"{reverse('core:user-export')}{query}")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        return response, b"".join(response.streaming_content).decode("utf-8")
+
+    def test_export_users_ndjson(self):
+        for i in range(3):
+            User.objects.create_user(
+                email=f"export{i}@example.com", first_name="Export", last_name="User"
+            )
+        self.client.force_authenticate(user=self.admin_user)
+
+        response, body = self._export("?format=ndjson&search_query=export")
+
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert "users.ndjson" in response["Content-Disposition"]
+        rows = [json.loads(line) for line in body.splitlines()]
+        assert [row["email"] for row in rows] == [
+            f"export{i}@example.com" for i in range(3)
+        ]
+        assert set(rows[0]) == {
+            "id",
+            "email",
+            "first_name",
+            "last_name",
+            "is_active",
+            "is_staff",
+            "is_superuser",
+        }
+
+    def test_export_users_csv(self):
+        User.objects.create_user(
+            email="csv@example.com", first_name="=HYPERLINK()", last_name="User"
+        )
+        self.client.force_authenticate(user=self.admin_user)
+
+        response, body = self._export("?format=csv&search_query=csv@")
+
+        assert response["Content-Type"] == "text/csv; charset=utf-8"
+        header, *rows = list(csv.reader(io.StringIO(body)))
+        assert header[:2] == ["id", "email"]
+        assert len(rows) == 1
+        assert rows[0][1] == "csv@example.com"
+        assert rows[0][2] == "'=HYPERLINK()"
+
+    def test_export_users_excludes_superusers(self):
+        self.client.force_authenticate(user=self.admin_user)
+
+        _, body = self._export("")
+
+        emails = [json.loads(line)["email"] for line in body.splitlines()]
+        assert "regular@example.com" in emails
+        assert "admin@example.com" not in emails
+
+    def test_export_users_as_regular_user_forbidden(self):
+        self.client.force_authenticate(user=self.regular_user)
+        response = self.client.get(f"{reverse('core:user-export')}?format=csv")
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response["Content-Type"] == "application/json"
+
+    def test_export_users_unknown_format(self):
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.get(f"{reverse('core:user-export')}?format=xml")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_bulk_import_users_as_admin(self):
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.post(
+            reverse("core:user-bulk-import"),
+            {
+                "users": [
+                    {
+                        "email": "bulk1@example.com",
+                        "first_name": "Bulk",
+                        "last_name": "One",
+                        "is_superuser": True,
+                    },
+                    {
+                        "email": "regular@example.com",
+                        "first_name": "Dup",
+                        "last_name": "User",
+                    },
+                    {"email": "bulk2@example.com", "first_name": "Bulk"},
+                ]
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["processed"] == 3
+        assert response.data["created"] == 1
+        assert [(f["row"], f["email"]) for f in response.data["failures"]] == [
+            (2, "regular@example.com"),
+            (3, "bulk2@example.com"),
+        ]
+        assert response.data["failures"][1]["errors"] == {
+            "last_name": ["This field is required."]
+        }
+        imported = User.objects.get(email="bulk1@example.com")
+        assert not imported.is_superuser
+        assert not imported.has_usable_password()
+
+    def test_bulk_import_users_rejects_oversized_batch(self):
+        self.client.force_authenticate(user=self.admin_user)
+        rows = [
+            {"email": f"many{i}@example.com", "first_name": "M", "last_name": "U"}
+            for i in range(settings.USER_BULK_IMPORT_API_MAX_ROWS + 1)
+        ]
+        response = self.client.post(
+            reverse("core:user-bulk-import"), {"users": rows}, format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "users" in response.data
+        assert not User.objects.filter(email="many0@example.com").exists()
+
+    def test_bulk_import_users_invalid_item(self):
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.post(
+            reverse("core:user-bulk-import"), {"users": ["notadict"]}, format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(json.loads(response.content)["users"]) == ["0"]
+
+    def test_bulk_import_users_as_regular_user_forbidden(self):
+        self.client.force_authenticate(user=self.regular_user)
+        response = self.client.post(
+            reverse("core:user-bulk-import"),
+            {"users": [{"email": "x@example.com"}]},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
     def test_list_users_unauthenticated_failure(self):
         response = self.client.get(self.list_users_url, format="json")
         assert (
@@ -0,0 +1,57 @@
+"""Testes unitários para o cache em processo da Application OAuth2."""
+
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from oauth2_provider.models import Application
+
+from core.repositories.application_cache import ApplicationCache, application_cache
+
+
+@pytest.mark.django_db
+class TestApplicationCache:
+    """Testes para ApplicationCache."""
+
+    def test_get_queries_once_within_ttl(self):
+        """Testa que leituras dentro do TTL não consultam o banco."""
+        cache = ApplicationCache(ttl=60)
+        first = cache.get("test-client-id")
+
+        with CaptureQueriesContext(connection) as ctx:
+            second = cache.get("test-client-id")
+
+        assert second is first
+        assert len(ctx.captured_queries) == 0
+
+    def test_get_reloads_after_ttl(self):
+        """Testa recarga após expiração do TTL."""
+        cache = ApplicationCache(ttl=60)
+        with patch("core.repositories.application_cache.time.monotonic") as clock:
+            clock.return_value = 1000.0
+            first = cache.get("test-client-id")
+            clock.return_value = 1061.0
+            second = cache.get("test-client-id")
+
+        assert second is not first
+        assert second.pk == first.pk
+
+    def test_get_missing_application(self):
+        """Testa que aplicações inexistentes propagam DoesNotExist."""
+        with pytest.raises(Application.DoesNotExist):
+            ApplicationCache(ttl=60).get("missing-client")
+
+    def test_save_signal_invalidates_global_cache(self):
+        """Testa invalidação via post_save da Application."""
+        application = application_cache.get("test-client-id")
+        application.name = "Renamed"
+        Application.objects.get(pk=application.pk).save()
+
+        assert application_cache.get("test-client-id") is not application
+
+    def test_warm_reports_failure_without_raising(self):
+        """Testa que o aquecimento não falha quando a aplicação não existe."""
+        cache = ApplicationCache(ttl=60)
+        assert cache.warm("missing-client") is False
+        assert cache.warm("test-client-id") is True
@@ -1,7 +1,7 @@
 import datetime
 import uuid
 from datetime import timedelta
-from unittest.mock import ANY, Mock, patch
+from unittest.mock import ANY, MagicMock, Mock, patch
 
 import pytest
 from core.domain.entities.user import (
@@ -10,10 +10,19 @@ from core.domain.entities.user import (
 
 # Importa o modelo real do Django para usar suas exceções
 from core.models.user import User as DjangoUserModel
+from core.repositories.application_cache import application_cache
 from core.repositories.auth_gateway_impl import DjangoAuthGateway
+from core.repositories.token_cache import access_token_cache
 from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
-from oauth2_provider.models import Application  # Importar o modelo Application real
+from oauth2_provider.models import (  # Importar os modelos reais
+    AccessToken,
+    Application,
+    RefreshToken,
+)
 
 
 # Mock para o modelo de usuário do Django
@@ -30,6 +39,7 @@ class MockDjangoUser:
         self.id = id
         self.email = email
         self._password = password  # Simula o password hash
+        self.password = make_password(password)
         self.is_active = is_active
         self.is_staff = is_staff
         self.is_superuser = is_superuser
@@ -233,43 +243,100 @@ def test_check_password_failure_user_not_found(setup_auth_gateway_mocks):
 
 
 # Testes para create_tokens
-def test_create_tokens_success_existing_application(setup_auth_gateway_mocks):
-    mocks = setup_auth_gateway_mocks
-    user_id = str(uuid.uuid4())
-    mock_user = MockDjangoUser(id=user_id, email="test@example.com")
+def _token_statements(ctx):
+    """Statements SQL executados, ignorando savepoints da transação."""
+    return [
+        query["sql"]
+        for query in ctx.captured_queries
+        if not query["sql"].startswith(("SAVEPOINT", "RELEASE SAVEPOINT"))
+    ]
+
+
+def _create_tokens_twice(email):
+    user = DjangoUserModel.objects.create_user(
+        email=email, first_name="Tokens", last_name="User"
+    )
+    gateway = DjangoAuthGateway()
+    old_tokens = gateway.create_tokens(str(user.id))
 
-    # Por padrão, o manager.get já retorna a instância configurada no fixture
-    mocks["user_model"].objects.get.return_value = mock_user
+    with CaptureQueriesContext(connection) as ctx:
+        tokens = gateway.create_tokens(str(user.id))
 
-    gateway = DjangoAuthGateway()
-    access_token, refresh_token = gateway.create_tokens(user_id)
+    assert {t.token for t in AccessToken.objects.filter(user=user)} == {tokens[0]}
+    refresh = RefreshToken.objects.get(user=user)
+    assert refresh.token == tokens[1]
+    assert refresh.access_token.token == tokens[0]
+    assert old_tokens[0] != tokens[0] and old_tokens[1] != tokens[1]
+    return _token_statements(ctx)
 
-    mocks["user_model"].objects.get.assert_called_once_with(id=user_id)
-    mocks["application_manager"].get.assert_called_once_with(client_id="test-client-id")
-    # A aplicação não deve ser criada se já existe
-    mocks["application_manager"].create.assert_not_called()
-
-    mocks["access_token_manager"].filter.assert_called_once()
-    mocks["refresh_token_manager"].filter.assert_called_once()
-    mocks["access_token_manager"].create.assert_called_once_with(
-        user=mock_user,
-        application=mocks["mock_application_instance_for_get"],
-        token=ANY,  # Token é gerado aleatoriamente
-        scope="read write",
-        expires=ANY,  # Usar ANY para a data de expiração
+
+@pytest.mark.django_db
+def test_create_tokens_success_revokes_and_issues():
+    """Testa revogação + emissão sem SELECT de usuário/aplicação.
+
+    Fora do PostgreSQL (o SQLite da CI) são 4 statements, e não 3: os dois
+    deletes da revogação são separados. Com o cache de tokens ativo soma-se
+    o SELECT dos checksums a invalidar. O caminho de 3 statements é coberto
+    por `test_revoke_tokens_postgresql_builds_single_cte` e
+    `test_create_tokens_three_statements_on_postgresql`.
+    """
+    statements = _create_tokens_twice("tokens@example.com")
+
+    if connection.vendor == "postgresql":
+        expected = 3
+    else:
+        expected = 4 + int(access_token_cache.enabled)
+    assert len(statements) == expected
+    assert not any('FROM "core_user"' in sql for sql in statements)
+    assert not any("oauth2_provider_application" in sql for sql in statements)
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="CTE de revogação só no PostgreSQL"
+)
+def test_create_tokens_three_statements_on_postgresql():
+    """Testa o limite de 3 statements (CTE + dois INSERTs) no PostgreSQL."""
+    statements = _create_tokens_twice("tokens-pg@example.com")
+
+    assert len(statements) == 3
+    assert statements[0].startswith("WITH revoked AS (DELETE FROM")
+
+
+def test_revoke_tokens_postgresql_builds_single_cte():
+    """Testa o SQL e os parâmetros da revogação no PostgreSQL."""
+    user_id = str(uuid.uuid4())
+    pg_connection = MagicMock(vendor="postgresql")
+    pg_connection.ops.quote_name = lambda name: f'"{name}"'
+    pg_connection.features.has_native_uuid_field = True
+    cursor = pg_connection.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = [("checksum-1",), ("checksum-2",)]
+
+    with (
+        patch(
+            "core.repositories.auth_gateway_impl.connections",
+            {"default": pg_connection},
+        ),
+        patch("core.repositories.auth_gateway_impl.access_token_cache") as token_cache,
+    ):
+        DjangoAuthGateway._revoke_tokens("default", user_id, Mock(pk=7))
+
+    cursor.execute.assert_called_once()
+    sql, params = cursor.execute.call_args.args
+    assert sql == (
+        'WITH revoked AS (DELETE FROM "oauth2_provider_refreshtoken" '
+        "WHERE user_id = %s AND application_id = %s) "
+        'DELETE FROM "oauth2_provider_accesstoken" '
+        "WHERE user_id = %s AND application_id = %s "
+        "RETURNING token_checksum"
     )
-    mocks["refresh_token_manager"].create.assert_called_once_with(
-        user=mock_user,
-        application=mocks["mock_application_instance_for_get"],
-        token=ANY,  # Token é gerado aleatoriamente
-        access_token=mocks["mock_access_token_instance_for_create"],
+    assert params == [uuid.UUID(user_id), 7] * 2
+    token_cache.invalidate.assert_called_once_with(
+        ["checksum-1", "checksum-2"], using="default"
     )
 
-    assert access_token == "mock_access_token"
-    assert refresh_token == "mock_refresh_token"
-
 
-def test_create_tokens_success_new_application(setup_auth_gateway_mocks):
+def test_create_tokens_application_not_found(setup_auth_gateway_mocks):
     """Test que verifica o comportamento quando a aplicação OAuth2 não existe.
 
     O comportamento esperado é que uma exceção ClientApplicationNotFound seja levantada
@@ -277,13 +344,11 @@ def test_create_tokens_success_new_application(setup_auth_gateway_mocks):
     """
     mocks = setup_auth_gateway_mocks
     user_id = str(uuid.uuid4())
-    mock_user = MockDjangoUser(id=user_id, email="test@example.com")
+    application_cache.invalidate()
 
     # Configura o side_effect para simular que a aplicação NÃO existe -> raise da exceção
     mocks["application_manager"].get.side_effect = Application.DoesNotExist()
 
-    mocks["user_model"].objects.get.return_value = mock_user
-
     gateway = DjangoAuthGateway()
 
     from core.domain.exceptions import ClientApplicationNotFound
@@ -291,24 +356,20 @@ def test_create_tokens_success_new_application(setup_auth_gateway_mocks):
     with pytest.raises(ClientApplicationNotFound, match="Client application not found"):
         gateway.create_tokens(user_id)
 
-    mocks["user_model"].objects.get.assert_called_once_with(id=user_id)
     mocks["application_manager"].get.assert_called_once_with(client_id="test-client-id")
+    mocks["access_token_manager"].bulk_create.assert_not_called()
 
 
-def test_create_tokens_user_not_found(setup_auth_gateway_mocks):
-    mocks = setup_auth_gateway_mocks
-    user_id = str(uuid.uuid4())
-    mocks["user_model"].objects.get.side_effect = mocks["user_model"].DoesNotExist
-
+@pytest.mark.django_db(transaction=True)
+def test_create_tokens_user_not_found():
     gateway = DjangoAuthGateway()
 
     from core.domain.exceptions import AuthenticationError
 
     with pytest.raises(AuthenticationError, match="User not found"):
-        gateway.create_tokens(user_id)
+        gateway.create_tokens(str(uuid.uuid4()))
 
-    mocks["user_model"].objects.get.assert_called_once_with(id=user_id)
-    mocks["application_manager"].get.assert_not_called()
+    assert not AccessToken.objects.exists()
 
 
 # Testes para set_password
@@ -343,3 +404,49 @@ def test_set_password_user_not_found(setup_auth_gateway_mocks):
         gateway.set_password(user_id, "new_password")
 
     mocks["user_model"].objects.get.assert_called_once_with(id=user_id)
+
+
+def test_check_password_rehashes_outdated_hash(setup_auth_gateway_mocks):
+    mocks = setup_auth_gateway_mocks
+    user_id = str(uuid.uuid4())
+    mock_user = MockDjangoUser(id=user_id, email="test@example.com", password="pw")
+    mock_user.password = make_password("pw", hasher="pbkdf2_sha1")
+    mocks["user_model"].objects.get.return_value = mock_user
+
+    gateway = DjangoAuthGateway()
+    assert gateway.check_password(user_id, "pw") is True
+
+    assert mock_user.password.startswith("pbkdf2_sha256$")
+    mock_user.save.assert_called_once_with(update_fields=["password"])
+
+
+def test_check_password_propagates_capacity_error(setup_auth_gateway_mocks):
+    from core.domain.exceptions import CapacityExceededError
+
+    mocks = setup_auth_gateway_mocks
+    user_id = str(uuid.uuid4())
+    mocks["user_model"].objects.get.return_value = MockDjangoUser(
+        id=user_id, email="test@example.com", password="pw"
+    )
+    saturated = Mock()
+    saturated.run.side_effect = CapacityExceededError("busy", retry_after=2)
+
+    with patch(
+        "core.repositories.auth_gateway_impl.get_hashing_pool", return_value=saturated
+    ):
+        with pytest.raises(CapacityExceededError):
+            DjangoAuthGateway().check_password(user_id, "pw")
+
+
+def test_acheck_password(setup_auth_gateway_mocks):
+    import asyncio
+
+    mocks = setup_auth_gateway_mocks
+    user_id = str(uuid.uuid4())
+    mocks["user_model"].objects.get.return_value = MockDjangoUser(
+        id=user_id, email="test@example.com", password="pw"
+    )
+
+    gateway = DjangoAuthGateway()
+    assert asyncio.run(gateway.acheck_password(user_id, "pw")) is True
+    assert asyncio.run(gateway.acheck_password(user_id, "nope")) is False
@@ -0,0 +1,46 @@
+"""Testes unitários para os serializadores do cache Redis."""
+
+import pytest
+
+from core.domain.entities.user import User as DomainUser
+from core.repositories.cache_serializers import JSONSerializer, PickleSerializer
+
+
+class TestCacheSerializers:
+    """Testes para PickleSerializer e JSONSerializer."""
+
+    @pytest.mark.parametrize("serializer_class", [PickleSerializer, JSONSerializer])
+    def test_integers_are_not_serialized(self, serializer_class):
+        """Testa que inteiros vão crus para manter incr/decr atômicos."""
+        serializer = serializer_class(min_compress_bytes=1)
+        assert serializer.dumps(42) == 42
+        assert serializer.loads(b"42") == 42
+
+    def test_pickle_roundtrip_domain_entity(self):
+        """Testa ida e volta de uma entidade do domínio."""
+        serializer = PickleSerializer(min_compress_bytes=0)
+        user = DomainUser(email="a@example.com", first_name="A", last_name="B")
+        assert serializer.loads(serializer.dumps(user)) == user
+
+    def test_large_values_are_compressed(self):
+        """Testa compressão a partir do limite configurado."""
+        serializer = JSONSerializer(min_compress_bytes=100)
+        value = {"items": ["x" * 10] * 100}
+
+        data = serializer.dumps(value)
+
+        assert data[:1] == b"\x78"
+        assert len(data) < len(JSONSerializer(min_compress_bytes=0).dumps(value))
+        assert serializer.loads(data) == value
+
+    def test_small_values_are_not_compressed(self):
+        """Testa que valores pequenos não pagam o custo da compressão."""
+        serializer = PickleSerializer(min_compress_bytes=100)
+        data = serializer.dumps({"a": 1})
+        assert data[:1] == b"\x80"
+        assert serializer.loads(data) == {"a": 1}
+
+    def test_reads_uncompressed_values_after_enabling(self):
+        """Testa leitura de valores gravados antes de ativar a compressão."""
+        written = JSONSerializer(min_compress_bytes=0).dumps(["a", "b"])
+        assert JSONSerializer(min_compress_bytes=1).loads(written) == ["a", "b"]
@@ -0,0 +1,197 @@
+"""Testes unitários para CachedUserRepository."""
+
+import uuid
+from unittest.mock import Mock, patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.api import deps
+from core.domain.data_access import UserRepository
+from core.domain.entities.user import User as DomainUser
+from core.repositories.cached_user_repository import CachedUserRepository
+from core.repositories.user_repository_impl import DjangoUserRepository
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Isola cada teste com cache e contadores limpos."""
+    cache.clear()
+    CachedUserRepository.reset_stats()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def domain_user():
+    return DomainUser(
+        id=str(uuid.uuid4()),
+        email="cached@example.com",
+        first_name="Cached",
+        last_name="User",
+    )
+
+
+@pytest.fixture
+def inner_repository(domain_user):
+    repository = Mock(spec=UserRepository)
+    repository.get_by_id.return_value = domain_user
+    repository.get_user_by_email.return_value = domain_user
+    return repository
+
+
+class TestCachedUserRepository:
+    """Testes para o decorator de cache do repositório."""
+
+    def test_get_by_id_reads_through_once(self, inner_repository, domain_user):
+        """Testa que a segunda leitura por ID vem do cache."""
+        repository = CachedUserRepository(inner_repository)
+
+        first = repository.get_by_id(domain_user.id)
+        second = repository.get_by_id(domain_user.id)
+
+        assert first == second == domain_user
+        inner_repository.get_by_id.assert_called_once_with(domain_user.id)
+        stats = CachedUserRepository.get_stats()
+        assert stats["id_hits"] == 1
+        assert stats["id_misses"] == 1
+
+    def test_lookup_by_id_warms_email_key(self, inner_repository, domain_user):
+        """Testa que uma leitura por ID também popula a chave por email."""
+        repository = CachedUserRepository(inner_repository)
+
+        repository.get_by_id(domain_user.id)
+        user = repository.get_user_by_email(domain_user.email)
+
+        assert user.email == domain_user.email
+        inner_repository.get_user_by_email.assert_not_called()
+
+    def test_missing_user_is_not_cached(self, inner_repository):
+        """Testa que usuários inexistentes não são cacheados."""
+        inner_repository.get_by_id.return_value = None
+        repository = CachedUserRepository(inner_repository)
+
+        assert repository.get_by_id("missing") is None
+        assert repository.get_by_id("missing") is None
+        assert inner_repository.get_by_id.call_count == 2
+
+    def test_update_invalidates_old_email(self, inner_repository, domain_user):
+        """Testa que update remove as chaves do email antigo e do ID."""
+        repository = CachedUserRepository(inner_repository)
+        repository.get_by_id(domain_user.id)
+        changed = DomainUser(
+            id=domain_user.id,
+            email="changed@example.com",
+            first_name="Cached",
+            last_name="User",
+        )
+        inner_repository.update.return_value = changed
+
+        repository.update(changed)
+
+        assert cache.get(CachedUserRepository.make_key("id", domain_user.id)) is None
+        assert (
+            cache.get(CachedUserRepository.make_key("email", domain_user.email)) is None
+        )
+
+    def test_get_by_ids_fetches_only_misses(self, inner_repository, domain_user):
+        """Testa que a busca em lote consulta o repositório só para misses."""
+        repository = CachedUserRepository(inner_repository)
+        repository.get_by_id(domain_user.id)
+        other_id = str(uuid.uuid4())
+        inner_repository.get_by_ids.return_value = {}
+
+        result = repository.get_by_ids([domain_user.id, other_id])
+
+        assert list(result) == [domain_user.id]
+        inner_repository.get_by_ids.assert_called_once_with([other_id])
+
+    def test_get_by_ids_skips_cached_superusers(self, inner_repository, domain_user):
+        """Testa que um superusuário em cache (via get_by_id) fica de fora."""
+        domain_user.is_superuser = True
+        repository = CachedUserRepository(inner_repository)
+        repository.get_by_id(domain_user.id)
+
+        assert repository.get_by_ids([domain_user.id]) == {}
+        inner_repository.get_by_ids.assert_not_called()
+
+    @pytest.mark.django_db
+    def test_model_save_signal_invalidates(self, settings):
+        """Testa invalidação via post_save quando o modelo muda fora do repositório."""
+        settings.USER_REPOSITORY_CACHE_ENABLED = True
+        user = User.objects.create_user(
+            email="signal@example.com", first_name="Signal", last_name="User"
+        )
+        repository = CachedUserRepository(DjangoUserRepository())
+        assert repository.get_by_id(str(user.id)).first_name == "Signal"
+
+        user.first_name = "Changed"
+        user.save()
+
+        assert repository.get_by_id(str(user.id)).first_name == "Changed"
+
+    @pytest.mark.django_db
+    def test_model_delete_signal_invalidates(self, settings):
+        """Testa invalidação via post_delete."""
+        settings.USER_REPOSITORY_CACHE_ENABLED = True
+        user = User.objects.create_user(
+            email="gone@example.com", first_name="Gone", last_name="User"
+        )
+        repository = CachedUserRepository(DjangoUserRepository())
+        repository.get_user_by_email("gone@example.com")
+
+        user.delete()
+
+        assert repository.get_user_by_email("gone@example.com") is None
+
+    @pytest.mark.django_db
+    def test_signals_skip_cache_when_disabled(self, settings):
+        """Testa que, com o cache desativado, salvar não invalida nada."""
+        settings.USER_REPOSITORY_CACHE_ENABLED = False
+
+        with patch.object(CachedUserRepository, "invalidate") as invalidate:
+            User.objects.create_user(
+                email="nocache@example.com", first_name="No", last_name="Cache"
+            )
+
+        invalidate.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_exposes_stats(inner_repository, domain_user):
+    """Testa os contadores de hit/miss no endpoint de métricas (admin)."""
+    repository = CachedUserRepository(inner_repository)
+    repository.get_by_id(domain_user.id)
+    repository.get_by_id(domain_user.id)
+    admin = User.objects.create_user(
+        email="metrics@example.com",
+        first_name="Metrics",
+        last_name="Admin",
+        is_staff=True,
+    )
+    url = reverse("core:metrics")
+    client = APIClient()
+
+    assert client.get(url).status_code == 401
+    client.force_authenticate(user=admin)
+    response = client.get(url)
+
+    assert response.status_code == 200
+    stats = response.json()["user_repository_cache"]
+    assert stats["id_hits"] == 1
+    assert stats["id_misses"] == 1
+    assert "utilization" in response.json()["password_hashing_pool"]
+
+
+def test_get_user_repository_respects_setting(settings):
+    """Testa seleção do repositório com cache via settings."""
+    settings.USER_REPOSITORY_CACHE_ENABLED = True
+    assert isinstance(deps.get_user_repository(), CachedUserRepository)
+
+    settings.USER_REPOSITORY_CACHE_ENABLED = False
+    assert isinstance(deps.get_user_repository(), DjangoUserRepository)
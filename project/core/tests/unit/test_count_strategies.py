@@ -0,0 +1,112 @@
+"""Testes unitários para as estratégias de contagem de listagens."""
+
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from core.domain.data_access import ItemCount
+from core.repositories.count_strategies import (
+    CachedCountStrategy,
+    CappedCountStrategy,
+    EstimatedCountStrategy,
+    ExactCountStrategy,
+    get_count_strategy,
+)
+from core.repositories.user_repository_impl import DjangoUserRepository
+
+User = get_user_model()
+
+
+@pytest.fixture
+def users(db):
+    """Cria alguns usuários comuns para contagem."""
+    for i in range(3):
+        User.objects.create_user(
+            email=f"count{i}@example.com", first_name="Count", last_name="User"
+        )
+    return User.objects.filter(email__startswith="count")
+
+
+class TestItemCount:
+    """Testes para ItemCount."""
+
+    def test_behaves_like_int(self):
+        """Testa que ItemCount mantém semântica de int."""
+        total = ItemCount(10, exact=False)
+        assert total == 10
+        assert isinstance(total, int)
+        assert total.exact is False
+
+
+class TestCountStrategies:
+    """Testes para as estratégias de contagem."""
+
+    def test_exact_count(self, users):
+        """Testa contagem exata."""
+        total = ExactCountStrategy().count(users, None)
+        assert total == 3
+        assert total.exact is True
+
+    def test_capped_count_below_cap(self, users):
+        """Testa contagem limitada abaixo do limite."""
+        total = CappedCountStrategy(cap=10).count(users, None)
+        assert total == 3
+        assert total.exact is True
+
+    def test_capped_count_above_cap(self, users):
+        """Testa contagem limitada acima do limite."""
+        total = CappedCountStrategy(cap=2).count(users, None)
+        assert total == 2
+        assert total.exact is False
+
+    def test_estimated_count_falls_back_outside_postgres(self, users):
+        """Testa que a estimativa cai para contagem exata fora do PostgreSQL."""
+        total = EstimatedCountStrategy(threshold=0).count(users, None)
+        assert total == 3
+        assert total.exact is True
+
+    def test_estimated_count_uses_planner_estimate(self, users):
+        """Testa uso da estimativa do planner em consulta sem filtro."""
+        strategy = EstimatedCountStrategy(threshold=1000)
+        with patch.object(strategy, "_estimate", return_value=5000000):
+            total = strategy.count(users, None)
+        assert total == 5000000
+        assert total.exact is False
+
+    def test_estimated_count_ignores_estimate_when_filtered(self, users):
+        """Testa que consultas filtradas sempre usam contagem exata."""
+        strategy = EstimatedCountStrategy(threshold=1000)
+        with patch.object(strategy, "_estimate", return_value=5000000) as estimate:
+            total = strategy.count(users, "count")
+        estimate.assert_not_called()
+        assert total == 3
+
+    def test_cached_count_hit_is_inexact(self, users):
+        """Testa que o total em cache é reutilizado e marcado como inexato."""
+        strategy = CachedCountStrategy(ttl=30)
+        cache.delete(strategy.get_cache_key("count"))
+
+        first = strategy.count(users, "count")
+        User.objects.create_user(
+            email="count9@example.com", first_name="Count", last_name="User"
+        )
+        second = strategy.count(users, "count")
+
+        assert first == 3 and first.exact is True
+        assert second == 3 and second.exact is False
+
+    def test_get_count_strategy_unknown(self):
+        """Testa erro para estratégia desconhecida."""
+        with pytest.raises(ValueError):
+            get_count_strategy("unknown")
+
+    def test_repository_uses_configured_strategy(self, users):
+        """Testa que o repositório repassa o total da estratégia configurada."""
+        repository = DjangoUserRepository(count_strategy=CappedCountStrategy(cap=1))
+        _, total = repository.get_all_paginated_filtered(
+            offset=0, limit=10, search_query="count"
+        )
+        assert total == 1
+        assert total.exact is False
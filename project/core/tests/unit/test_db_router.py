@@ -0,0 +1,91 @@
+"""Testes unitários para o roteamento primário/réplica."""
+
+import pytest
+from oauth2_provider.models import AccessToken
+
+from core.db_router import (
+    PrimaryReplicaRouter,
+    is_pinned_to_primary,
+    primary_pin_scope,
+)
+from core.domain.entities.user import User as DomainUser
+from core.middleware.db_routing_middleware import DatabaseRoutingMiddleware
+from core.models.user import User as DjangoUser
+from core.repositories.user_repository_impl import DjangoUserRepository
+
+ROUTERS = ["core.db_router.PrimaryReplicaRouter"]
+
+
+class TestPrimaryReplicaRouter:
+    """Testes para PrimaryReplicaRouter."""
+
+    def test_reads_go_to_replica(self):
+        """Testa leitura de modelos do app core na réplica."""
+        with primary_pin_scope():
+            assert PrimaryReplicaRouter().db_for_read(DjangoUser) == "replica"
+
+    def test_other_apps_read_from_primary(self):
+        """Testa que tokens OAuth2 não são lidos da réplica."""
+        with primary_pin_scope():
+            assert PrimaryReplicaRouter().db_for_read(AccessToken) is None
+
+    def test_write_pins_reads_to_primary(self):
+        """Testa leituras fixadas no primário após uma escrita."""
+        router = PrimaryReplicaRouter()
+        with primary_pin_scope():
+            assert router.db_for_write(DjangoUser) == "default"
+            assert is_pinned_to_primary()
+            assert router.db_for_read(DjangoUser) is None
+        assert not is_pinned_to_primary()
+
+    def test_replica_apps_setting(self, settings):
+        """Testa que apenas os apps configurados vão para a réplica."""
+        settings.DATABASE_REPLICA_APPS = []
+        with primary_pin_scope():
+            assert PrimaryReplicaRouter().db_for_read(DjangoUser) is None
+
+    def test_middleware_resets_pin_per_request(self):
+        """Testa que cada requisição começa sem fixação."""
+        seen = []
+
+        def view(request):
+            seen.append(is_pinned_to_primary())
+            PrimaryReplicaRouter().db_for_write(DjangoUser)
+            seen.append(is_pinned_to_primary())
+
+        middleware = DatabaseRoutingMiddleware(view)
+        middleware(None)
+        middleware(None)
+
+        assert seen == [False, True, False, True]
+
+
+@pytest.mark.django_db(databases=["default", "replica"])
+class TestRepositoryRouting:
+    """Repositório com dois SQLite sem replicação entre eles."""
+
+    @pytest.fixture(autouse=True)
+    def _enable_router(self, settings):
+        settings.DATABASE_ROUTERS = ROUTERS
+
+    def _create(self, repository):
+        return repository.create(
+            DomainUser(email="routed@example.com", first_name="R", last_name="T")
+        )
+
+    def test_reads_after_write_stick_to_primary(self):
+        """Testa leitura do que acabou de ser gravado na mesma requisição."""
+        repository = DjangoUserRepository()
+        with primary_pin_scope():
+            user = self._create(repository)
+            assert repository.get_by_id(user.id) is not None
+
+    def test_reads_use_replica_in_new_request(self):
+        """Testa que uma nova requisição lê da réplica."""
+        repository = DjangoUserRepository()
+        with primary_pin_scope():
+            user = self._create(repository)
+        with primary_pin_scope():
+            # A réplica não recebeu a escrita: prova de que a leitura foi lá
+            assert repository.get_by_id(user.id) is None
+            assert DjangoUser.objects.using("default").filter(id=user.id).exists()
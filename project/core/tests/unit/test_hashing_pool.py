@@ -0,0 +1,141 @@
+"""Testes unitários para o pool limitado de hashing de senhas."""
+
+import asyncio
+import threading
+
+import pytest
+from django.contrib.auth.hashers import check_password, is_password_usable
+
+from core.domain.exceptions import CapacityExceededError
+from core.repositories import hashing_pool
+from core.repositories.hashing_pool import HashingPool, hash_passwords
+
+
+@pytest.fixture
+def pool():
+    pool = HashingPool(max_workers=1, queue_limit=1, retry_after=3)
+    yield pool
+    pool.shutdown()
+
+
+class TestHashingPool:
+    """Testes para HashingPool."""
+
+    def test_run_returns_result(self, pool):
+        """Testa execução síncrona no pool."""
+        assert pool.run(pow, 2, 10) == 1024
+        assert pool.stats()["completed_total"] == 1
+
+    def test_run_executes_in_calling_thread(self, pool):
+        """Testa que o caminho síncrono não troca de thread."""
+        assert pool.run(threading.get_ident) == threading.get_ident()
+        assert pool.stats()["in_flight"] == 0
+
+    def test_run_waits_for_busy_worker(self, pool):
+        """Testa que `run` respeita max_workers e mede a espera."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        future = pool.submit(block)
+        started.wait(timeout=5)
+        timer = threading.Timer(0.05, release.set)
+        timer.start()
+
+        assert pool.run(pow, 2, 3) == 8
+        future.result()
+        stats = pool.stats()
+        assert stats["completed_total"] == 2
+        assert stats["wait_max_ms"] >= 40
+        assert 0 < stats["wait_avg_ms"] <= stats["wait_max_ms"]
+
+    def test_run_async_returns_result(self, pool):
+        """Testa execução aguardada pelo event loop."""
+        assert asyncio.run(pool.run_async(pow, 3, 2)) == 9
+
+    def test_rejects_when_saturated(self, pool):
+        """Testa falha rápida quando workers e fila estão ocupados."""
+        release = threading.Event()
+        running = pool.submit(release.wait)
+        queued = pool.submit(release.wait)
+
+        with pytest.raises(CapacityExceededError) as exc_info:
+            pool.submit(release.wait)
+
+        assert exc_info.value.retry_after == 3
+        stats = pool.stats()
+        assert stats["in_flight"] == 2
+        assert stats["rejected_total"] == 1
+
+        release.set()
+        running.result()
+        queued.result()
+        assert pool.stats()["in_flight"] == 0
+
+    def test_slot_released_after_failure(self, pool):
+        """Testa que exceções na tarefa liberam a vaga."""
+        with pytest.raises(ZeroDivisionError):
+            pool.run(divmod, 1, 0)
+        assert pool.stats()["in_flight"] == 0
+        assert pool.run(pow, 2, 2) == 4
+
+    def test_stats_report_utilization(self, pool):
+        """Testa métricas de utilização com uma tarefa em execução."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        future = pool.submit(block)
+        started.wait(timeout=5)
+        stats = pool.stats()
+        release.set()
+        future.result()
+
+        assert stats["running"] == 1
+        assert stats["queued"] == 0
+        assert stats["utilization"] == 1.0
+
+
+class TestHashPasswords:
+    """Testes para o hashing em lote (importações)."""
+
+    @pytest.fixture(autouse=True)
+    def fast_hasher(self, settings):
+        settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+    def test_inline_with_single_worker(self, settings):
+        """Testa hashing no próprio processo e senha inutilizável para None."""
+        settings.PASSWORD_BULK_HASHING_PROCESSES = 1
+
+        hashes = hash_passwords(["secret-1", None, "secret-2"])
+
+        assert check_password("secret-1", hashes[0])
+        assert not is_password_usable(hashes[1])
+        assert check_password("secret-2", hashes[2])
+
+    def test_explicit_single_process_skips_pool(self, settings):
+        """Testa `processes=1` (API): sem pool de processos no worker web."""
+        settings.PASSWORD_BULK_HASHING_PROCESSES = 4
+
+        hashes = hash_passwords(["secret-1"], processes=1)
+
+        assert check_password("secret-1", hashes[0])
+        assert hashing_pool._bulk_executor is None
+
+    def test_process_pool_preserves_order(self, settings):
+        """Testa distribuição entre processos mantendo a ordem de entrada."""
+        settings.PASSWORD_BULK_HASHING_PROCESSES = 2
+        passwords = [f"secret-{i}" for i in range(6)]
+        try:
+            hashes = hash_passwords(passwords)
+        finally:
+            hashing_pool.get_bulk_hashing_executor().shutdown()
+            hashing_pool._bulk_executor = None
+
+        assert all(map(check_password, passwords, hashes))
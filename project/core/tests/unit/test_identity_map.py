@@ -0,0 +1,162 @@
+"""Testes unitários para o identity map por requisição."""
+
+import pytest
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.domain.use_cases.user_use_cases import LoginUserRequest, LoginUserUseCase
+from core.middleware.identity_map_middleware import IdentityMapMiddleware
+from core.repositories.auth_gateway_impl import DjangoAuthGateway
+from core.repositories.identity_map import (
+    IdentityMap,
+    get_identity_map,
+    identity_map_scope,
+)
+from core.repositories.user_repository_impl import DjangoUserRepository
+
+User = get_user_model()
+
+
+def _user_selects(ctx):
+    return [
+        query
+        for query in ctx.captured_queries
+        if query["sql"].startswith("SELECT") and 'FROM "core_user"' in query["sql"]
+    ]
+
+
+class TestIdentityMap:
+    """Testes para IdentityMap e seu escopo."""
+
+    def test_scope_sets_and_resets_current_map(self):
+        """Testa que o escopo só existe dentro do context manager."""
+        assert get_identity_map() is None
+        with identity_map_scope() as identity_map:
+            assert get_identity_map() is identity_map
+        assert get_identity_map() is None
+
+    @pytest.mark.django_db
+    def test_add_indexes_by_pk_and_aliases(self):
+        """Testa indexação pela PK e por campos adicionais."""
+        user = User.objects.create_user(
+            email="map@example.com", first_name="Map", last_name="User"
+        )
+        identity_map = IdentityMap()
+        identity_map.add(user, "email")
+
+        assert identity_map.get(User, "pk", str(user.pk)) is user
+        assert identity_map.get(User, "email", "map@example.com") is user
+
+        identity_map.discard(User, user.pk)
+        assert identity_map.get(User, "email", "map@example.com") is None
+        assert len(identity_map) == 0
+
+    def test_middleware_clears_map_after_request(self):
+        """Testa que o middleware abre e encerra o escopo por requisição."""
+        seen = {}
+
+        def get_response(request):
+            seen["map"] = get_identity_map()
+            return "response"
+
+        middleware = IdentityMapMiddleware(get_response)
+        response = middleware(RequestFactory().get("/"))
+
+        assert response == "response"
+        assert isinstance(seen["map"], IdentityMap)
+        assert get_identity_map() is None
+
+
+@pytest.mark.django_db
+def test_login_loads_projection_and_hash_once_per_request():
+    """Testa o login: uma leitura projetada e uma do hash, sem repetições.
+
+    O repositório lê só `DOMAIN_USER_FIELDS`; o hash vem da instância
+    completa carregada pelo gateway, reaproveitada nas leituras seguintes.
+    """
+    user = User.objects.create_user(
+        email="login-map@example.com",
+        password="secret123",
+        first_name="Login",
+        last_name="User",
+    )
+    repository = DjangoUserRepository()
+    use_case = LoginUserUseCase(
+        user_repository=repository, auth_gateway=DjangoAuthGateway()
+    )
+
+    with identity_map_scope(), CaptureQueriesContext(connection) as ctx:
+        response = use_case.execute(
+            LoginUserRequest(email="login-map@example.com", password="secret123")
+        )
+        repository.get_by_id(str(user.id))
+
+    assert response.access_token
+    selects = _user_selects(ctx)
+    assert len(selects) == 2
+    assert '"core_user"."password"' not in selects[0]["sql"]
+
+
+@pytest.mark.django_db
+def test_repository_reads_share_projected_row():
+    """Testa que leituras repetidas usam uma consulta projetada."""
+    user = User.objects.create_user(
+        email="row-map@example.com", first_name="Row", last_name="User"
+    )
+    repository = DjangoUserRepository()
+
+    with identity_map_scope() as identity_map, CaptureQueriesContext(connection) as ctx:
+        first = repository.get_by_id(str(user.id))
+        second = repository.get_user_by_email("row-map@example.com")
+        assert len(identity_map) == 1
+
+    assert first == second
+    assert first is not second
+    assert len(_user_selects(ctx)) == 1
+    assert '"core_user"."password"' not in ctx.captured_queries[0]["sql"]
+
+
+@pytest.mark.django_db
+def test_request_under_middleware_skips_password_column():
+    """Testa que GET /v1/users/<id>/ (com o middleware) não lê o hash."""
+    assert (
+        "core.middleware.identity_map_middleware.IdentityMapMiddleware"
+        in settings.MIDDLEWARE
+    )
+    admin = User.objects.create_user(
+        email="map-admin@example.com",
+        first_name="Map",
+        last_name="Admin",
+        is_staff=True,
+    )
+    client = APIClient()
+    client.force_authenticate(user=admin)
+
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(reverse("core:retrieve-user", args=[admin.id]))
+
+    assert response.status_code == 200
+    selects = _user_selects(ctx)
+    assert selects
+    assert all('"core_user"."password"' not in query["sql"] for query in selects)
+
+
+@pytest.mark.django_db
+def test_external_save_discards_stale_instance():
+    """Testa que salvar outra instância remove a antiga do identity map."""
+    user = User.objects.create_user(
+        email="stale@example.com", first_name="Stale", last_name="User"
+    )
+    repository = DjangoUserRepository()
+
+    with identity_map_scope():
+        assert repository.get_by_id(str(user.id)).first_name == "Stale"
+        other = User.objects.get(id=user.id)
+        other.first_name = "Fresh"
+        other.save()
+        assert repository.get_by_id(str(user.id)).first_name == "Fresh"
@@ -2,10 +2,20 @@
 Testes unitários para middleware de exceções customizadas.
 """
 
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
 from core.middleware.custom_exception_middleware import custom_exception_handler
+from core.middleware.rate_limit_headers_middleware import RateLimitHeadersMiddleware
+from core.middleware.server_timing_middleware import ServerTimingMiddleware
+from core.repositories.request_timing import timed
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.utils.functional import SimpleLazyObject
 from rest_framework import status
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 from rest_framework.response import Response
@@ -77,3 +87,143 @@ class TestCustomExceptionMiddleware:
         assert "password" in response.data
         assert response.data["email"] == ["Email inválido"]
         assert response.data["password"] == ["Senha muito curta"]
+
+
+class TestRateLimitHeadersMiddleware:
+    """Testes para RateLimitHeadersMiddleware."""
+
+    def test_adds_headers_when_throttled_view(self):
+        """Testa headers RateLimit-* a partir de request.rate_limit."""
+        request = Mock()
+        request.rate_limit = {"limit": 5, "remaining": 2, "reset": 40}
+        middleware = RateLimitHeadersMiddleware(lambda req: HttpResponse())
+
+        response = middleware(request)
+
+        assert response["RateLimit-Limit"] == "5"
+        assert response["RateLimit-Remaining"] == "2"
+        assert response["RateLimit-Reset"] == "40"
+
+    def test_no_headers_without_rate_limit(self):
+        """Testa que respostas sem throttle não recebem headers."""
+        request = Mock(spec=[])
+        middleware = RateLimitHeadersMiddleware(lambda req: HttpResponse())
+
+        response = middleware(request)
+
+        assert "RateLimit-Limit" not in response
+
+    def test_async_chain_adds_headers(self):
+        """Testa que, em cadeia assíncrona (ASGI), o middleware é corrotina."""
+
+        async def get_response(req):
+            return HttpResponse()
+
+        request = Mock()
+        request.rate_limit = {"limit": 5, "remaining": 0, "reset": 12}
+        middleware = RateLimitHeadersMiddleware(get_response)
+
+        assert iscoroutinefunction(middleware)
+        response = async_to_sync(middleware)(request)
+
+        assert response["RateLimit-Remaining"] == "0"
+        assert response["RateLimit-Reset"] == "12"
+
+
+def _staff_request(path="/"):
+    request = RequestFactory().get(path)
+    request.user = SimpleNamespace(is_authenticated=True, is_staff=True)
+    return request
+
+
+class TestServerTimingMiddleware:
+    """Testes para ServerTimingMiddleware."""
+
+    @pytest.mark.django_db
+    def test_sampled_request_gets_header_and_log(self, settings):
+        """Testa o header Server-Timing e o evento de log da requisição."""
+        settings.REQUEST_TIMING_SAMPLE_RATE = 1.0
+
+        def get_response(request):
+            get_user_model().objects.count()
+            with timed("hash"):
+                pass
+            return HttpResponse(status=201)
+
+        middleware = ServerTimingMiddleware(get_response)
+        with patch("core.middleware.server_timing_middleware.logger") as logger:
+            response = middleware(_staff_request("/v1/users/"))
+
+        metrics = response["Server-Timing"].split(", ")
+        assert metrics[0].startswith("db;dur=")
+        assert metrics[0].endswith(';desc="1 queries"')
+        assert metrics[1].startswith("hash;dur=")
+        assert metrics[-1].startswith("total;dur=")
+        logger.info.assert_called_once()
+        event = logger.info.call_args.kwargs
+        assert event["path"] == "/v1/users/"
+        assert event["status_code"] == 201
+        assert event["db_count"] == 1
+        assert event["cache_count"] == 0
+
+    def test_unsampled_request_is_untouched(self, settings):
+        """Testa que, com taxa 0, nada é medido nem publicado."""
+        settings.REQUEST_TIMING_SAMPLE_RATE = 0.0
+        middleware = ServerTimingMiddleware(lambda req: HttpResponse())
+
+        response = middleware(_staff_request())
+
+        assert "Server-Timing" not in response
+
+    def test_sample_rate_is_respected(self, settings):
+        """Testa a amostragem pela fração configurada."""
+        settings.REQUEST_TIMING_SAMPLE_RATE = 0.5
+        middleware = ServerTimingMiddleware(lambda req: HttpResponse())
+
+        with patch("random.random", return_value=0.7):
+            assert "Server-Timing" not in middleware(_staff_request())
+        with patch("random.random", return_value=0.2):
+            assert "Server-Timing" in middleware(_staff_request())
+
+    @pytest.mark.parametrize(
+        "make_user",
+        [
+            lambda: None,
+            AnonymousUser,
+            lambda: SimpleNamespace(is_authenticated=True, is_staff=False),
+            lambda: SimpleLazyObject(lambda: pytest.fail("session user resolved")),
+        ],
+        ids=["no-user", "anonymous", "non-staff", "unresolved-session"],
+    )
+    def test_header_only_for_staff(self, settings, make_user):
+        """Testa que só staff recebe o header; o log é emitido sempre."""
+        settings.REQUEST_TIMING_SAMPLE_RATE = 1.0
+        request = RequestFactory().get("/")
+        user = make_user()
+        if user is not None:
+            request.user = user
+        middleware = ServerTimingMiddleware(lambda req: HttpResponse())
+
+        with patch("core.middleware.server_timing_middleware.logger") as logger:
+            response = middleware(request)
+
+        assert "Server-Timing" not in response
+        logger.info.assert_called_once()
+
+    @pytest.mark.django_db(transaction=True)
+    def test_async_chain_times_queries_in_threads(self, settings):
+        """Testa que queries em sync_to_async entram na medição (ASGI)."""
+        from asgiref.sync import sync_to_async
+
+        settings.REQUEST_TIMING_SAMPLE_RATE = 1.0
+
+        async def get_response(req):
+            await sync_to_async(get_user_model().objects.count)()
+            return HttpResponse()
+
+        middleware = ServerTimingMiddleware(get_response)
+
+        assert iscoroutinefunction(middleware)
+        response = async_to_sync(middleware)(_staff_request())
+
+        assert response["Server-Timing"].startswith("db;")
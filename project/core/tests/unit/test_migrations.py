@@ -0,0 +1,39 @@
+"""Testes unitários para migrações com comportamento dependente do banco."""
+
+import importlib
+from unittest.mock import Mock
+
+trigram_migration = importlib.import_module(
+    "core.migrations.0004_user_search_trigram_indexes"
+)
+
+
+def _schema_editor(vendor):
+    schema_editor = Mock()
+    schema_editor.connection.vendor = vendor
+    return schema_editor
+
+
+def test_trigram_indexes_skipped_outside_postgres():
+    """Testa que a migração não executa SQL fora do PostgreSQL."""
+    schema_editor = _schema_editor("sqlite")
+
+    trigram_migration.create_trigram_indexes(None, schema_editor)
+    trigram_migration.drop_trigram_indexes(None, schema_editor)
+
+    schema_editor.execute.assert_not_called()
+
+
+def test_trigram_indexes_created_on_postgres():
+    """Testa criação da extensão e dos índices GIN no PostgreSQL."""
+    schema_editor = _schema_editor("postgresql")
+
+    trigram_migration.create_trigram_indexes(None, schema_editor)
+
+    statements = [call.args[0] for call in schema_editor.execute.call_args_list]
+    assert statements[0] == "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+    for column in ("email", "first_name", "last_name"):
+        assert any(
+            f"UPPER({column}::text) gin_trgm_ops" in sql for sql in statements[1:]
+        )
+    assert trigram_migration.Migration.atomic is False
@@ -0,0 +1,106 @@
+"""Testes unitários para o ORJSONRenderer."""
+
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+from core.api.renderers import CSVRenderer, NDJSONRenderer, ORJSONRenderer
+from core.api.v1.serializers.user import UserListResponseSerializer
+from core.domain.data_access import ItemCount
+from core.domain.use_cases.user_use_cases import (
+    CreateUserResponse,
+    ListUsersResponse,
+)
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+
+
+def test_renders_uuid_and_datetime_natively():
+    """Testa UUID e datetime (UTC com sufixo Z, como o encoder do DRF)."""
+    user_id = uuid.uuid4()
+    moment = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+
+    rendered = ORJSONRenderer().render({"id": user_id, "at": moment})
+
+    assert json.loads(rendered) == {"id": str(user_id), "at": "2024-01-02T03:04:05Z"}
+
+
+def test_falls_back_to_drf_encoder():
+    """Testa tipos fora do orjson (Decimal) e subclasses (ErrorDetail)."""
+    data = {"price": Decimal("1.50"), "detail": ErrorDetail("inválido", code="x")}
+
+    rendered = ORJSONRenderer().render(data)
+
+    assert json.loads(rendered) == json.loads(JSONRenderer().render(data))
+    assert json.loads(rendered)["detail"] == "inválido"
+
+
+def test_renders_non_str_keys():
+    """Testa chaves int, usadas nos erros de ListField do DRF."""
+    data = {"ids": {0: [ErrorDetail("inválido", code="invalid")]}}
+
+    rendered = ORJSONRenderer().render(data)
+
+    assert json.loads(rendered) == json.loads(JSONRenderer().render(data))
+
+
+def test_none_renders_empty_body():
+    """Testa corpo vazio para respostas sem dados (ex.: 204)."""
+    assert ORJSONRenderer().render(None) == b""
+
+
+def test_indent_from_accept_header():
+    """Testa indentação quando o cliente pede ``indent`` no Accept."""
+    rendered = ORJSONRenderer().render({"a": 1}, "application/json; indent=4")
+
+    assert rendered == b'{\n  "a": 1\n}'
+
+
+def test_list_response_matches_stdlib_renderer():
+    """Testa que a listagem com dicts simples é idêntica à do JSONRenderer."""
+    users = [
+        CreateUserResponse(
+            id=str(uuid.uuid4()),
+            email=f"user{i}@example.com",
+            first_name="Usuário",
+            last_name=str(i),
+            is_active=True,
+            is_staff=False,
+            is_superuser=False,
+        )
+        for i in range(3)
+    ]
+    data = UserListResponseSerializer(
+        ListUsersResponse(
+            users=users,
+            total_items=ItemCount(3, exact=True),
+            offset=0,
+            limit=10,
+        )
+    ).data
+
+    assert json.loads(ORJSONRenderer().render(data)) == json.loads(
+        JSONRenderer().render(data)
+    )
+
+
+def test_ndjson_streams_one_object_per_line():
+    """Testa NDJSON: um objeto por linha, sem cabeçalho."""
+    rows = [{"id": 1, "email": "a@example.com"}, {"id": 2, "email": "b@example.com"}]
+
+    chunks = list(NDJSONRenderer().stream(iter(rows), ("id", "email")))
+
+    assert chunks == [
+        b'{"id":1,"email":"a@example.com"}\n',
+        b'{"id":2,"email":"b@example.com"}\n',
+    ]
+
+
+def test_csv_streams_header_and_escapes_formulas():
+    """Testa CSV com cabeçalho e neutralização de células tipo fórmula."""
+    rows = [{"email": "a@example.com", "first_name": "=cmd()", "extra": "x"}]
+
+    chunks = list(CSVRenderer().stream(iter(rows), ("email", "first_name")))
+
+    assert chunks == [b"email,first_name\r\n", b"a@example.com,'=cmd()\r\n"]
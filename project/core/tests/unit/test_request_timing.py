@@ -0,0 +1,126 @@
+"""Testes unitários para a medição de tempo por requisição."""
+
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from core.api.renderers import ORJSONRenderer
+from core.repositories.cache_backends import TimedLocMemCache
+from core.repositories.request_timing import (
+    get_request_timings,
+    request_timing_scope,
+    timed,
+)
+
+User = get_user_model()
+
+
+class TestRequestTimings:
+    """Testes para o escopo de medição e as categorias registradas."""
+
+    def test_timed_is_noop_outside_scope(self):
+        """Testa que fora de um escopo nada é registrado."""
+        with timed("db"):
+            pass
+        assert get_request_timings() is None
+
+        with request_timing_scope() as timings:
+            assert get_request_timings() is timings
+        assert get_request_timings() is None
+
+    def test_nested_blocks_count_once(self):
+        """Testa que blocos aninhados da mesma categoria contam uma vez."""
+        with request_timing_scope() as timings:
+            with timed("cache"):
+                with timed("cache"):
+                    pass
+                with timed("db"):
+                    pass
+
+        assert timings.counts == {"cache": 1, "db": 1}
+        assert timings.durations["cache"] >= timings.durations["db"]
+
+    @pytest.mark.django_db
+    def test_database_queries_are_timed(self):
+        """Testa o execute_wrapper instalado na conexão."""
+        with request_timing_scope() as timings:
+            User.objects.count()
+            User.objects.filter(email="nobody@example.com").exists()
+
+        assert timings.counts["db"] == 2
+        assert timings.durations["db"] > 0
+
+    def test_cache_operations_are_timed(self):
+        """Testa o backend de cache medido (get_many interno conta uma vez)."""
+        assert isinstance(caches["default"], TimedLocMemCache)
+        with request_timing_scope() as timings:
+            cache.set("request-timing", 1)
+            cache.get("request-timing")
+            cache.get_many(["request-timing", "other"])
+        cache.delete("request-timing")
+
+        assert timings.counts["cache"] == 3
+
+    def test_rendering_is_timed(self):
+        """Testa a categoria de serialização no ORJSONRenderer."""
+        with request_timing_scope() as timings:
+            ORJSONRenderer().render({"id": 1})
+
+        assert timings.counts["serialize"] == 1
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize(
+        "email", ["timing@example.com", "unknown@example.com"], ids=["known", "unknown"]
+    )
+    def test_login_hides_header_and_logs_every_category(self, client, settings, email):
+        """Testa que o login não expõe o header (enumeração de contas).
+
+        Só o email existente chega ao hashing; a divisão fica apenas no log.
+        """
+        settings.REQUEST_TIMING_SAMPLE_RATE = 1.0
+        cache.clear()
+        User.objects.create_user(
+            email="timing@example.com",
+            password="timingpassword123",
+            first_name="Timing",
+            last_name="User",
+        )
+
+        with patch("core.middleware.server_timing_middleware.logger") as logger:
+            response = client.post(
+                reverse("core:login"),
+                {"email": email, "password": "timingpassword123"},
+                content_type="application/json",
+            )
+
+        assert "Server-Timing" not in response
+        event = logger.info.call_args.kwargs
+        assert event["db_count"] > 0
+        assert event["serialize_count"] == 1
+        assert (event["hash_count"] > 0) == (response.status_code == 200)
+
+    @pytest.mark.django_db
+    def test_staff_request_reports_header(self, settings):
+        """Testa o header Server-Timing para um staff autenticado."""
+        settings.REQUEST_TIMING_SAMPLE_RATE = 1.0
+        client = APIClient()
+        client.force_authenticate(
+            user=User.objects.create_user(
+                email="staff-timing@example.com",
+                password="timingpassword123",
+                first_name="Staff",
+                last_name="Timing",
+                is_staff=True,
+            )
+        )
+
+        response = client.get(reverse("core:user-list"))
+
+        assert response.status_code == 200
+        metrics = [item.split(";")[0] for item in response["Server-Timing"].split(", ")]
+        assert {"db", "serialize"} <= set(metrics)
+        assert metrics[-1] == "total"
@@ -0,0 +1,210 @@
+"""Testes dos access tokens assinados (formato autocontido)."""
+
+from datetime import timedelta
+
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from oauth2_provider.models import AccessToken, Application, RefreshToken
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.api.authentication import CachedOAuth2Authentication
+from core.models.user import User
+from core.repositories import signed_tokens
+from core.repositories.application_cache import application_cache
+from core.repositories.auth_gateway_impl import DjangoAuthGateway
+
+
+@pytest.fixture(autouse=True)
+def signed_settings(settings):
+    settings.OAUTH2_SIGNED_TOKEN_KEYS = {"k1": "first-secret", "k2": "second-secret"}
+    settings.OAUTH2_SIGNED_TOKEN_ACTIVE_KEY = "k1"
+    settings.OAUTH2_SIGNED_TOKEN_APPLICATIONS = [settings.OAUTH2_CLIENT_ID]
+    cache.clear()
+    application_cache.invalidate()
+    yield settings
+    cache.clear()
+    application_cache.invalidate()
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(
+        email="signed@example.com",
+        first_name="Signed",
+        last_name="Token",
+        is_staff=True,
+    )
+
+
+@pytest.fixture
+def application():
+    return Application.objects.get(client_id=settings.OAUTH2_CLIENT_ID)
+
+
+def _issue(user, application, expires_in=timedelta(hours=1), issued_at=None):
+    now = issued_at or timezone.now()
+    return signed_tokens.issue(
+        user.pk, application, "read write", now + expires_in, now
+    )
+
+
+def _authenticate(token):
+    request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+    return CachedOAuth2Authentication().authenticate(Request(request))
+
+
+@pytest.mark.django_db
+def test_issue_and_verify_roundtrip(user, application):
+    token = _issue(user, application)
+
+    access_token = signed_tokens.verify(token)
+
+    assert token.startswith("sat1.k1.")
+    assert access_token.user_id == str(user.pk)
+    assert access_token.application_id == application.pk
+    assert access_token.kid == "k1"
+    assert access_token.is_valid(["read", "write"])
+    assert not access_token.is_valid(["admin"])
+
+
+@pytest.mark.django_db
+def test_verify_rejects_tampering(user, application):
+    """Testa assinatura adulterada, kid desconhecido e troca de kid."""
+    token = _issue(user, application)
+    prefix, kid, signed = token.split(".", 2)
+
+    assert signed_tokens.verify(token[:-2] + "xx") is None
+    assert signed_tokens.verify(f"{prefix}.k9.{signed}") is None
+    # O kid entra no salt: mesmo com outra chave válida, a assinatura falha
+    assert signed_tokens.verify(f"{prefix}.k2.{signed}") is None
+    assert signed_tokens.verify("sat1.garbage") is None
+    assert signed_tokens.verify("opaque-token") is None
+
+
+@pytest.mark.django_db
+def test_verify_rejects_expired_token(user, application):
+    token = _issue(user, application, expires_in=-timedelta(seconds=1))
+    assert signed_tokens.verify(token) is None
+
+
+@pytest.mark.django_db
+def test_key_rotation(signed_settings, user, application):
+    """Testa que a chave anterior só verifica e que removê-la invalida."""
+    old_token = _issue(user, application)
+
+    signed_settings.OAUTH2_SIGNED_TOKEN_ACTIVE_KEY = "k2"
+    new_token = _issue(user, application)
+    assert new_token.startswith("sat1.k2.")
+    assert signed_tokens.verify(old_token) is not None
+
+    signed_settings.OAUTH2_SIGNED_TOKEN_KEYS = {"k2": "second-secret"}
+    assert signed_tokens.verify(old_token) is None
+    assert signed_tokens.verify(new_token) is not None
+
+
+def test_missing_or_unknown_keys_are_improperly_configured(signed_settings):
+    signed_settings.OAUTH2_SIGNED_TOKEN_ACTIVE_KEY = "k9"
+    with pytest.raises(ImproperlyConfigured):
+        signed_tokens._keys()
+    signed_settings.OAUTH2_SIGNED_TOKEN_KEYS = {}
+    with pytest.raises(ImproperlyConfigured):
+        signed_tokens._keys()
+
+
+@pytest.mark.django_db
+def test_revocation_list(user, application):
+    """Testa revogação por jti e por corte de emissão do usuário."""
+    now = timezone.now()
+    older = _issue(user, application, issued_at=now - timedelta(minutes=5))
+    revoked = _issue(user, application, issued_at=now)
+    newer = _issue(user, application, issued_at=now + timedelta(seconds=1))
+
+    assert signed_tokens.revoke(revoked)
+    assert signed_tokens.verify(revoked) is None
+    assert not signed_tokens.revoke(revoked)
+
+    signed_tokens.revoke_user(user.pk, application.pk, now)
+    assert signed_tokens.verify(older) is None
+    assert signed_tokens.verify(newer) is not None
+
+
+@pytest.mark.django_db
+def test_create_tokens_issues_signed_token(
+    user, application, django_capture_on_commit_callbacks
+):
+    """Testa a emissão pelo gateway: nada gravado além do refresh token."""
+    gateway = DjangoAuthGateway()
+    with django_capture_on_commit_callbacks(execute=True):
+        first, _ = gateway.create_tokens(str(user.pk))
+    with django_capture_on_commit_callbacks(execute=True):
+        second, refresh = gateway.create_tokens(str(user.pk))
+
+    assert signed_tokens.is_signed_token(second)
+    assert not AccessToken.objects.filter(user=user).exists()
+    refresh_token = RefreshToken.objects.get(user=user)
+    assert refresh_token.token == refresh
+    assert refresh_token.access_token is None
+    # O novo login revoga o token assinado anterior
+    assert signed_tokens.verify(first) is None
+    assert signed_tokens.verify(second) is not None
+
+
+@pytest.mark.django_db
+def test_opaque_format_for_other_applications(signed_settings, user):
+    signed_settings.OAUTH2_SIGNED_TOKEN_APPLICATIONS = []
+    token, _ = DjangoAuthGateway().create_tokens(str(user.pk))
+
+    assert not signed_tokens.is_signed_token(token)
+    assert AccessToken.objects.filter(user=user).exists()
+
+
+@pytest.mark.django_db
+def test_authentication_verifies_without_token_table(
+    signed_settings, user, application
+):
+    """Testa a autenticação: nenhuma consulta ao banco com o usuário em cache."""
+    signed_settings.OAUTH2_TOKEN_CACHE_TTL = 60
+    token = _issue(user, application)
+    _authenticate(token)
+
+    with CaptureQueriesContext(connection) as context:
+        authenticated_user, access_token = _authenticate(token)
+
+    assert len(context.captured_queries) == 0
+    assert authenticated_user.pk == user.pk
+    assert access_token.user is authenticated_user
+    assert "password" in authenticated_user.get_deferred_fields()
+
+
+@pytest.mark.django_db
+def test_authentication_rejects_invalid_or_orphan_tokens(user, application):
+    request = Request(
+        APIRequestFactory().get("/", HTTP_AUTHORIZATION="Bearer sat1.k1.bad")
+    )
+    assert CachedOAuth2Authentication().authenticate(request) is None
+    assert request.oauth2_error["error"] == "invalid_token"
+
+    token = _issue(user, application)
+    user.delete()
+    assert _authenticate(token) is None
+
+
+@pytest.mark.django_db
+def test_api_request_with_signed_token(user, application, client):
+    url = reverse("core:retrieve-user", kwargs={"pk": user.pk})
+    token = _issue(user, application)
+
+    response = client.get(url, HTTP_AUTHORIZATION=f"Bearer {token}")
+    assert response.status_code == 200
+    assert response.json()["email"] == user.email
+
+    signed_tokens.revoke(token)
+    response = client.get(url, HTTP_AUTHORIZATION=f"Bearer {token}")
+    assert response.status_code == 401
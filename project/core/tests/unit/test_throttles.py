@@ -70,73 +70,258 @@ class TestRateLimitThrottle:
 
         assert result is True
 
-    def test_allow_request_with_old_requests(self, request_factory, mock_view):
-        """Testa remoção de requisições antigas do histórico."""
-        throttle = RateLimitThrottle()
-        throttle.duration = 3600
-        throttle.num_requests = 5
-
+    def _anonymous_request(self, request_factory):
         request = request_factory.get("/")
         request.user = Mock()
         request.user.is_authenticated = False
         request.user.is_superuser = False
         request.META = {"REMOTE_ADDR": "192.168.1.1"}
+        return request
+
+    def test_allow_request_weights_previous_window(self, request_factory, mock_view):
+        """Testa que a janela anterior conta proporcionalmente à sobreposição."""
+        throttle = RateLimitThrottle()
+        throttle.duration = 100
+        throttle.num_requests = 5
+        request = self._anonymous_request(request_factory)
+        cache.clear()
 
         with patch.object(throttle, "get_ident", return_value="192.168.1.1"):
             key = throttle.get_cache_key(request, mock_view)
+            # 25% da janela atual decorrida: anterior pesa 0.75 * 4 = 3
+            cache.set("%s:%d" % (key, 9), 4)
+            with patch.object(throttle, "timer", return_value=1025.0):
+                results = [throttle.allow_request(request, mock_view) for _ in range(3)]
 
-        # Simular histórico com requisições antigas
-        # O histórico é ordenado com mais recente primeiro (insert(0, now))
-        # Então removemos do final (history[-1]) que é o mais antigo
-        import time
-
-        now = time.time()
-        old_time = now - 4000  # Mais antiga que duration
-        recent_time = now - 100  # Recente
-        # Histórico: [recent_time, old_time] - recent_time primeiro (mais recente)
-        cache.set(key, [recent_time, old_time], throttle.duration)
+        assert results == [True, True, False]
+        assert cache.get("%s:%d" % (key, 10)) == 2
 
-        result = throttle.allow_request(request, mock_view)
+    def test_allow_request_ignores_old_windows(self, request_factory, mock_view):
+        """Testa que janelas mais antigas que a anterior são descartadas."""
+        throttle = RateLimitThrottle()
+        throttle.duration = 100
+        throttle.num_requests = 1
+        request = self._anonymous_request(request_factory)
+        cache.clear()
 
-        # Deve permitir e limpar requisições antigas do final
-        assert result is True
-        history = cache.get(key, [])
-        # old_time removida, recent_time mantida, nova requisição adicionada no início
-        assert len(history) == 2
-        # Verifica que old_time foi removida (não está mais no histórico)
-        assert old_time not in history
-        # Verifica que recent_time ainda está
-        assert recent_time in history
+        with patch.object(throttle, "get_ident", return_value="192.168.1.1"):
+            key = throttle.get_cache_key(request, mock_view)
+            cache.set("%s:%d" % (key, 8), 50)
+            with patch.object(throttle, "timer", return_value=1000.0):
+                assert throttle.allow_request(request, mock_view) is True
 
     def test_allow_request_rate_limit_exceeded(self, request_factory, mock_view):
         """Testa bloqueio quando limite de requisições é excedido."""
         throttle = RateLimitThrottle()
         throttle.num_requests = 2
         throttle.duration = 3600
+        request = self._anonymous_request(request_factory)
+        cache.clear()
 
-        request = request_factory.get("/")
-        request.user = Mock()
-        request.user.is_authenticated = False
-        request.user.is_superuser = False
-        request.META = {"REMOTE_ADDR": "192.168.1.1"}
+        with patch.object(throttle, "get_ident", return_value="192.168.1.1"):
+            results = [throttle.allow_request(request, mock_view) for _ in range(3)]
+
+        assert results == [True, True, False]
+
+    def test_allow_request_stores_only_counters(self, request_factory, mock_view):
+        """Testa que o estado por chave é um inteiro, não uma lista."""
+        throttle = RateLimitThrottle()
+        throttle.duration = 100
+        request = self._anonymous_request(request_factory)
+        cache.clear()
 
         with patch.object(throttle, "get_ident", return_value="192.168.1.1"):
             key = throttle.get_cache_key(request, mock_view)
+            with patch.object(throttle, "timer", return_value=1050.0):
+                for _ in range(10):
+                    throttle.allow_request(request, mock_view)
 
-        # Preencher histórico até o limite
-        import time
+        assert cache.get("%s:%d" % (key, 10)) == 10
 
-        cache.set(key, [time.time(), time.time()], throttle.duration)
+    def test_allow_request_concurrent_workers(self, request_factory, mock_view):
+        """Testa que requisições concorrentes não ultrapassam o limite."""
+        from concurrent.futures import ThreadPoolExecutor
 
-        result = throttle.allow_request(request, mock_view)
-
-        assert result is False
+        throttle = RateLimitThrottle()
+        throttle.num_requests = 10
+        throttle.duration = 3600
+        request = self._anonymous_request(request_factory)
+        cache.clear()
 
-    def test_wait_returns_none(self):
-        """Testa que wait() retorna None."""
+        with patch.object(throttle, "get_ident", return_value="192.168.1.1"):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(
+                    executor.map(
+                        lambda _: throttle.allow_request(request, mock_view),
+                        range(40),
+                    )
+                )
+
+        assert results.count(True) == 10
+
+    def test_wait_returns_none_before_throttling(self):
+        """Testa que wait() retorna None se nada foi bloqueado."""
         throttle = RateLimitThrottle()
         assert throttle.wait() is None
 
+    def test_wait_within_current_window(self, request_factory, mock_view):
+        """Testa espera até o peso da janela anterior liberar uma vaga."""
+        throttle = RateLimitThrottle()
+        throttle.duration = 100
+        throttle.num_requests = 5
+        request = self._anonymous_request(request_factory)
+        cache.clear()
+
+        with patch.object(throttle, "get_ident", return_value="192.168.1.1"):
+            key = throttle.get_cache_key(request, mock_view)
+            cache.set("%s:%d" % (key, 9), 8)
+            cache.set("%s:%d" % (key, 10), 1)
+            with patch.object(throttle, "timer", return_value=1025.0):
+                assert throttle.allow_request(request, mock_view) is False
+
+        # Precisa de 8 * w + 1 <= 4, isto é, w <= 3/8: 62.5s decorridos
+        assert throttle.wait() == pytest.approx(37.5)
+
+    def test_wait_until_next_window(self, request_factory, mock_view):
+        """Testa espera quando a janela atual sozinha esgota a cota."""
+        throttle = RateLimitThrottle()
+        throttle.duration = 100
+        throttle.num_requests = 2
+        request = self._anonymous_request(request_factory)
+        cache.clear()
+
+        with patch.object(throttle, "get_ident", return_value="192.168.1.1"):
+            with patch.object(throttle, "timer", return_value=1010.0):
+                results = [throttle.allow_request(request, mock_view) for _ in range(3)]
+
+        assert results == [True, True, False]
+        # Fim da janela (90s) + até o peso de 2 cair para 1/2 (50s)
+        assert throttle.wait() == pytest.approx(140.0)
+
+    def test_allow_request_records_rate_limit(self, request_factory, mock_view):
+        """Testa que o estado da cota é anexado à requisição Django."""
+        throttle = RateLimitThrottle()
+        throttle.duration = 100
+        throttle.num_requests = 5
+        request = self._anonymous_request(request_factory)
+        cache.clear()
+
+        with patch.object(throttle, "get_ident", return_value="192.168.1.1"):
+            with patch.object(throttle, "timer", return_value=1030.0):
+                throttle.allow_request(request, mock_view)
+                throttle.allow_request(request, mock_view)
+
+        assert request.rate_limit == {"limit": 5, "remaining": 3, "reset": 70}
+
+
+class TestLocalTier:
+    """Testes para o nível local (em processo) do RateLimitThrottle."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        from core.api import throttles
+
+        cache.clear()
+        throttles._local_buckets.clear()
+        yield
+        throttles._local_buckets.clear()
+
+    def _throttle(self, num_requests=100, batch=10):
+        throttle = RateLimitThrottle()
+        throttle.num_requests = num_requests
+        throttle.duration = 3600
+        throttle.local_batch = batch
+        throttle.local_sync_interval = 60
+        return throttle
+
+    def _request(self, request_factory):
+        request = request_factory.get("/")
+        request.user = Mock()
+        request.user.is_authenticated = False
+        request.user.is_superuser = False
+        return request
+
+    def _run(self, request_factory, mock_view, count, **kwargs):
+        request = self._request(request_factory)
+        results = []
+        with patch(
+            "rest_framework.throttling.BaseThrottle.get_ident",
+            return_value="10.0.0.1",
+        ):
+            for _ in range(count):
+                throttle = self._throttle(**kwargs)
+                with patch.object(throttle, "timer", return_value=7200.0 + 10):
+                    results.append(throttle.allow_request(request, mock_view))
+        return results
+
+    def test_local_decisions_skip_cache(self, request_factory, mock_view):
+        """Testa que requisições cobertas por fichas não acessam o cache."""
+        with patch("core.api.throttles.cache", wraps=cache) as spy:
+            results = self._run(request_factory, mock_view, 11)
+
+        assert all(results)
+        # 1ª requisição sincroniza e recebe 10 fichas; 2ª..11ª são locais
+        assert spy.incr.call_count == 1
+        assert spy.get.call_count == 1
+
+    def test_pending_delta_is_flushed_in_one_incr(self, request_factory, mock_view):
+        """Testa que o delta acumulado é enviado junto da próxima sincronização."""
+        self._run(request_factory, mock_view, 12)
+
+        assert cache.get("throttle_user_10.0.0.1:2") == 12
+
+    def test_limit_enforced_near_quota(self, request_factory, mock_view):
+        """Testa que perto do limite todas as decisões vão ao cache."""
+        results = self._run(request_factory, mock_view, 30, num_requests=25)
+
+        assert results.count(True) == 25
+        assert cache.get("throttle_user_10.0.0.1:2") == 25
+
+    def test_other_workers_bounded_overshoot(self, request_factory, mock_view):
+        """Testa o erro máximo com outro worker consumindo a cota."""
+        from core.api import throttles
+
+        self._run(request_factory, mock_view, 1, num_requests=40, batch=5)
+        # Outro worker consome a cota enquanto este ainda tem fichas locais
+        cache.incr("throttle_user_10.0.0.1:2", 39)
+        results = self._run(request_factory, mock_view, 10, num_requests=40, batch=5)
+
+        # Excesso limitado ao lote local; depois disso tudo é negado
+        assert results[:5] == [True] * 5
+        assert not any(results[5:])
+        assert cache.get("throttle_user_10.0.0.1:2") == 45
+        assert throttles._local_buckets["throttle_user_10.0.0.1"].tokens == 0
+
+    def test_lru_evicts_and_flushes_pending(self, request_factory, mock_view):
+        """Testa o limite de chaves: a menos recente sai e envia seu delta."""
+        from core.api import throttles
+
+        request = self._request(request_factory)
+
+        def hit(ident, count=1):
+            with patch(
+                "rest_framework.throttling.BaseThrottle.get_ident",
+                return_value=ident,
+            ):
+                for _ in range(count):
+                    throttle = self._throttle()
+                    with patch.object(throttle, "timer", return_value=7210.0):
+                        throttle.allow_request(request, mock_view)
+
+        with patch.object(throttles, "LOCAL_BUCKETS_MAX_KEYS", 2):
+            hit("10.0.0.1", count=4)  # 1 sincronização + 3 locais pendentes
+            hit("10.0.0.2")
+            hit("10.0.0.1")  # local: passa a ser a mais recente
+            hit("10.0.0.3")  # despeja 10.0.0.2, sem pendências
+            hit("10.0.0.4")  # despeja 10.0.0.1 e envia as 4 locais
+
+        assert list(throttles._local_buckets) == [
+            "throttle_user_10.0.0.3",
+            "throttle_user_10.0.0.4",
+        ]
+        assert cache.get("throttle_user_10.0.0.1:2") == 5
+        assert cache.get("throttle_user_10.0.0.2:2") == 1
+
 
 class TestLoginRateThrottle:
     """Testes para LoginRateThrottle."""
@@ -0,0 +1,203 @@
+"""Testes do cache de access tokens usado na autenticação da API."""
+
+from datetime import timedelta
+
+import pytest
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from oauth2_provider.models import AccessToken, Application
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.api.authentication import CachedOAuth2Authentication
+from core.domain.entities.user import User as DomainUser
+from core.models.user import User
+from core.repositories.application_cache import application_cache
+from core.repositories.auth_gateway_impl import DjangoAuthGateway
+from core.repositories.token_cache import access_token_cache, token_checksum
+from core.repositories.user_repository_impl import DjangoUserRepository
+
+
+@pytest.fixture(autouse=True)
+def token_cache(settings):
+    settings.OAUTH2_TOKEN_CACHE_TTL = 60
+    cache.clear()
+    application_cache.invalidate()
+    yield access_token_cache
+    cache.clear()
+    application_cache.invalidate()
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(
+        email="token-cache@example.com",
+        first_name="Token",
+        last_name="Cache",
+        is_staff=True,
+        password="!",
+    )
+
+
+@pytest.fixture
+def access_token(user):
+    # Application criada pelo conftest, a mesma usada em `create_tokens`
+    application = Application.objects.get(client_id=settings.OAUTH2_CLIENT_ID)
+    return AccessToken.objects.create(
+        user=user,
+        application=application,
+        token="cached-token-value",
+        scope="read write",
+        expires=timezone.now() + timedelta(hours=1),
+    )
+
+
+def _authenticate(token):
+    request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+    return CachedOAuth2Authentication().authenticate(Request(request))
+
+
+def _token_queries(context):
+    table = AccessToken._meta.db_table
+    return [query for query in context.captured_queries if table in query["sql"]]
+
+
+@pytest.mark.django_db
+def test_second_request_skips_database(user, access_token):
+    """Testa que o token validado é servido do cache, sem consultas."""
+    first_user, _ = _authenticate(access_token.token)
+    assert first_user == user
+
+    with CaptureQueriesContext(connection) as context:
+        cached_user, cached_token = _authenticate(access_token.token)
+
+    assert len(context.captured_queries) == 0
+    assert cached_user.pk == user.pk
+    assert cached_user.email == user.email
+    assert cached_user.is_staff and cached_user.is_authenticated
+    assert "password" in cached_user.get_deferred_fields()
+    assert cached_token.pk == access_token.pk
+    assert cached_token.user is cached_user
+    assert cached_token.is_valid(["read"])
+    assert not cached_token.is_valid(["admin"])
+
+
+@pytest.mark.django_db
+def test_cache_disabled_with_zero_ttl(settings, access_token):
+    settings.OAUTH2_TOKEN_CACHE_TTL = 0
+    _authenticate(access_token.token)
+
+    with CaptureQueriesContext(connection) as context:
+        assert _authenticate(access_token.token) is not None
+
+    assert _token_queries(context)
+    assert cache.get(access_token_cache.make_key(access_token.token_checksum)) is None
+
+
+@pytest.mark.django_db
+def test_entry_ttl_never_outlives_token(access_token):
+    """Testa que a entrada não passa da expiração do token."""
+    access_token.expires = timezone.now() + timedelta(seconds=5)
+    access_token.save()
+    _authenticate(access_token.token)
+
+    entry = cache.get(access_token_cache.make_key(access_token.token_checksum))
+    assert entry["expires"] == access_token.expires.timestamp()
+
+    # Entrada ainda no cache, mas o token já expirou: volta ao banco
+    cache.set(
+        access_token_cache.make_key(access_token.token_checksum),
+        {**entry, "expires": (timezone.now() - timedelta(seconds=1)).timestamp()},
+    )
+    assert access_token_cache.get(access_token.token) is None
+
+
+@pytest.mark.django_db
+def test_invalid_token_is_not_cached(access_token):
+    assert _authenticate("unknown-token") is None
+    assert (
+        cache.get(access_token_cache.make_key(token_checksum("unknown-token"))) is None
+    )
+
+
+@pytest.mark.django_db
+def test_create_tokens_revocation_invalidates_entry(
+    user, access_token, django_capture_on_commit_callbacks
+):
+    _authenticate(access_token.token)
+    key = access_token_cache.make_key(access_token.token_checksum)
+    assert cache.get(key) is not None
+
+    with django_capture_on_commit_callbacks(execute=True):
+        DjangoAuthGateway().create_tokens(str(user.pk))
+
+    assert cache.get(key) is None
+    assert _authenticate(access_token.token) is None
+
+
+@pytest.mark.django_db
+def test_token_delete_invalidates_entry(
+    access_token, django_capture_on_commit_callbacks
+):
+    _authenticate(access_token.token)
+    key = access_token_cache.make_key(access_token.token_checksum)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        access_token.revoke()
+
+    assert cache.get(key) is None
+
+
+@pytest.mark.django_db
+def test_user_update_invalidates_entry(
+    user, access_token, django_capture_on_commit_callbacks
+):
+    _authenticate(access_token.token)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user.is_staff = False
+        user.save()
+
+    cached_user, _ = _authenticate(access_token.token)
+    assert not cached_user.is_staff
+
+
+@pytest.mark.django_db
+def test_repository_update_invalidates_entry(
+    user, access_token, django_capture_on_commit_callbacks
+):
+    """Testa o UPDATE direto do repositório, que não dispara ``post_save``."""
+    _authenticate(access_token.token)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        DjangoUserRepository().update(
+            DomainUser(
+                id=str(user.pk),
+                email="renamed@example.com",
+                first_name="Renamed",
+                last_name=user.last_name,
+            )
+        )
+
+    cached_user, _ = _authenticate(access_token.token)
+    assert cached_user.email == "renamed@example.com"
+    assert cached_user.first_name == "Renamed"
+
+
+@pytest.mark.django_db
+def test_api_request_with_cached_token(user, access_token, client):
+    """Testa o fluxo da API: a segunda chamada não consulta `AccessToken`."""
+    url = reverse("core:retrieve-user", kwargs={"pk": user.pk})
+    headers = {"HTTP_AUTHORIZATION": f"Bearer {access_token.token}"}
+    assert client.get(url, **headers).status_code == 200
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url, **headers)
+
+    assert response.status_code == 200
+    assert response.json()["email"] == user.email
+    assert not _token_queries(context)
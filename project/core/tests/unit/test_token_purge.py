@@ -0,0 +1,165 @@
+"""Testes da remoção em lotes de tokens OAuth2 expirados."""
+
+import uuid
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from oauth2_provider.models import AccessToken, Application, RefreshToken
+
+from core.models.user import User
+from core.repositories.token_purge import CHECKPOINT_KEY, purge_expired_tokens
+
+REFRESH_EXPIRE = timedelta(days=30)
+
+
+@pytest.fixture(autouse=True)
+def clear_checkpoints():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(
+        email="purge@example.com", first_name="Purge", last_name="Test"
+    )
+
+
+@pytest.fixture
+def application():
+    return Application.objects.create(
+        name="purge",
+        client_type=Application.CLIENT_CONFIDENTIAL,
+        authorization_grant_type=Application.GRANT_PASSWORD,
+    )
+
+
+@pytest.fixture
+def make_tokens(user, application):
+    def make(expires_in, with_refresh=True, revoked_ago=None):
+        access = AccessToken.objects.create(
+            user=user,
+            application=application,
+            token=uuid.uuid4().hex,
+            expires=timezone.now() + expires_in,
+        )
+        refresh = None
+        if with_refresh:
+            refresh = RefreshToken.objects.create(
+                user=user,
+                application=application,
+                token=uuid.uuid4().hex,
+                access_token=access,
+                revoked=timezone.now() - revoked_ago if revoked_ago else None,
+            )
+        return access, refresh
+
+    return make
+
+
+@pytest.mark.django_db
+def test_purge_applies_rules_and_keeps_live_tokens(make_tokens):
+    """Testa as regras do cleartokens: só some o que não pode mais ser usado."""
+    live_access, live_refresh = make_tokens(timedelta(hours=1))
+    # Access expirado com refresh ainda válido: mantido
+    refreshable_access, refreshable = make_tokens(-timedelta(days=1))
+    # Access expirado há mais que a validade do refresh: os dois saem
+    stale_access, stale_refresh = make_tokens(-REFRESH_EXPIRE - timedelta(days=1))
+    # Refresh revogado há muito tempo (o access já foi trocado)
+    _, revoked = make_tokens(timedelta(hours=1), revoked_ago=REFRESH_EXPIRE * 2)
+    orphan_access, _ = make_tokens(-timedelta(minutes=1), with_refresh=False)
+    # Refresh emitido com token assinado (sem access token): velho sai, novo fica
+    _, signed_refresh = make_tokens(timedelta(hours=1))
+    _, stale_signed_refresh = make_tokens(timedelta(hours=1))
+    AccessToken.objects.filter(
+        pk__in=[signed_refresh.access_token_id, stale_signed_refresh.access_token_id]
+    ).delete()
+    RefreshToken.objects.filter(pk=stale_signed_refresh.pk).update(
+        created=timezone.now() - REFRESH_EXPIRE * 2
+    )
+
+    report = purge_expired_tokens(batch_size=10, sleep=0)
+
+    assert report.completed
+    assert {stats.rule: stats.deleted for stats in report.rules} == {
+        "refresh_revoked": 1,
+        "refresh_expired": 1,
+        "refresh_orphaned": 1,
+        "access_expired": 2,
+    }
+    assert set(RefreshToken.objects.values_list("pk", flat=True)) == {
+        live_refresh.pk,
+        refreshable.pk,
+        signed_refresh.pk,
+    }
+    remaining = set(AccessToken.objects.values_list("pk", flat=True))
+    assert {live_access.pk, refreshable_access.pk} <= remaining
+    assert not {stale_access.pk, orphan_access.pk} & remaining
+    assert not RefreshToken.objects.filter(pk=stale_refresh.pk).exists()
+    assert not RefreshToken.objects.filter(pk=revoked.pk).exists()
+
+
+@pytest.mark.django_db
+def test_purge_runs_in_fixed_batches_with_sleep(make_tokens):
+    """Testa lotes de tamanho fixo com pausa entre eles (não após o último)."""
+    for _ in range(5):
+        make_tokens(-timedelta(hours=1), with_refresh=False)
+    batches = []
+
+    with patch("core.repositories.token_purge.time.sleep") as sleep:
+        report = purge_expired_tokens(
+            batch_size=2,
+            sleep=0.5,
+            on_batch=lambda stats: batches.append((stats.rule, stats.deleted)),
+        )
+
+    assert batches == [
+        ("access_expired", 2),
+        ("access_expired", 4),
+        ("access_expired", 5),
+    ]
+    assert sleep.call_count == 2
+    sleep.assert_called_with(0.5)
+    assert report.deleted == 5
+    assert report.rows_per_second > 0
+    assert not AccessToken.objects.exists()
+
+
+@pytest.mark.django_db
+def test_purge_resumes_from_checkpoint_after_time_limit(make_tokens):
+    """Testa que o limite de tempo deixa um checkpoint usado na próxima execução."""
+    expired = [
+        make_tokens(-timedelta(hours=1), with_refresh=False)[0] for _ in range(4)
+    ]
+
+    first = purge_expired_tokens(batch_size=2, sleep=0, time_limit=0)
+
+    assert not first.completed
+    assert AccessToken.objects.count() == 2
+    key = CHECKPOINT_KEY.format(rule="access_expired")
+    assert cache.get(key) == expired[1].pk
+
+    second = purge_expired_tokens(batch_size=2, sleep=0)
+
+    assert second.completed
+    assert second.deleted == 2
+    assert not AccessToken.objects.exists()
+    assert cache.get(key) is None
+
+
+@pytest.mark.django_db
+def test_purge_checkpoint_skips_scanned_prefix_unless_restarted(make_tokens):
+    """Testa que o checkpoint pula o trecho percorrido e `resume=False` não."""
+    first, _ = make_tokens(-timedelta(hours=1), with_refresh=False)
+    second, _ = make_tokens(-timedelta(hours=1), with_refresh=False)
+    cache.set(CHECKPOINT_KEY.format(rule="access_expired"), first.pk, None)
+
+    purge_expired_tokens(batch_size=10, sleep=0)
+    assert list(AccessToken.objects.values_list("pk", flat=True)) == [first.pk]
+
+    purge_expired_tokens(batch_size=10, sleep=0, resume=False)
+    assert not AccessToken.objects.filter(pk__in=[first.pk, second.pk]).exists()
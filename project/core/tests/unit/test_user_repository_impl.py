@@ -2,9 +2,12 @@
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from core.domain.entities.user import User as DomainUser
 from core.domain.exceptions import EntityNotFoundException
+from core.repositories import user_repository_impl
 from core.repositories.user_repository_impl import DjangoUserRepository
 
 User = get_user_model()
@@ -83,3 +86,238 @@ class TestDjangoUserRepository:
         # Deve truncar para 100 caracteres e não encontrar nada
         assert isinstance(users, list)
         assert isinstance(total, int)
+
+    def test_get_page_after_cursor_walks_all_pages(self):
+        """Testa que a paginação por cursor percorre todos os usuários sem repetir."""
+        repository = DjangoUserRepository()
+        for i in range(5):
+            User.objects.create_user(
+                email=f"cursor{i}@example.com", first_name="Cursor", last_name="User"
+            )
+
+        seen = []
+        cursor = ""
+        while True:
+            users, cursor = repository.get_page_after_cursor(
+                cursor=cursor, limit=2, search_query="cursor"
+            )
+            seen.extend(user.email for user in users)
+            if cursor is None:
+                break
+
+        assert seen == [f"cursor{i}@example.com" for i in range(5)]
+
+    def test_get_page_after_cursor_last_page_has_no_next_cursor(self):
+        """Testa que a última página não retorna próximo cursor."""
+        repository = DjangoUserRepository()
+        User.objects.create_user(
+            email="single@example.com", first_name="Single", last_name="User"
+        )
+
+        users, next_cursor = repository.get_page_after_cursor(
+            cursor=None, limit=10, search_query="single"
+        )
+
+        assert [user.email for user in users] == ["single@example.com"]
+        assert next_cursor is None
+
+    def test_get_page_after_cursor_invalid_cursor(self):
+        """Testa que cursores malformados geram ValueError."""
+        repository = DjangoUserRepository()
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            repository.get_page_after_cursor(
+                cursor="not-a-cursor", limit=10, search_query=None
+            )
+
+    def test_iter_filtered_streams_in_chunks(self, django_assert_num_queries):
+        """Testa a iteração do filtro em ordem estável, sem COUNT."""
+        repository = DjangoUserRepository()
+        for i in (2, 0, 1):
+            User.objects.create_user(
+                email=f"iter{i}@example.com", first_name="Iter", last_name="User"
+            )
+
+        iterator = repository.iter_filtered(search_query="iter", chunk_size=2)
+
+        # SQLite não tem cursor do lado do servidor: uma consulta só
+        with django_assert_num_queries(1):
+            emails = [user.email for user in iterator]
+        assert emails == [f"iter{i}@example.com" for i in range(3)]
+
+    def test_bulk_create_reports_failures_without_aborting(self):
+        """Testa bulk_create com linhas inválidas e emails duplicados."""
+        repository = DjangoUserRepository()
+        User.objects.create_user(
+            email="taken@example.com", first_name="Taken", last_name="User"
+        )
+        users = [
+            DomainUser(email="ok1@example.com", first_name="Ok", last_name="One"),
+            DomainUser(email="taken@example.com", first_name="Dup", last_name="Db"),
+            DomainUser(email="not-an-email", first_name="Bad", last_name="Email"),
+            DomainUser(email="ok2@example.com", first_name="Ok", last_name="Two"),
+            DomainUser(email="ok1@example.com", first_name="Dup", last_name="Input"),
+            DomainUser(email="name@example.com", first_name="R2-D2", last_name="X"),
+        ]
+
+        result = repository.bulk_create(users, ["!unusable"] * len(users), 100)
+
+        assert [user.email for user in result.created] == [
+            "ok1@example.com",
+            "ok2@example.com",
+        ]
+        assert [(f.index, next(iter(f.errors))) for f in result.failures] == [
+            (1, "email"),
+            (2, "email"),
+            (4, "email"),
+            (5, "first_name"),
+        ]
+        created = User.objects.get(email="ok2@example.com")
+        assert created.password == "!unusable"
+        assert str(created.id) == users[3].id
+
+    def test_check_bulk_create_reports_without_writing(self, django_assert_num_queries):
+        """Testa a checagem prévia: mesmas falhas de bulk_create, sem INSERT."""
+        repository = DjangoUserRepository()
+        User.objects.create_user(
+            email="taken@example.com", first_name="Taken", last_name="User"
+        )
+        users = [
+            DomainUser(email="ok@example.com", first_name="Ok", last_name="One"),
+            DomainUser(email="taken@example.com", first_name="Dup", last_name="Db"),
+            DomainUser(email="not-an-email", first_name="Bad", last_name="Email"),
+            DomainUser(email="ok@example.com", first_name="Dup", last_name="Input"),
+        ]
+
+        with django_assert_num_queries(1):
+            failures = repository.check_bulk_create(users)
+
+        assert [failure.index for failure in failures] == [1, 2, 3]
+        assert not User.objects.filter(email="ok@example.com").exists()
+
+    def test_bulk_create_falls_back_to_row_by_row_on_conflict(self, monkeypatch):
+        """Testa a inserção linha a linha quando o INSERT em lote conflita."""
+        repository = DjangoUserRepository()
+        User.objects.create_user(
+            email="race@example.com", first_name="Race", last_name="User"
+        )
+        # Simula outra importação inserindo o email após a checagem
+        monkeypatch.setattr(
+            DjangoUserRepository, "_existing_emails", staticmethod(lambda emails: set())
+        )
+        users = [
+            DomainUser(email="race@example.com", first_name="Race", last_name="Two"),
+            DomainUser(email="fresh@example.com", first_name="Fresh", last_name="U"),
+        ]
+
+        result = repository.bulk_create(users, ["!x", "!y"], 100)
+
+        assert [user.email for user in result.created] == ["fresh@example.com"]
+        assert [failure.index for failure in result.failures] == [0]
+        assert User.objects.filter(email="race@example.com").count() == 1
+
+    def test_get_by_ids_returns_found_users(self):
+        """Testa busca em lote ignorando IDs inexistentes."""
+        repository = DjangoUserRepository()
+        user = User.objects.create_user(
+            email="batch@example.com", first_name="Batch", last_name="User"
+        )
+        missing_id = "00000000-0000-0000-0000-000000000000"
+
+        result = repository.get_by_ids([str(user.id), missing_id, str(user.id)])
+
+        assert list(result) == [str(user.id)]
+        assert result[str(user.id)].email == "batch@example.com"
+
+    def test_get_by_ids_excludes_superusers(self):
+        """Testa que superusuários ficam fora, como na listagem."""
+        repository = DjangoUserRepository()
+        admin = User.objects.create_superuser(
+            email="batch-admin@example.com",
+            password="adminpassword123",
+            first_name="Batch",
+            last_name="Admin",
+        )
+
+        assert repository.get_by_ids([str(admin.id)]) == {}
+
+    def test_get_by_ids_chunks_queries(self, monkeypatch, django_assert_num_queries):
+        """Testa que listas grandes de IDs são divididas em blocos."""
+        monkeypatch.setattr(user_repository_impl, "IN_QUERY_CHUNK_SIZE", 2)
+        repository = DjangoUserRepository()
+        ids = [
+            str(
+                User.objects.create_user(
+                    email=f"chunk{i}@example.com", first_name="Chunk", last_name="User"
+                ).id
+            )
+            for i in range(5)
+        ]
+
+        with django_assert_num_queries(3):
+            result = repository.get_by_ids(ids)
+
+        assert set(result) == set(ids)
+
+    def test_read_paths_do_not_load_password(self):
+        """Testa que leituras projetam apenas as colunas da entidade de domínio."""
+        repository = DjangoUserRepository()
+        user = User.objects.create_user(
+            email="projection@example.com",
+            password="secret123",
+            first_name="Projection",
+            last_name="User",
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            by_id = repository.get_by_id(str(user.id))
+            by_email = repository.get_user_by_email("projection@example.com")
+            repository.get_all()
+            repository.get_all_paginated_filtered(
+                offset=0, limit=10, search_query="projection"
+            )
+
+        assert by_id == by_email
+        assert by_id.first_name == "Projection"
+        assert by_id.is_active is True
+        for query in ctx.captured_queries:
+            assert "password" not in query["sql"]
+            assert "last_login" not in query["sql"]
+
+    def test_update_user_single_statement(self, django_assert_num_queries):
+        """Testa que update usa um único UPDATE ... RETURNING."""
+        repository = DjangoUserRepository()
+        user = User.objects.create_user(
+            email="before@example.com",
+            first_name="Before",
+            last_name="User",
+            is_staff=True,
+        )
+        domain_user = DomainUser(
+            id=str(user.id),
+            email="after@example.com",
+            first_name="After",
+            last_name="Updated",
+        )
+
+        with django_assert_num_queries(1):
+            updated = repository.update(domain_user)
+
+        assert updated.id == str(user.id)
+        assert updated.email == "after@example.com"
+        assert updated.last_name == "Updated"
+        # Flags não fazem parte da atualização de perfil
+        assert updated.is_staff is True
+        user.refresh_from_db()
+        assert user.first_name == "After"
+
+    def test_delete_user_success(self):
+        """Testa remoção de usuário existente."""
+        repository = DjangoUserRepository()
+        user = User.objects.create_user(
+            email="delete@example.com", first_name="Delete", last_name="User"
+        )
+
+        repository.delete(str(user.id))
+
+        assert not User.objects.filter(id=user.id).exists()
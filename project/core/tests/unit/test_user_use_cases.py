@@ -1,20 +1,32 @@
+import asyncio
 import uuid
 from unittest.mock import Mock
 
 import pytest
-from core.domain.data_access import UserRepository
+from core.domain.data_access import (
+    BulkCreateFailure,
+    BulkCreateResult,
+    ItemCount,
+    UserRepository,
+)
 from core.domain.entities.user import User as DomainUser
 from core.domain.exceptions import AuthenticationError, EntityNotFoundException
 from core.domain.gateways import AuthGateway
 from core.domain.use_cases.user_use_cases import (
+    BulkCreateUsersRequest,
+    BulkCreateUsersUseCase,
     ChangeUserPasswordRequest,
     ChangeUserPasswordResponse,
     ChangeUserPasswordUseCase,
     CreateUserRequest,
     CreateUserResponse,
     CreateUserUseCase,
+    ExportUsersRequest,
+    ExportUsersUseCase,
     GetUserByIdRequest,
     GetUserByIdUseCase,
+    GetUsersByIdsRequest,
+    GetUsersByIdsUseCase,
     ListUsersRequest,
     ListUsersResponse,
     ListUsersUseCase,
@@ -159,6 +171,56 @@ def test_login_user_use_case_invalid_password(mock_user_repository, mock_auth_ga
     mock_auth_gateway.create_tokens.assert_not_called()
 
 
+def test_login_user_use_case_aexecute(mock_user_repository, mock_auth_gateway):
+    user_id = str(uuid.uuid4())
+    login_request = LoginUserRequest(email="test@example.com", password="password123")
+    domain_user = DomainUser(
+        id=user_id, email=login_request.email, first_name="Test", last_name="User"
+    )
+
+    mock_user_repository.aget_user_by_email.return_value = domain_user
+    mock_auth_gateway.acheck_password.return_value = True
+    mock_auth_gateway.acreate_tokens.return_value = ("access", "refresh")
+
+    use_case = LoginUserUseCase(
+        user_repository=mock_user_repository, auth_gateway=mock_auth_gateway
+    )
+    response = asyncio.run(use_case.aexecute(login_request))
+
+    mock_user_repository.aget_user_by_email.assert_awaited_once_with(
+        login_request.email
+    )
+    mock_auth_gateway.acheck_password.assert_awaited_once_with(
+        user_id, login_request.password
+    )
+    mock_user_repository.get_user_by_email.assert_not_called()
+    assert response.access_token == "access"
+    assert response.refresh_token == "refresh"
+
+
+def test_login_user_use_case_aexecute_invalid_password(
+    mock_user_repository, mock_auth_gateway
+):
+    domain_user = DomainUser(
+        id=str(uuid.uuid4()), email="test@example.com", first_name="T", last_name="U"
+    )
+    mock_user_repository.aget_user_by_email.return_value = domain_user
+    mock_auth_gateway.acheck_password.return_value = False
+
+    use_case = LoginUserUseCase(
+        user_repository=mock_user_repository, auth_gateway=mock_auth_gateway
+    )
+
+    with pytest.raises(AuthenticationError, match="Invalid credentials"):
+        asyncio.run(
+            use_case.aexecute(
+                LoginUserRequest(email="test@example.com", password="wrong")
+            )
+        )
+
+    mock_auth_gateway.acreate_tokens.assert_not_called()
+
+
 # Testes para ChangeUserPasswordUseCase
 def test_change_user_password_use_case_success(mock_user_repository, mock_auth_gateway):
     user_id = str(uuid.uuid4())
@@ -291,6 +353,83 @@ def test_list_users_use_case_with_pagination_and_filter(mock_user_repository):
     assert len(response.users) == 1
     assert response.total_items == 1
     assert response.users[0].email == "filtered@example.com"
+    assert response.total_items_exact is True
+
+
+def test_list_users_use_case_inexact_total(mock_user_repository):
+    list_request = ListUsersRequest(offset=0, limit=10, search_query=None)
+    mock_user_repository.get_all_paginated_filtered.return_value = (
+        [],
+        ItemCount(10000, exact=False),
+    )
+
+    use_case = ListUsersUseCase(user_repository=mock_user_repository)
+    response = use_case.execute(list_request)
+
+    assert response.total_items == 10000
+    assert response.total_items_exact is False
+
+
+def test_list_users_use_case_by_cursor(mock_user_repository):
+    domain_users = [
+        DomainUser(
+            id=str(uuid.uuid4()),
+            email="cursor@example.com",
+            first_name="Cursor",
+            last_name="User",
+        ),
+    ]
+    list_request = ListUsersRequest(limit=1, search_query=None, cursor="")
+
+    mock_user_repository.get_page_after_cursor.return_value = (
+        domain_users,
+        "next-cursor",
+    )
+
+    use_case = ListUsersUseCase(user_repository=mock_user_repository)
+    response = use_case.execute(list_request)
+
+    mock_user_repository.get_page_after_cursor.assert_called_once_with(
+        cursor="", limit=1, search_query=None
+    )
+    mock_user_repository.get_all_paginated_filtered.assert_not_called()
+    assert len(response.users) == 1
+    assert response.total_items is None
+    assert response.next_cursor == "next-cursor"
+
+
+def test_list_users_use_case_aexecute(mock_user_repository):
+    domain_users = [
+        DomainUser(
+            id=str(uuid.uuid4()),
+            email="async@example.com",
+            first_name="Async",
+            last_name="User",
+        ),
+    ]
+    mock_user_repository.aget_all_paginated_filtered.return_value = (
+        domain_users,
+        ItemCount(1, exact=True),
+    )
+    mock_user_repository.aget_page_after_cursor.return_value = (domain_users, None)
+
+    use_case = ListUsersUseCase(user_repository=mock_user_repository)
+    by_offset = asyncio.run(
+        use_case.aexecute(ListUsersRequest(offset=0, limit=10, search_query="a"))
+    )
+    by_cursor = asyncio.run(
+        use_case.aexecute(ListUsersRequest(limit=10, search_query=None, cursor=""))
+    )
+
+    mock_user_repository.aget_all_paginated_filtered.assert_awaited_once_with(
+        offset=0, limit=10, search_query="a"
+    )
+    mock_user_repository.aget_page_after_cursor.assert_awaited_once_with(
+        cursor="", limit=10, search_query=None
+    )
+    assert by_offset.total_items == 1
+    assert by_cursor.users == by_offset.users
+    assert by_cursor.next_cursor is None
 
 
 # Testes para GetUserByIdUseCase
@@ -325,3 +464,164 @@ def test_get_user_by_id_use_case_not_found(mock_user_repository):
         use_case.execute(get_request)
 
     mock_user_repository.get_by_id.assert_called_once_with(user_id)
+
+
+def test_get_user_by_id_use_case_aexecute_not_found(mock_user_repository):
+    mock_user_repository.aget_by_id.return_value = None
+
+    use_case = GetUserByIdUseCase(user_repository=mock_user_repository)
+
+    with pytest.raises(EntityNotFoundException):
+        asyncio.run(use_case.aexecute(GetUserByIdRequest(user_id=str(uuid.uuid4()))))
+
+    mock_user_repository.get_by_id.assert_not_called()
+
+
+# Testes para GetUsersByIdsUseCase
+def test_get_users_by_ids_use_case_preserves_order_and_reports_missing(
+    mock_user_repository,
+):
+    first_id, second_id, missing_id = (str(uuid.uuid4()) for _ in range(3))
+    mock_user_repository.get_by_ids.return_value = {
+        first_id: DomainUser(
+            id=first_id, email="first@example.com", first_name="A", last_name="B"
+        ),
+        second_id: DomainUser(
+            id=second_id, email="second@example.com", first_name="C", last_name="D"
+        ),
+    }
+
+    use_case = GetUsersByIdsUseCase(user_repository=mock_user_repository)
+    response = use_case.execute(
+        GetUsersByIdsRequest(user_ids=[second_id, missing_id, first_id])
+    )
+
+    mock_user_repository.get_by_ids.assert_called_once_with(
+        [second_id, missing_id, first_id]
+    )
+    assert [user.id for user in response.users] == [second_id, first_id]
+    assert response.not_found == [missing_id]
+
+
+# Testes para ExportUsersUseCase
+def test_export_users_use_case_is_lazy(mock_user_repository):
+    domain_user = DomainUser(
+        id=str(uuid.uuid4()), email="export@example.com", first_name="E", last_name="U"
+    )
+    mock_user_repository.iter_filtered.return_value = iter([domain_user])
+
+    use_case = ExportUsersUseCase(user_repository=mock_user_repository)
+    rows = use_case.execute(ExportUsersRequest(search_query="exp", chunk_size=50))
+
+    mock_user_repository.iter_filtered.assert_not_called()
+    assert [row.email for row in rows] == ["export@example.com"]
+    mock_user_repository.iter_filtered.assert_called_once_with("exp", 50)
+
+
+# Testes para BulkCreateUsersUseCase
+def test_bulk_create_users_use_case_batches_and_maps_failures(
+    mock_user_repository, mock_auth_gateway
+):
+    rows = (
+        CreateUserRequest(
+            email=f"bulk{i}@example.com",
+            first_name="Bulk",
+            last_name="User",
+            password=None if i == 1 else ("short" if i == 2 else "password123"),
+        )
+        for i in range(5)
+    )
+    mock_auth_gateway.hash_passwords.side_effect = lambda passwords: [
+        f"hash:{password}" for password in passwords
+    ]
+    # Rejeita o primeiro usuário válido de cada lote (ex.: email existente)
+    mock_user_repository.check_bulk_create.side_effect = lambda users: [
+        BulkCreateFailure(0, users[0].email, {"email": ["exists"]})
+    ]
+    mock_user_repository.bulk_create.side_effect = (
+        lambda users, password_hashes, batch_size: BulkCreateResult(users, [])
+    )
+
+    use_case = BulkCreateUsersUseCase(
+        user_repository=mock_user_repository, auth_gateway=mock_auth_gateway
+    )
+    response = use_case.execute(BulkCreateUsersRequest(users=rows, batch_size=3))
+
+    # Lote 1: linhas 0-2 (linha 2 com senha curta e linha 0 rejeitada pelo
+    # repositório não chegam ao hashing). Lote 2: linhas 3-4
+    assert [call.args for call in mock_auth_gateway.hash_passwords.call_args_list] == [
+        ([None],),
+        (["password123"],),
+    ]
+    assert mock_user_repository.bulk_create.call_count == 2
+    assert response.processed == 5
+    assert response.created == 2
+    assert [(f.index, list(f.errors)) for f in response.failures] == [
+        (0, ["email"]),
+        (2, ["password"]),
+        (3, ["email"]),
+    ]
+
+
+def test_bulk_create_users_use_case_maps_insert_failures(
+    mock_user_repository, mock_auth_gateway
+):
+    """Testa índices de falhas do INSERT após o filtro prévio do repositório."""
+    rows = [
+        CreateUserRequest(
+            email=f"late{i}@example.com",
+            first_name="Late",
+            last_name="Race",
+            password=None,
+        )
+        for i in range(3)
+    ]
+    mock_auth_gateway.hash_passwords.side_effect = lambda passwords: ["!"] * len(
+        passwords
+    )
+    mock_user_repository.check_bulk_create.return_value = [
+        BulkCreateFailure(0, "late0@example.com", {"email": ["exists"]})
+    ]
+    # Inserção concorrente: o 2º usuário enviado (linha 2) conflita
+    mock_user_repository.bulk_create.side_effect = (
+        lambda users, password_hashes, batch_size: BulkCreateResult(
+            users[:1], [BulkCreateFailure(1, users[1].email, {"email": ["exists"]})]
+        )
+    )
+
+    use_case = BulkCreateUsersUseCase(
+        user_repository=mock_user_repository, auth_gateway=mock_auth_gateway
+    )
+    response = use_case.execute(BulkCreateUsersRequest(users=rows))
+
+    sent = mock_user_repository.bulk_create.call_args.args[0]
+    assert [user.email for user in sent] == ["late1@example.com", "late2@example.com"]
+    assert [(f.index, f.email) for f in response.failures] == [
+        (0, "late0@example.com"),
+        (2, "late2@example.com"),
+    ]
+    assert response.created == 1
+
+
+def test_bulk_create_users_use_case_requires_fields(
+    mock_user_repository, mock_auth_gateway
+):
+    mock_auth_gateway.hash_passwords.return_value = []
+    mock_user_repository.check_bulk_create.return_value = []
+    mock_user_repository.bulk_create.return_value = BulkCreateResult([], [])
+
+    use_case = BulkCreateUsersUseCase(
+        user_repository=mock_user_repository, auth_gateway=mock_auth_gateway
+    )
+    response = use_case.execute(
+        BulkCreateUsersRequest(
+            users=[
+                CreateUserRequest(
+                    email=" ", first_name="", last_name="X", password=None
+                )
+            ]
+        )
+    )
+
+    assert response.created == 0
+    assert response.failures[0].errors.keys() == {"email", "first_name"}
@@ -1,5 +1,7 @@
 from oauth2_provider.oauth2_validators import OAuth2Validator
 
+from core.repositories import signed_tokens
+
 
 class SafeOAuth2Validator(OAuth2Validator):
     """OAuth2 validator que delega às validações padrão com políticas explícitas.
@@ -21,3 +23,20 @@ class SafeOAuth2Validator(OAuth2Validator):
             application=application, request=request, *args, **kwargs
         )
         return available_scopes or ["read", "write"]
+
+    def revoke_token(self, token, token_type_hint, request, *args, **kwargs):
+        """Revoga também os access tokens assinados, que não ficam no banco.
+
+        Um token assinado só é revogado pela aplicação que o recebeu; nos
+        demais casos a resposta é a mesma (RFC 7009, seção 2.2).
+        """
+        if not signed_tokens.is_signed_token(token):
+            return super().revoke_token(
+                token, token_type_hint, request, *args, **kwargs
+            )
+        access_token = signed_tokens.verify(token)
+        if (
+            access_token is not None
+            and access_token.application_id == request.client.pk
+        ):
+            signed_tokens.revoke(token)
@@ -19,11 +19,47 @@ env = environ.Env(
     ALLOWED_HOSTS=(list, ["127.0.0.1", "localhost"]),
     DATABASE_URL=(str, ""),
     REDIS_URL=(str, ""),
+    API_ASYNC_VIEWS=(bool, False),
+    DATABASE_REPLICA_URL=(str, ""),
+    DATABASE_REPLICA_APPS=(list, ["core"]),
+    DB_CONN_MAX_AGE=(int, 60),
+    DB_CONN_HEALTH_CHECKS=(bool, True),
+    DB_POOL_ENABLED=(bool, False),
+    DB_POOL_MIN_SIZE=(int, 2),
+    DB_POOL_MAX_SIZE=(int, 10),
+    DB_POOL_TIMEOUT=(float, 10.0),
+    CACHE_KEY_PREFIX=(str, "django_base"),
+    CACHE_DEFAULT_TIMEOUT=(int, 300),
+    CACHE_MAX_CONNECTIONS=(int, 50),
+    CACHE_SOCKET_TIMEOUT=(float, 0.5),
+    CACHE_SERIALIZER=(str, "pickle"),
+    CACHE_COMPRESS_MIN_BYTES=(int, 1024),
     OAUTH2_CLIENT_ID=(str, "test-client-id"),
     OAUTH2_SCOPES=(str, "read write"),
     OAUTH2_ACCESS_TOKEN_EXPIRE_SECONDS=(int, 86400),
     OAUTH2_REFRESH_TOKEN_EXPIRE_SECONDS=(int, 2592000),
+    OAUTH2_APPLICATION_CACHE_TTL=(int, 300),
+    OAUTH2_SIGNED_TOKEN_APPLICATIONS=(list, []),
+    OAUTH2_SIGNED_TOKEN_KEYS=(dict, {}),
+    OAUTH2_SIGNED_TOKEN_ACTIVE_KEY=(str, ""),
+    TOKEN_PURGE_BATCH_SIZE=(int, 1000),
+    TOKEN_PURGE_BATCH_SLEEP=(float, 0.1),
+    PASSWORD_HASHING_POOL_SIZE=(int, 0),
+    PASSWORD_HASHING_QUEUE_LIMIT=(int, 8),
+    PASSWORD_HASHING_RETRY_AFTER=(int, 1),
+    PASSWORD_BULK_HASHING_PROCESSES=(int, 0),
+    RATE_LIMIT_LOCAL_BATCH=(int, 10),
+    RATE_LIMIT_LOCAL_SYNC_INTERVAL=(float, 1.0),
+    REQUEST_TIMING_SAMPLE_RATE=(float, 0.0),
     DRF_PAGE_SIZE=(int, 50),
+    USER_LIST_COUNT_STRATEGY=(str, "exact"),
+    USER_LIST_COUNT_CAP=(int, 10000),
+    USER_LIST_COUNT_CACHE_TTL=(int, 30),
+    USER_EXPORT_CHUNK_SIZE=(int, 2000),
+    USER_BULK_IMPORT_BATCH_SIZE=(int, 1000),
+    USER_BULK_IMPORT_API_MAX_ROWS=(int, 25),
+    USER_REPOSITORY_CACHE_TTL_BY_ID=(int, 300),
+    USER_REPOSITORY_CACHE_TTL_BY_EMAIL=(int, 300),
 )
 
 # Read .env file - try multiple locations for flexibility
@@ -58,6 +94,37 @@ ALLOWED_HOSTS = (
 # OAuth2 Configuration
 OAUTH2_CLIENT_ID = env("OAUTH2_CLIENT_ID")
 OAUTH2_SCOPES = env("OAUTH2_SCOPES")
+# TTL (s) do cache em processo da Application OAuth2 usada no login
+OAUTH2_APPLICATION_CACHE_TTL = env("OAUTH2_APPLICATION_CACHE_TTL")
+# Access tokens assinados (HMAC) para os client_ids listados; os demais
+# recebem tokens opacos. Chaves no formato "kid=segredo,kid2=segredo2": a
+# ativa (padrão: a primeira) assina, as outras só verificam (rotação)
+OAUTH2_SIGNED_TOKEN_APPLICATIONS = env("OAUTH2_SIGNED_TOKEN_APPLICATIONS")
+OAUTH2_SIGNED_TOKEN_KEYS = env("OAUTH2_SIGNED_TOKEN_KEYS")
+OAUTH2_SIGNED_TOKEN_ACTIVE_KEY = env("OAUTH2_SIGNED_TOKEN_ACTIVE_KEY")
+# Remoção de tokens expirados (purge_expired_tokens): linhas por lote e
+# pausa (s) entre lotes
+TOKEN_PURGE_BATCH_SIZE = env("TOKEN_PURGE_BATCH_SIZE")
+TOKEN_PURGE_BATCH_SLEEP = env("TOKEN_PURGE_BATCH_SLEEP")
+
+# Pool limitado para hashing de senhas (0 = número de CPUs). A falha rápida
+# (503 + Retry-After) só ocorre com concorrência no processo: views
+# assíncronas (API_ASYNC_VIEWS) ou workers com threads
+PASSWORD_HASHING_POOL_SIZE = env("PASSWORD_HASHING_POOL_SIZE")
+PASSWORD_HASHING_QUEUE_LIMIT = env("PASSWORD_HASHING_QUEUE_LIMIT")
+PASSWORD_HASHING_RETRY_AFTER = env("PASSWORD_HASHING_RETRY_AFTER")
+# Processos para hashing em importações em massa (0 = número de CPUs)
+PASSWORD_BULK_HASHING_PROCESSES = env("PASSWORD_BULK_HASHING_PROCESSES")
+
+# Nível local do rate limiting: decisões por worker sem ir ao cache.
+# Erro máximo do limite global: RATE_LIMIT_LOCAL_BATCH por worker (0 desativa)
+RATE_LIMIT_LOCAL_BATCH = env("RATE_LIMIT_LOCAL_BATCH")
+RATE_LIMIT_LOCAL_SYNC_INTERVAL = env("RATE_LIMIT_LOCAL_SYNC_INTERVAL")
+
+# Fração das requisições medidas pelo ServerTimingMiddleware (header
+# Server-Timing só para staff + evento "Request timing" no log); 0 desativa,
+# 1 mede todas
+REQUEST_TIMING_SAMPLE_RATE = env("REQUEST_TIMING_SAMPLE_RATE")
 
 
 # Application definition
@@ -78,6 +145,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.server_timing_middleware.ServerTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -87,8 +155,16 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.middleware.db_routing_middleware.DatabaseRoutingMiddleware",
+    "core.middleware.identity_map_middleware.IdentityMapMiddleware",
+    "core.middleware.rate_limit_headers_middleware.RateLimitHeadersMiddleware",
 ]
 
+# Deploy ASGI (project.asgi:application): login, listagem e busca de
+# usuários usam views assíncronas. O WhiteNoise continua servindo os
+# estáticos (admin, DRF); por ser síncrono, o Django o adapta sob ASGI
+API_ASYNC_VIEWS = env("API_ASYNC_VIEWS")
+
 ROOT_URLCONF = "project.urls"
 
 TEMPLATES = [
@@ -239,6 +315,87 @@ else:
             },
         }
 
+    # Conexões reaproveitadas entre requisições em vez de um handshake
+    # TCP + autenticação por requisição. Com DB_POOL_ENABLED usa o pool
+    # nativo do psycopg 3 (o Django exige CONN_MAX_AGE = 0 nesse modo).
+    if "postgresql" in DATABASES["default"]["ENGINE"]:
+        if env("DB_POOL_ENABLED"):
+            from psycopg_pool import ConnectionPool
+
+            DATABASES["default"]["CONN_MAX_AGE"] = 0
+            DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+                "min_size": env("DB_POOL_MIN_SIZE"),
+                "max_size": env("DB_POOL_MAX_SIZE"),
+                "timeout": env("DB_POOL_TIMEOUT"),
+                # Valida a conexão ao retirá-la do pool (health check)
+                "check": ConnectionPool.check_connection,
+            }
+        else:
+            DATABASES["default"]["CONN_MAX_AGE"] = env("DB_CONN_MAX_AGE")
+            DATABASES["default"]["CONN_HEALTH_CHECKS"] = env("DB_CONN_HEALTH_CHECKS")
+
+# Réplica de leitura: leituras dos apps em DATABASE_REPLICA_APPS vão para
+# "replica" e escritas para "default" (ver core/db_router.py). Localmente
+# pode ser outro SQLite, ex.: DATABASE_REPLICA_URL=sqlite:///replica.sqlite3
+DATABASE_ROUTERS = []
+DATABASE_REPLICA_APPS = env("DATABASE_REPLICA_APPS")
+if env("DATABASE_REPLICA_URL"):
+    DATABASES["replica"] = env.db("DATABASE_REPLICA_URL")
+    # Mesmas opções de conexão do primário (persistência/pool)
+    if "postgresql" in DATABASES["replica"]["ENGINE"]:
+        for option in ("CONN_MAX_AGE", "CONN_HEALTH_CHECKS"):
+            if option in DATABASES["default"]:
+                DATABASES["replica"][option] = DATABASES["default"][option]
+        if "pool" in DATABASES["default"].get("OPTIONS", {}):
+            DATABASES["replica"].setdefault("OPTIONS", {})["pool"] = DATABASES[
+                "default"
+            ]["OPTIONS"]["pool"]
+    # Nos testes a réplica espelha o banco de teste do primário
+    DATABASES["replica"]["TEST"] = {"MIRROR": "default"}
+    DATABASE_ROUTERS = ["core.db_router.PrimaryReplicaRouter"]
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/#redis
+# Com REDIS_URL o cache é compartilhado entre os workers (throttling, sessões,
+# cache de repositório); sem ele, cada processo tem seu próprio LocMemCache.
+REDIS_URL = env("REDIS_URL")
+CACHE_COMPRESS_MIN_BYTES = env("CACHE_COMPRESS_MIN_BYTES")
+CACHE_SERIALIZERS = {
+    "pickle": "core.repositories.cache_serializers.PickleSerializer",
+    "json": "core.repositories.cache_serializers.JSONSerializer",
+}
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "core.repositories.cache_backends.TimedRedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": env("CACHE_KEY_PREFIX"),
+            "TIMEOUT": env("CACHE_DEFAULT_TIMEOUT"),
+            "OPTIONS": {
+                # Pool bloqueante: espera por conexão livre em vez de abrir mais
+                "pool_class": "redis.BlockingConnectionPool",
+                "max_connections": env("CACHE_MAX_CONNECTIONS"),
+                "timeout": env("CACHE_SOCKET_TIMEOUT"),
+                "socket_connect_timeout": env("CACHE_SOCKET_TIMEOUT"),
+                "socket_timeout": env("CACHE_SOCKET_TIMEOUT"),
+                "health_check_interval": 30,
+                "serializer": CACHE_SERIALIZERS[env("CACHE_SERIALIZER")],
+            },
+        }
+    }
+    # Sessões lidas do cache, com o banco como fonte de verdade
+    SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "core.repositories.cache_backends.TimedLocMemCache",
+            "LOCATION": "django-base",
+            "KEY_PREFIX": env("CACHE_KEY_PREFIX"),
+            "TIMEOUT": env("CACHE_DEFAULT_TIMEOUT"),
+        }
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -302,9 +459,10 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "oauth2_provider.contrib.rest_framework.OAuth2Authentication"
+        "core.api.authentication.CachedOAuth2Authentication"
     ],
     "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.IsAuthenticated"],
+    "DEFAULT_RENDERER_CLASSES": ["core.api.renderers.ORJSONRenderer"],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
     "PAGE_SIZE": env("DRF_PAGE_SIZE"),
     "DEFAULT_THROTTLE_CLASSES": [
@@ -323,6 +481,41 @@ if DEBUG:
     REST_FRAMEWORK["DEFAULT_AUTHENTICATION_CLASSES"].append(
         "rest_framework.authentication.SessionAuthentication"
     )
+    # API navegável só em desenvolvimento; em produção a negociação de
+    # conteúdo fica com um único renderer JSON
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].append(
+        "rest_framework.renderers.BrowsableAPIRenderer"
+    )
+
+# Contagem do total na listagem de usuários: exact | capped | estimate | cached
+USER_LIST_COUNT_STRATEGY = env("USER_LIST_COUNT_STRATEGY")
+USER_LIST_COUNT_CAP = env("USER_LIST_COUNT_CAP")
+USER_LIST_COUNT_CACHE_TTL = env("USER_LIST_COUNT_CACHE_TTL")
+
+# Linhas por bloco do cursor do lado do servidor em /v1/users/export/
+USER_EXPORT_CHUNK_SIZE = env("USER_EXPORT_CHUNK_SIZE")
+
+# Linhas por lote (validação, hashing e INSERT) nas importações em massa
+USER_BULK_IMPORT_BATCH_SIZE = env("USER_BULK_IMPORT_BATCH_SIZE")
+# Linhas por requisição em /v1/users/bulk-import/: o hashing roda na própria
+# requisição (~0,3 s por senha com PBKDF2) e precisa caber no timeout do worker
+USER_BULK_IMPORT_API_MAX_ROWS = env("USER_BULK_IMPORT_API_MAX_ROWS")
+
+# TTL (s) do cache de access tokens validados na autenticação da API
+# (0 desativa). Ativo por padrão só com cache compartilhado (Redis), onde a
+# revogação invalida a entrada em todos os workers
+OAUTH2_TOKEN_CACHE_TTL = env.int(
+    "OAUTH2_TOKEN_CACHE_TTL", default=60 if REDIS_URL else 0
+)
+
+# Cache read-through de usuários (por ID e email) no repositório
+# Ativo por padrão quando há cache compartilhado (Redis)
+USER_REPOSITORY_CACHE_ENABLED = env.bool(
+    "USER_REPOSITORY_CACHE_ENABLED", default=bool(REDIS_URL)
+)
+USER_REPOSITORY_CACHE_ALIAS = "default"
+USER_REPOSITORY_CACHE_TTL_BY_ID = env("USER_REPOSITORY_CACHE_TTL_BY_ID")
+USER_REPOSITORY_CACHE_TTL_BY_EMAIL = env("USER_REPOSITORY_CACHE_TTL_BY_EMAIL")
 
 # Admin urls configuration
 LOGIN_URL = "/admin/login/"
@@ -522,7 +715,7 @@ SPECTACULAR_SETTINGS = {
     "COMPONENT_SPLIT_REQUEST": True,
     "SCHEMA_PATH_PREFIX": "/api/v1/",
     "AUTHENTICATION_WHITELIST": [
-        "oauth2_provider.contrib.rest_framework.OAuth2Authentication",
+        "core.api.authentication.CachedOAuth2Authentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
     "OAUTH2_FLOWS": ["authorizationCode", "clientCredentials"],
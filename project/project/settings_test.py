@@ -5,8 +5,25 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
+    },
+    # Segundo SQLite, sem replicação, para testar o roteamento; o router só
+    # é ativado nos testes que o habilitam via override_settings
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    },
+}
+DATABASE_ROUTERS = []
+
+# Cache local em memória nos testes, mesmo com REDIS_URL no ambiente (CI)
+CACHES = {
+    "default": {
+        "BACKEND": "core.repositories.cache_backends.TimedLocMemCache",
+        "LOCATION": "django-base-tests",
     }
 }
+SESSION_ENGINE = "django.contrib.sessions.backends.db"
+USER_REPOSITORY_CACHE_ENABLED = False
 
 # Explicitly define ROOT_URLCONF for tests
 ROOT_URLCONF = "project.urls"
@@ -27,6 +44,7 @@ INSTALLED_APPS = [
 
 # Explicitly define MIDDLEWARE for tests to ensure all necessary middleware classes are loaded.
 MIDDLEWARE = [
+    "core.middleware.server_timing_middleware.ServerTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -34,13 +52,18 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.middleware.db_routing_middleware.DatabaseRoutingMiddleware",
+    "core.middleware.identity_map_middleware.IdentityMapMiddleware",
+    "core.middleware.rate_limit_headers_middleware.RateLimitHeadersMiddleware",
 ]
 
 # Configure REST_FRAMEWORK for tests to allow simpler authentication and permissions.
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "oauth2_provider.contrib.rest_framework.OAuth2Authentication",  # Prioriza OAuth2
+        "core.api.authentication.CachedOAuth2Authentication",  # Prioriza OAuth2
     ],
+    # O mesmo renderer da produção, para que a suíte o exercite
+    "DEFAULT_RENDERER_CLASSES": ["core.api.renderers.ORJSONRenderer"],
     "EXCEPTION_HANDLER": "core.middleware.custom_exception_middleware.custom_exception_handler",  # Reativa o handler de exceções customizado para testes
 }
 
@@ -52,6 +75,14 @@ if DEBUG:
         "rest_framework.authentication.BasicAuthentication"
     )
 
+# Throttles decidem sempre pelo cache compartilhado nos testes (determinístico);
+# o nível local é exercitado explicitamente em test_throttles.py
+RATE_LIMIT_LOCAL_BATCH = 0
+
+# Hashing em lote no próprio processo (sem fork do pytest); o pool de
+# processos é exercitado explicitamente em test_hashing_pool.py
+PASSWORD_BULK_HASHING_PROCESSES = 1
+
 # Ensure DEBUG is True for tests if needed, or adjust as per your testing strategy
 DEBUG = True
 
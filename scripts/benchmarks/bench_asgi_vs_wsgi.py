@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Benchmark de throughput WSGI x ASGI em ``GET /v1/users/<id>/``.
+
+Dispara requisições concorrentes contra dois servidores já em execução
+(mesmo banco) e reporta req/s e p50/p99 de cada um. Diferente dos demais
+benchmarks, mede o servidor real: o ganho do ASGI só aparece com I/O
+concorrente, que o test client não reproduz.
+
+Uso:
+    # 1. cria usuário admin + token (imprime USER_ID e TOKEN)
+    python scripts/benchmarks/bench_asgi_vs_wsgi.py --setup
+
+    # 2. sobe os dois servidores
+    gunicorn project.wsgi:application --workers 4 --bind 127.0.0.1:8000
+    API_ASYNC_VIEWS=True gunicorn project.asgi:application \\
+        -k uvicorn_worker.UvicornWorker --workers 4 --bind 127.0.0.1:8001
+
+    # 3. mede
+    python scripts/benchmarks/bench_asgi_vs_wsgi.py USER_ID TOKEN \\
+        [requisicoes] [concorrencia]
+"""
+
+import os
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from common import percentile
+
+SERVERS = {
+    "WSGI (gunicorn sync)": os.environ.get("WSGI_URL", "http://127.0.0.1:8000"),
+    "ASGI (gunicorn + uvicorn)": os.environ.get("ASGI_URL", "http://127.0.0.1:8001"),
+}
+
+
+def setup():
+    """Cria (ou reaproveita) um admin e um access token de longa duração."""
+    import uuid
+    from datetime import timedelta
+    from pathlib import Path
+
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "project"))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project.settings")
+
+    import django
+
+    django.setup()
+
+    from django.utils import timezone
+    from oauth2_provider.models import AccessToken, Application
+
+    from core.models.user import User
+
+    user, _ = User.objects.get_or_create(
+        email="bench-asgi@example.com",
+        defaults={"first_name": "Bench", "last_name": "Asgi", "is_staff": True},
+    )
+    application, _ = Application.objects.get_or_create(
+        name="bench-asgi",
+        defaults={
+            "client_type": Application.CLIENT_CONFIDENTIAL,
+            "authorization_grant_type": Application.GRANT_PASSWORD,
+        },
+    )
+    token = AccessToken.objects.create(
+        user=user,
+        application=application,
+        token=uuid.uuid4().hex,
+        expires=timezone.now() + timedelta(days=1),
+        scope="read write",
+    )
+    print(f"USER_ID={user.id}")
+    print(f"TOKEN={token.token}")
+
+
+def run(base_url: str, path: str, token: str, requests: int, concurrency: int):
+    """Executa `requests` GETs com `concurrency` threads; retorna (req/s, ms)."""
+    headers = {"Authorization": f"Bearer {token}"}
+
+    def fetch(_):
+        request = urllib.request.Request(base_url + path, headers=headers)
+        start = time.perf_counter()
+        with urllib.request.urlopen(request) as response:
+            response.read()
+            assert response.status == 200, response.status
+        return (time.perf_counter() - start) * 1000
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(fetch, range(concurrency)))  # aquecimento
+        start = time.perf_counter()
+        durations = list(executor.map(fetch, range(requests)))
+        elapsed = time.perf_counter() - start
+    return requests / elapsed, durations
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--setup":
+        setup()
+        return
+    if len(sys.argv) < 3:
+        sys.exit(__doc__)
+
+    user_id, token = sys.argv[1], sys.argv[2]
+    requests = int(sys.argv[3]) if len(sys.argv) > 3 else 2000
+    concurrency = int(sys.argv[4]) if len(sys.argv) > 4 else 64
+    path = f"/v1/users/{user_id}/"
+
+    print(f"Requisições: {requests}, concorrência: {concurrency}")
+    for label, base_url in SERVERS.items():
+        throughput, durations = run(base_url, path, token, requests, concurrency)
+        print(
+            f"{label:<30} {throughput:8.1f} req/s "
+            f"p50={percentile(durations, 50):8.3f}ms "
+            f"p99={percentile(durations, 99):8.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Benchmark da serialização + renderização de listagens de usuários.
+
+Mede o custo de transformar um `ListUsersResponse` de N linhas (1000 por
+padrão) em bytes, separando as duas etapas que mudaram:
+
+- montagem dos itens: `UserSerializer(user).data` por linha (caminho antigo)
+  versus `user_to_dict` (dicts simples);
+- renderização: `JSONRenderer` do DRF (``json`` da stdlib) versus
+  `ORJSONRenderer`.
+
+Não toca no banco: os DTOs são montados em memória.
+
+Uso:
+    python scripts/benchmarks/bench_json_rendering.py [linhas]
+"""
+
+import sys
+import uuid
+
+from common import setup_django, summarize, timeit
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    setup_django()
+
+    from rest_framework.renderers import JSONRenderer
+
+    from core.api.renderers import ORJSONRenderer
+    from core.api.v1.serializers.user import (
+        UserListResponseSerializer,
+        UserSerializer,
+    )
+    from core.domain.data_access import ItemCount
+    from core.domain.use_cases.user_use_cases import (
+        CreateUserResponse,
+        ListUsersResponse,
+    )
+
+    response = ListUsersResponse(
+        users=[
+            CreateUserResponse(
+                id=str(uuid.uuid4()),
+                email=f"bench{i}@example.com",
+                first_name="Bench",
+                last_name=f"User {i}",
+                is_active=True,
+                is_staff=False,
+                is_superuser=False,
+            )
+            for i in range(rows)
+        ],
+        total_items=ItemCount(rows, exact=True),
+        offset=0,
+        limit=rows,
+    )
+
+    def serializer_per_row():
+        # Caminho antigo: um UserSerializer instanciado por linha
+        return {
+            "items": [UserSerializer(user).data for user in response.users],
+            "total_items": response.total_items,
+            "offset": response.offset,
+            "limit": response.limit,
+            "next_cursor": response.next_cursor,
+            "total_items_exact": response.total_items_exact,
+        }
+
+    def plain_dicts():
+        return UserListResponseSerializer(response).data
+
+    old_data, new_data = serializer_per_row(), plain_dicts()
+    stdlib, fast = JSONRenderer(), ORJSONRenderer()
+    assert stdlib.render(old_data) == stdlib.render(new_data)
+
+    print(f"Linhas: {rows}")
+    variants = (
+        ("itens: serializer por linha", serializer_per_row),
+        ("itens: dicts simples", plain_dicts),
+        ("render: JSONRenderer (stdlib)", lambda: stdlib.render(new_data)),
+        ("render: ORJSONRenderer", lambda: fast.render(new_data)),
+        ("total antigo", lambda: stdlib.render(serializer_per_row())),
+        ("total novo", lambda: fast.render(plain_dicts())),
+    )
+    for label, func in variants:
+        summarize(label, timeit(func, repeat=50))
+
+
+if __name__ == "__main__":
+    main()
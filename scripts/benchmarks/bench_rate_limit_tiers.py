@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Benchmark do nível local do `RateLimitThrottle`.
+
+Conta as operações no cache compartilhado por requisição com o nível local
+desligado (``local_batch=0``) e ligado, simulando vários clientes abaixo do
+limite. Também mede o tempo por decisão com o cache local do Django; com
+Redis a diferença é dominada pela latência de rede evitada.
+
+Uso:
+    python scripts/benchmarks/bench_rate_limit_tiers.py [requisicoes] [lote]
+"""
+
+import sys
+from collections import Counter
+from types import SimpleNamespace
+
+from common import setup_django, timeit
+
+
+class CountingCache:
+    """Proxy do cache que conta chamadas por método."""
+
+    def __init__(self, backend):
+        self._backend = backend
+        self.calls = Counter()
+
+    def __getattr__(self, name):
+        attr = getattr(self._backend, name)
+        if callable(attr):
+
+            def wrapper(*args, **kwargs):
+                self.calls[name] += 1
+                return attr(*args, **kwargs)
+
+            return wrapper
+        return attr
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    setup_django()
+
+    from django.core.cache import cache
+
+    from core.api import throttles
+
+    view = None
+    clients = [
+        SimpleNamespace(is_authenticated=True, is_superuser=False, id=f"client-{i}")
+        for i in range(50)
+    ]
+
+    print(f"Requisições: {requests}  clientes: {len(clients)}")
+    for label, local_batch in (("somente cache", 0), (f"local (lote={batch})", batch)):
+        counting = CountingCache(cache)
+        throttles.cache = counting
+        cache.clear()
+        throttles._local_buckets.clear()
+
+        def decide():
+            for i in range(requests):
+                throttle = throttles.RateLimitThrottle()
+                throttle.num_requests = 1_000_000
+                throttle.local_batch = local_batch
+                request = SimpleNamespace(user=clients[i % len(clients)])
+                throttle.allow_request(request, view)
+
+        (total_ms,) = timeit(decide, repeat=1)
+        ops = sum(counting.calls.values())
+        print(
+            f"{label:<24} {total_ms / requests * 1000:8.2f}µs/decisão  "
+            f"ops no cache={ops} ({ops / requests:.3f}/requisição) "
+            f"{dict(counting.calls)}"
+        )
+        throttles.cache = cache
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Benchmark da projeção de colunas nos caminhos de leitura do repositório.
+
+Compara a materialização de modelos completos (`DjangoUser` com `password`,
+`last_login` etc.) com a projeção via `values_list` usada por
+`DjangoUserRepository`, medindo alocação por linha (tracemalloc) e tempo.
+
+Uso:
+    python scripts/benchmarks/bench_user_repository_projection.py [linhas]
+"""
+
+import sys
+import tracemalloc
+
+from common import create_users, setup_django, summarize, timeit
+
+
+def measure_allocation(func):
+    """Retorna o pico de memória alocada (bytes) durante `func`."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    setup_django()
+
+    from core.models.user import User as DjangoUser
+    from core.repositories.user_repository_impl import DjangoUserRepository
+
+    create_users(rows)
+    repository = DjangoUserRepository()
+
+    def full_models():
+        # Caminho antigo: instancia o modelo completo e converte
+        return [
+            repository._to_domain_user(user)
+            for user in DjangoUser.objects.exclude(is_superuser=True)
+        ]
+
+    def projected():
+        return repository.get_all()
+
+    assert len(full_models()) == len(projected()) == rows
+
+    print(f"Linhas: {rows}")
+    for label, func in (("modelo completo", full_models), ("values_list", projected)):
+        peak = measure_allocation(func)
+        summarize(label, timeit(func, repeat=10))
+        print(f"{'':<40} pico={peak / 1024:10.1f}KiB  por linha={peak / rows:8.1f}B")
+
+
+if __name__ == "__main__":
+    main()
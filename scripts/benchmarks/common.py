@@ -0,0 +1,76 @@
+"""Utilitários compartilhados pelos benchmarks em `scripts/benchmarks/`.
+
+Os benchmarks rodam contra `project.settings_test` (SQLite em memória) para
+serem reproduzíveis sem infraestrutura externa. Números absolutos não
+representam produção; o que interessa é a comparação entre variantes.
+"""
+
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+def setup_django(settings_module: str = "project.settings_test"):
+    """Configura o Django, cria o schema e silencia logs/coleta de queries."""
+    project_dir = Path(__file__).resolve().parent.parent.parent / "project"
+    sys.path.insert(0, str(project_dir))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+
+    import django
+    from django.conf import settings
+    from django.core.management import call_command
+
+    django.setup()
+    logging.disable(logging.CRITICAL)
+    call_command("migrate", run_syncdb=True, verbosity=0)
+    # DEBUG=True faz o Django guardar cada query em memória
+    settings.DEBUG = False
+
+
+def create_users(count: int, prefix: str = "bench"):
+    """Cria `count` usuários comuns com `bulk_create` (senha inutilizável)."""
+    from django.contrib.auth.hashers import make_password
+    from core.models.user import User
+
+    password = make_password(None)
+    User.objects.bulk_create(
+        [
+            User(
+                email=f"{prefix}{i}@example.com",
+                first_name="Bench",
+                last_name="User",
+                password=password,
+            )
+            for i in range(count)
+        ],
+        batch_size=1000,
+    )
+
+
+def timeit(func, repeat: int = 20):
+    """Executa `func` `repeat` vezes e retorna as durações em milissegundos."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def percentile(values, pct: float) -> float:
+    """Percentil simples (nearest-rank) de uma lista de valores."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(label: str, durations) -> None:
+    """Imprime p50/p99/média de uma série de durações em ms."""
+    print(
+        f"{label:<40} p50={percentile(durations, 50):8.3f}ms "
+        f"p99={percentile(durations, 99):8.3f}ms "
+        f"mean={statistics.mean(durations):8.3f}ms"
+    )
@@ -47,21 +47,42 @@ DATABASE_URL=
 # DB_PASSWORD=postgres
 # DB_HOST=project_db
 # DB_PORT=5432
+# Persistent connections (seconds) or psycopg 3 native pooling:
+# DB_CONN_MAX_AGE=60
+# DB_CONN_HEALTH_CHECKS=True
+# DB_POOL_ENABLED=False
+# DB_POOL_MIN_SIZE=2
+# DB_POOL_MAX_SIZE=10
+# DB_POOL_TIMEOUT=10
 
 # Redis Configuration (optional)
-REDIS_URL=redis://localhost:6379/0
+# Enables the shared Redis cache; leave commented to use the per-process cache
+# REDIS_URL=redis://localhost:6379/0
 
 # OAuth2 Configuration
 OAUTH2_CLIENT_ID={oauth_client_id}
 OAUTH2_SCOPES=read write
 OAUTH2_ACCESS_TOKEN_EXPIRE_SECONDS=86400
 OAUTH2_REFRESH_TOKEN_EXPIRE_SECONDS=2592000
+# Signed (stateless) access tokens for these client_ids; keys as kid=secret,kid2=secret2
+# OAUTH2_SIGNED_TOKEN_APPLICATIONS=
+# OAUTH2_SIGNED_TOKEN_KEYS=
+# OAUTH2_SIGNED_TOKEN_ACTIVE_KEY=
+# Cache of validated access tokens (seconds; defaults to 60 with REDIS_URL, 0 disables)
+# OAUTH2_TOKEN_CACHE_TTL=60
+# Batched purge of expired tokens (manage.py purge_expired_tokens)
+TOKEN_PURGE_BATCH_SIZE=1000
+TOKEN_PURGE_BATCH_SLEEP=0.1
 
 # Django REST Framework
 DRF_PAGE_SIZE=50
+# Async views for ASGI deployments (gunicorn + uvicorn workers)
+API_ASYNC_VIEWS=False
 
 # Logging
 LOG_LEVEL=INFO
+# Fraction of requests timed (Server-Timing header + "Request timing" log event)
+REQUEST_TIMING_SAMPLE_RATE=0.0
 
 # Email Configuration (optional)
 EMAIL_BACKEND=django.core.mail.backends.console.EmailBackend